@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+⏱️ Wiki Engine Benchmark Suite
+Synthetic wikis from 100 to 50k pages, timed and memory-profiled into JSON
+
+Usage:
+    python benchmark_suite.py                       # 100, 1k, 10k and 50k pages
+    python benchmark_suite.py --sizes 100 1000 -o bench.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.wiki_parser import WikiParser
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 50_000]
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+# Pages timed one by one with parse_markdown_to_card (the rest of the wiki is not needed for a stable mean)
+PARSE_SAMPLE_LIMIT = 2_000
+
+# Bump when the JSON layout changes so trackers can tell runs apart
+RESULTS_FORMAT_VERSION = 1
+
+# Vocabulary for the synthetic pages - includes the words content-type detection looks for
+TOPICS = ["Account", "Member", "Permission", "User", "Profile", "Billing", "Invoice", "Roadmap", "Onboarding",
+          "Registration", "Team", "Project", "Report", "Webhook", "Integration", "Settings", "Audit", "Export"]
+WORDS = ("account management user profile registration permission role admin owner manager staff invite "
+         "member team project dashboard feature api endpoint request response token session billing invoice "
+         "plan upgrade report export import webhook event queue worker cache index search sync release "
+         "deploy review test document guide setup install configure enable disable create update delete "
+         "the a an of to and for with on in by from is are can will should must when each every new").split()
+ROLES = ["Owner", "Admin", "Manager", "Staff", "Guest"]
+LANGUAGES = ["python", "bash", "json", "php", ""]
+
+# Share of pages that are a lightly edited copy of an earlier page, and of very large pages
+DUPLICATE_RATIO = 0.02
+LARGE_PAGE_RATIO = 0.01
+
+
+def generate_synthetic_wiki(wiki_dir: str, pages: int, seed: int = 42) -> Dict:
+    """
+    🏗️ Write a deterministic synthetic wiki
+
+    Pages mix front matter, headings, paragraphs, bullet and numbered
+    lists, code blocks, permission matrices and plain tables, with internal
+    links between pages (some of them broken) and a few external links.
+    About 1 page in 10 sits in a subdirectory, DUPLICATE_RATIO of pages are
+    near-copies and LARGE_PAGE_RATIO are 50-100x bigger than usual.
+
+    Returns:
+        Dict with "pages", "bytes" and "seconds"
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    root = Path(wiki_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    names = [_page_name(rng, number) for number in range(pages)]
+    written = []
+    total_bytes = 0
+
+    for number, name in enumerate(names):
+        if written and rng.random() < DUPLICATE_RATIO:
+            text = rng.choice(written).replace("\n\n", f"\n\nRevision {number} notes.\n\n", 1)
+        else:
+            sections = rng.randint(3, 7) * (rng.randint(50, 100) if rng.random() < LARGE_PAGE_RATIO else 1)
+            text = _page_text(rng, name, names, sections)
+            if len(written) < 200:
+                written.append(text)
+
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        total_bytes += len(data)
+
+    return {"pages": pages, "bytes": total_bytes, "seconds": time.perf_counter() - start}
+
+
+def run_benchmark(pages: int, workers: Optional[int] = None, measure_memory: bool = True,
+                  seed: int = 42, work_dir: Optional[str] = None) -> Dict:
+    """
+    🏁 Generate one wiki and time the parser and feed hot paths on it
+
+    Every stage is timed without tracing first; with measure_memory the
+    stage is then repeated under tracemalloc for its peak Python heap.
+    """
+    base_dir = tempfile.mkdtemp(prefix=f"wiki_bench_{pages}_", dir=work_dir)
+    wiki_dir = os.path.join(base_dir, "wiki")
+    cache_dir = os.path.join(base_dir, "cache")
+
+    try:
+        result = {"pages": pages, "workers": workers}
+        result["generate_wiki"] = generate_synthetic_wiki(wiki_dir, pages, seed)
+
+        # parse_markdown_to_card, page by page, on an evenly spread sample (no parse cache)
+        parser = WikiParser(wiki_dir, cache_dir=None)
+        filenames = parser.list_wiki_pages()
+        sample = filenames[::max(1, len(filenames) // PARSE_SAMPLE_LIMIT)][:PARSE_SAMPLE_LIMIT]
+
+        def parse_sample():
+            for filename in sample:
+                parser.parse_markdown_to_card(filename)
+
+        gc.collect()
+        timings = []
+        for filename in sample:
+            start = time.perf_counter()
+            parser.parse_markdown_to_card(filename)
+            timings.append(time.perf_counter() - start)
+        stats = _distribution(timings)
+        stats["peak_memory_bytes"] = _traced_peak(parse_sample, measure_memory)
+        result["parse_markdown_to_card"] = stats
+
+        # generate_activity_timeline: cold (empty parse cache), then warm (a restart on a filled cache)
+        def build_feed() -> Tuple[FeedGenerator, float]:
+            feed = FeedGenerator(WikiParser(wiki_dir, cache_dir=cache_dir), workers=workers)
+            gc.collect()
+            start = time.perf_counter()
+            feed.generate_activity_timeline()
+            return feed, time.perf_counter() - start
+
+        feed_gen, cold_seconds = build_feed()
+        timeline = feed_gen.generate_activity_timeline()
+        _, warm_seconds = build_feed()
+        result["generate_activity_timeline"] = {
+            "cold_seconds": cold_seconds,
+            "warm_seconds": warm_seconds,
+            "cards": len(timeline),
+            # Cold builds parse in worker processes, which tracemalloc cannot see - so the warm build is traced
+            "warm_peak_memory_bytes": _traced_peak(build_feed, measure_memory),
+        }
+
+        # Ranking and header stats on the built feed
+        result["sort_by_priority_and_recency"] = _timed_with_memory(
+            lambda: feed_gen.sort_by_priority_and_recency(timeline), measure_memory)
+        result["create_stats_summary"] = _timed_with_memory(feed_gen.create_stats_summary, measure_memory)
+
+        result["max_rss_bytes"] = _max_rss()
+        return result
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+
+
+def run_suite(sizes: List[int], output: Optional[str] = DEFAULT_OUTPUT, **options) -> Dict:
+    """
+    📊 Benchmark every wiki size and write the combined JSON report
+    """
+    report = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [],
+    }
+
+    for pages in sizes:
+        print(f"⏱️ Benchmarking {pages:,} pages...")
+        result = run_benchmark(pages, **options)
+        report["results"].append(result)
+        _print_result(result)
+
+        # Written after every size so a long run still leaves partial results
+        if output:
+            _write_report(report, output)
+
+    return report
+
+
+# Helpers for the benchmark suite
+
+def _page_name(rng: random.Random, number: int) -> str:
+    name = f"{rng.choice(TOPICS)}-{rng.choice(TOPICS)}-{number}.md"
+    if rng.random() < 0.1:
+        return f"{rng.choice(TOPICS).lower()}/{name}"
+    return name
+
+
+def _sentence(rng: random.Random, low: int = 8, high: int = 20) -> str:
+    words = rng.choices(WORDS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+
+def _page_text(rng: random.Random, name: str, names: List[str], sections: int) -> str:
+    title = Path(name).stem.rsplit("-", 1)[0].replace("-", " ")
+    lines = []
+
+    if rng.random() < 0.3:
+        lines += ["---", f"title: {title} Guide", f"author: {rng.choice(['Ana', 'Ben', 'Cy', 'Dana'])}",
+                  f"updated: 2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", "---"]
+
+    lines += [f"# {title}", "", " ".join(_sentence(rng) for _ in range(rng.randint(2, 4))), ""]
+
+    for section in range(sections):
+        lines += [f"## {rng.choice(TOPICS)} {rng.choice(WORDS).title()} {section + 1}", ""]
+        for _ in range(rng.randint(1, 3)):
+            paragraph = [_sentence(rng) for _ in range(rng.randint(2, 5))]
+            if rng.random() < 0.3:
+                target = rng.choice(names)[:-3] if rng.random() < 0.9 else f"Missing-Page-{rng.randint(0, 99)}"
+                paragraph.append(f"See [{target.rsplit('/', 1)[-1]}]({target}) for details.")
+            if rng.random() < 0.1:
+                paragraph.append("More at [the docs](https://docs.example.com/guide).")
+            lines += [" ".join(paragraph), ""]
+
+        block = rng.random()
+        if block < 0.25:
+            lines += [f"- {_sentence(rng, 3, 8)}" for _ in range(rng.randint(3, 8))] + [""]
+        elif block < 0.4:
+            lines += [f"{item}. {_sentence(rng, 3, 8)}" for item in range(1, rng.randint(3, 7))] + [""]
+        elif block < 0.55:
+            language = rng.choice(LANGUAGES)
+            lines += [f"```{language}"] + [f"{rng.choice(WORDS)}_{rng.choice(WORDS)} = {rng.randint(0, 999)}"
+                                           for _ in range(rng.randint(3, 12))] + ["```", ""]
+        elif block < 0.65:
+            roles = ROLES[:rng.randint(3, len(ROLES))]
+            lines += ["| **Permission/Role** | " + " | ".join(f"**{role}**" for role in roles) + " |",
+                      "|---" * (len(roles) + 1) + "|"]
+            for _ in range(rng.randint(3, 10)):
+                marks = " | ".join(rng.choice(["✅", "➖"]) for _ in roles)
+                lines.append(f"| {_sentence(rng, 3, 6)[:-1]} | {marks} |")
+            lines.append("")
+        elif block < 0.75:
+            lines += ["| Name | Value | Notes |", "|---|---|---|"]
+            lines += [f"| {rng.choice(WORDS)} | {rng.randint(0, 10_000)} | {_sentence(rng, 2, 6)} |"
+                      for _ in range(rng.randint(2, 6))] + [""]
+
+    return "\n".join(lines) + "\n"
+
+
+def _traced_peak(function: Callable, measure_memory: bool) -> Optional[int]:
+    """
+    📈 Peak Python heap growth while the function runs (None when memory is not measured)
+    """
+    if not measure_memory:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def _timed_with_memory(function: Callable, measure_memory: bool, repeats: int = 5) -> Dict:
+    seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    stats = _distribution(seconds)
+    stats["peak_memory_bytes"] = _traced_peak(function, measure_memory)
+    return stats
+
+
+def _distribution(seconds: List[float]) -> Dict:
+    if not seconds:
+        return {"count": 0}
+    ordered = sorted(seconds)
+    return {
+        "count": len(ordered),
+        "total_seconds": sum(ordered),
+        "mean_seconds": statistics.fmean(ordered),
+        "p50_seconds": ordered[len(ordered) // 2],
+        "p95_seconds": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max_seconds": ordered[-1],
+    }
+
+
+def _max_rss() -> Optional[int]:
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def _write_report(report: Dict, output: str) -> None:
+    path = Path(output)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(report, indent=2) + "\n")
+    os.replace(temporary, path)
+
+
+def _print_result(result: Dict) -> None:
+    parse = result["parse_markdown_to_card"]
+    timeline = result["generate_activity_timeline"]
+    megabytes = result["generate_wiki"]["bytes"] / 1e6
+    print(f"   📄 {result['pages']:,} pages, {megabytes:.1f}MB")
+    print(f"   🔍 parse_markdown_to_card: {parse['mean_seconds'] * 1000:.2f}ms/page (p95 "
+          f"{parse['p95_seconds'] * 1000:.2f}ms)")
+    print(f"   📅 generate_activity_timeline: {timeline['cold_seconds']:.2f}s cold, "
+          f"{timeline['warm_seconds']:.2f}s warm, {timeline['cards']:,} cards")
+    print(f"   🎯 sort_by_priority_and_recency: {result['sort_by_priority_and_recency']['mean_seconds'] * 1000:.1f}ms")
+    print(f"   📊 create_stats_summary: {result['create_stats_summary']['mean_seconds'] * 1000:.1f}ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = argparse.ArgumentParser(description="Benchmark the wiki engine on synthetic wikis")
+    arguments.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Wiki sizes in pages")
+    arguments.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    arguments.add_argument("--workers", type=int, default=None, help="Parse worker processes (default: auto)")
+    arguments.add_argument("--seed", type=int, default=42, help="Synthetic wiki random seed")
+    arguments.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc passes")
+    arguments.add_argument("--work-dir", default=None, help="Where to generate the temporary wikis")
+    options = arguments.parse_args(argv)
+
+    print("🚀 Wiki engine benchmark suite - Monday Madness performance check!")
+    print("=" * 60)
+    run_suite(options.sizes, options.output, workers=options.workers, measure_memory=not options.no_memory,
+              seed=options.seed, work_dir=options.work_dir)
+    print(f"✅ Results written to {options.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent))
 
 from wiki_engine import WikiParser, GitSyncEngine, FeedGenerator
+from wiki_engine.git_sync import SyncInbox
 from wiki_engine.card_components import WikiCard, RoadmapCard, StatsCard, TimelineRoadmap, render_dashboard_header
 
 def load_custom_css():
@@ -28,6 +29,15 @@ def load_custom_css():
     else:
         st.warning("⚠️ CSS file not found - dashboard will use default styling")
 
+@st.cache_resource
+def shared_git_sync(wiki_repo_path: str) -> GitSyncEngine:
+    """
+    🔄 One sync engine (and one auto-sync thread) per process, shared by every session
+    """
+    git_sync = GitSyncEngine(wiki_repo_path)
+    git_sync.setup_auto_sync(interval_minutes=30)
+    return git_sync
+
 def initialize_wiki_engine():
     """
     🔧 Initialize with embedded real wiki content for Streamlit Cloud
@@ -44,7 +54,9 @@ def initialize_wiki_engine():
             st.session_state.wiki_parser = WikiParser("clients-hub-wiki")
         
         if 'git_sync' not in st.session_state:
-            st.session_state.git_sync = GitSyncEngine("clients-hub-wiki")
+            st.session_state.git_sync = shared_git_sync("clients-hub-wiki")
+            # Background pulls land in this session's inbox; it unsubscribes when the session ends
+            st.session_state.sync_inbox = SyncInbox(st.session_state.git_sync)
         
         if 'feed_generator' not in st.session_state:
             st.session_state.feed_generator = FeedGenerator(st.session_state.wiki_parser)
@@ -217,26 +229,48 @@ def sync_wiki_updates(git_sync):
     """
     🔄 Check for and pull wiki updates
     """
+    # Real engines pull on their scheduler thread; apply_synced_changes shows the result
+    if hasattr(git_sync, 'request_sync'):
+        git_sync.request_sync()
+        return None
+    
     with st.spinner("🔄 Checking for wiki updates..."):
         sync_result = git_sync.pull_wiki_updates()
-        
-        if sync_result["status"] == "success":
-            if sync_result["changes_detected"]:
-                st.success(f"✅ Wiki updated! {len(sync_result['files_updated'])} files changed")
-                # Clear cache to reload fresh data
-                if 'feed_generator' in st.session_state:
-                    st.session_state.feed_generator.feed_cache.clear()
-            else:
-                st.info("📄 Wiki is up to date")
-        else:
-            st.error(f"❌ Sync failed: {sync_result.get('error', 'Unknown error')}")
+        show_sync_result(sync_result)
     
     return sync_result
 
+def apply_synced_changes():
+    """
+    📬 Apply the change sets background syncs delivered since the last render
+    """
+    sync_inbox = st.session_state.get('sync_inbox')
+    if sync_inbox is None:
+        return
+    for sync_result in sync_inbox.drain():
+        show_sync_result(sync_result)
+
+def show_sync_result(sync_result):
+    """
+    📣 Report one sync and re-parse the pages it touched
+    """
+    if sync_result["status"] == "success":
+        if sync_result["changes_detected"]:
+            st.success(f"✅ Wiki updated! {len(sync_result['files_updated'])} files changed")
+            # Re-parse only the pages this sync touched
+            if 'feed_generator' in st.session_state:
+                st.session_state.feed_generator.apply_file_changes(sync_result['files_updated'])
+        else:
+            st.info("📄 Wiki is up to date")
+    else:
+        st.error(f"❌ Sync failed: {sync_result.get('error', 'Unknown error')}")
+
 def render_dashboard_header_section(feed_generator):
     """
     🔝 Render the beautiful dashboard header with roadmap and stats
     """
+    apply_synced_changes()
+    
     st.markdown("# SuperApp Documentation Dashboard")
     st.markdown("*Where wiki documentation becomes engaging and beautiful*")
     
@@ -292,9 +326,28 @@ def render_wiki_feed(feed_generator):
     st.markdown("## Documentation Feed")
     st.markdown("*Your team's wiki content, beautifully displayed*")
     
-    # Generate the timeline of cards
-    timeline = feed_generator.generate_activity_timeline()
-    
+    # Full-text search (the embedded demo feed has no index, so no box there)
+    query = ""
+    if hasattr(feed_generator, 'search'):
+        query = st.text_input("Search the wiki", key="wiki_search",
+                              placeholder='e.g. invite permissions or "account management"').strip()
+
+    if query:
+        # Only the matching cards are rendered, best match first
+        timeline = feed_generator.search(query, k=20)
+        if not timeline:
+            st.info(f"🔎 No wiki pages match \"{query}\"")
+            return
+        st.caption(f"🔎 {len(timeline)} best matches for \"{query}\"")
+    else:
+        # Generate the timeline of cards
+        timeline = feed_generator.generate_activity_timeline()
+        
+        # Copy-pasted pages (per-vertical plans, repeated onboarding) shown once
+        if hasattr(feed_generator, 'collapse_near_duplicates') and st.checkbox(
+                "Collapse near-duplicate pages", value=True, key="wiki_collapse_duplicates"):
+            timeline = feed_generator.collapse_near_duplicates(timeline)
+
     if not timeline:
         st.warning("📄 No wiki content found. Make sure the wiki repository is cloned and contains markdown files.")
         return
@@ -334,6 +387,19 @@ def render_sidebar():
         if hasattr(st.session_state, 'feed_generator'):
             cache_size = len(st.session_state.feed_generator.feed_cache)
             st.metric("Cached Cards", cache_size)
+            
+            # Link health straight from the kept link graph - no page crawl
+            if hasattr(st.session_state.feed_generator, 'link_report'):
+                report = st.session_state.feed_generator.link_report()
+                broken_count = sum(len(targets) for targets in report["broken_links"].values())
+                st.metric("Orphan Pages", len(report["orphans"]))
+                st.metric("Broken Links", broken_count)
+                if broken_count or report["orphans"]:
+                    with st.expander("Link Report"):
+                        for page, targets in report["broken_links"].items():
+                            st.markdown(f"**{page}** → {', '.join(f'`{target}`' for target in targets)}")
+                        if report["orphans"]:
+                            st.markdown("**Orphans:** " + ", ".join(report["orphans"]))
         
         st.markdown("---")
         
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the background auto-sync scheduler: intervals, backoff and subscribers
+Monday Madness Quality Assurance!
+"""
+
+import gc
+import queue
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from wiki_engine.git_sync import AUTO_SYNC_JITTER, AUTO_SYNC_MAX_BACKOFF, GitSyncEngine, SyncInbox, _repo_lock
+
+GIT_IDENTITY = ['-c', 'user.name=Wiki Bot', '-c', 'user.email=bot@example.com']
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(['git', *GIT_IDENTITY, *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def push_page(seed: Path, name: str, text: str) -> None:
+    (seed / name).write_text(text)
+    git(seed, 'add', '-A')
+    git(seed, 'commit', '-q', '-m', f'Update {name}')
+    git(seed, 'push', '-q', 'origin', 'HEAD')
+
+
+def test_auto_sync():
+    """
+    🚀 Syncs run off the caller's thread and every result reaches subscribers
+    """
+    print("🧪 Testing the auto-sync scheduler with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        root = Path(root_dir)
+        upstream, seed, wiki = root / "upstream.git", root / "seed", root / "wiki"
+        git(root, 'init', '-q', '--bare', str(upstream))
+        git(root, 'clone', '-q', str(upstream), str(seed))
+        push_page(seed, "Home.md", "# Home\nWelcome.\n")
+        git(root, 'clone', '-q', str(upstream), str(wiki))
+
+        engine = GitSyncEngine(str(wiki))
+        results = queue.Queue()
+        engine.subscribe(results.put)
+
+        # Long intervals no longer overflow the minute field
+        assert engine.setup_auto_sync(interval_minutes=90)
+        logged = engine.sync_history[-1]["next_sync"]
+        assert abs(logged - (datetime.now() + timedelta(minutes=90))) < timedelta(seconds=5)
+        assert engine.get_repo_status()["auto_sync_running"]
+
+        # A manual request returns at once, even while a pull is stuck behind the repo lock
+        push_page(seed, "Roadmap.md", "# Roadmap\nSelf-signup first.\n")
+        with _repo_lock(wiki):
+            start = time.perf_counter()
+            engine.request_sync()
+            request_time = time.perf_counter() - start
+            time.sleep(0.2)
+            assert results.empty()  # The scheduler is waiting, not the caller
+        result = results.get(timeout=10)
+        print(f"📨 request_sync returned in {request_time * 1000:.2f}ms, change set: {result['files_updated']}")
+        assert request_time < 0.05
+        assert result["status"] == "success" and result["files_updated"] == ["Roadmap.md"]
+        assert engine.next_sync > datetime.now() + timedelta(minutes=80)  # Back to the 90 minute wait
+
+        # A failing subscriber is logged and does not starve the others
+        def broken(result):
+            raise RuntimeError("subscriber exploded")
+
+        engine.unsubscribe(results.put)
+        engine.subscribe(broken)
+        engine.subscribe(results.put)
+        engine.request_sync()
+        assert results.get(timeout=10)["changes_detected"] is False
+        assert any(entry.get("type") == "subscriber_error" for entry in engine.sync_history)
+
+        # Sessions share the engine through inboxes that unsubscribe when they go away
+        engine.unsubscribe(broken)
+        session_a, session_b = SyncInbox(engine), SyncInbox(engine)
+        assert len(engine._subscribers) == 3
+        push_page(seed, "Shared.md", "# Shared\nSeen by every session.\n")
+        engine.request_sync()
+        assert results.get(timeout=10)["files_updated"] == ["Shared.md"]
+        for session in (session_a, session_b):
+            assert session.results.get(timeout=10)["files_updated"] == ["Shared.md"]
+            assert session.drain() == []  # Each result arrives once
+        del session_a  # An abandoned session's state is garbage collected
+        gc.collect()
+        session_b.close()
+        assert engine._subscribers == [results.put]
+
+        # Short intervals keep pulling on their own
+        engine.setup_auto_sync(interval_minutes=0.001)
+        engine.request_sync()  # Ends the 90 minute wait so the new interval applies
+        push_page(seed, "Team.md", "# Team\nHello.\n")
+        seen = set()
+        deadline = time.monotonic() + 10
+        while "Team.md" not in seen and time.monotonic() < deadline:
+            seen.update(results.get(timeout=10)["files_updated"])
+        assert "Team.md" in seen
+
+        engine.close()
+        assert not engine.get_repo_status()["auto_sync_running"] and engine.next_sync is None
+        while not results.empty():
+            results.get_nowait()
+        push_page(seed, "Later.md", "# Later\nNot pulled.\n")
+        time.sleep(0.3)
+        assert results.empty()
+
+        # Failures back off exponentially (with jitter) up to the cap
+        broken_engine = GitSyncEngine(str(root / "nowhere"))
+        failures = queue.Queue()
+        broken_engine.subscribe(failures.put)
+        broken_engine.setup_auto_sync(interval_minutes=0.0005)
+        for _ in range(3):
+            assert failures.get(timeout=10)["status"] == "error"
+        broken_engine.stop_auto_sync()
+        assert broken_engine.consecutive_failures >= 3
+        for failures_so_far in range(6):
+            broken_engine.consecutive_failures = failures_so_far
+            broken_engine._sync_interval = 60
+            delay = broken_engine._next_delay()
+            expected = 60 * min(2 ** failures_so_far, AUTO_SYNC_MAX_BACKOFF)
+            assert expected * (1 - AUTO_SYNC_JITTER) <= delay <= expected * (1 + AUTO_SYNC_JITTER)
+        assert broken_engine.setup_auto_sync(interval_minutes=0) is False
+        broken_engine.close()
+
+    print("✅ Auto-sync scheduler test passed!")
+
+
+if __name__ == "__main__":
+    test_auto_sync()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the synthetic wiki generator and the benchmark report layout
+Monday Madness Quality Assurance!
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from benchmark_suite import generate_synthetic_wiki, run_suite
+from wiki_engine.wiki_parser import WikiParser
+
+
+def test_benchmark_suite():
+    """
+    🚀 Synthetic wikis are deterministic and realistic, reports are plain JSON
+    """
+    print("🧪 Testing the benchmark suite with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+        generated = generate_synthetic_wiki(first_dir, 60, seed=7)
+        generate_synthetic_wiki(second_dir, 60, seed=7)
+        pages = sorted(str(path.relative_to(first_dir)) for path in Path(first_dir).rglob("*.md"))
+        assert len(pages) == generated["pages"] == 60
+        assert all((Path(first_dir) / page).read_bytes() == (Path(second_dir) / page).read_bytes() for page in pages)
+
+        # The mix exercises tables, code, lists and links like a real wiki
+        parser = WikiParser(first_dir, cache_dir=None)
+        metadata = [parser.parse_markdown_to_card(page)["metadata"] for page in pages]
+        print(f"📄 {generated['bytes']:,} bytes, {sum(m['table_count'] > 0 for m in metadata)} pages with tables")
+        assert any(m["tables"] for m in metadata) and any(m["code_blocks"] for m in metadata)
+        assert any(m["internal_links"] for m in metadata) and any(m["front_matter"] for m in metadata)
+        assert any(m["content_type"] == "permissions_matrix" for m in metadata)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        output = Path(out_dir) / "bench.json"
+        run_suite([40], str(output), workers=1, measure_memory=True)
+        report = json.loads(output.read_text())
+        result = report["results"][0]
+        print(f"📊 Stages: {sorted(result)}")
+        assert report["format_version"] == 1 and result["pages"] == 40
+        assert result["parse_markdown_to_card"]["count"] == 40
+        assert result["generate_activity_timeline"]["cards"] > 0
+        for stage in ("parse_markdown_to_card", "sort_by_priority_and_recency", "create_stats_summary"):
+            assert result[stage]["mean_seconds"] >= 0 and result[stage]["peak_memory_bytes"] > 0
+
+    print("✅ Benchmark suite test passed!")
+
+
+if __name__ == "__main__":
+    test_benchmark_suite()
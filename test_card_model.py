@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the slotted FeedCard model and its dict-compatible view
+Monday Madness Quality Assurance!
+"""
+
+import pickle
+import tempfile
+from pathlib import Path
+
+from wiki_engine.card_model import CARD_KEYS, FeedCard
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.wiki_parser import WikiParser
+
+
+PAGE = """# {title}
+
+Admins manage user accounts and permissions for the whole team.
+
+- Invite members to the workspace
+- Remove inactive members
+"""
+
+
+def test_card_model():
+    """
+    🚀 Feed cards are FeedCards that still read like the old dicts
+    """
+    print("🧪 Testing FeedCard with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        for name in ("Team-Setup", "Team-Roles"):
+            (Path(wiki_dir) / f"{name}.md").write_text(PAGE.format(title=name.replace("-", " ")))
+
+        feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=None))
+        first, second = (feed_gen.create_wiki_card(f"{name}.md") for name in ("Team-Setup", "Team-Roles"))
+
+        assert isinstance(first, FeedCard)
+        assert not hasattr(first, "__dict__")
+        print(f"🃏 {first!r}: {first['icon']} {first['style_class']}")
+
+        # Dict-style access, including the derived fields
+        assert list(first) == list(CARD_KEYS) and len(first) == len(CARD_KEYS)
+        assert first["expandable"] is True and first.get("expanded") is False
+        assert first["content_stats"]["read_time"] == f"{first['metrics']['estimated_read_time']} min read"
+        assert first["monday_madness_level"] == first["metrics"]["engagement_potential"]
+        assert first["features"] == ["Invite members to the workspace", "Remove inactive members"]
+        assert "icon" in first and "missing" not in first and first.get("missing", "x") == "x"
+        assert dict(first) == first.to_dict() and first == first.to_dict()
+
+        # Repeated strings and action lists are shared between cards
+        assert first.type is second.type and first.style_class is second.style_class
+        assert first.actions is second.actions
+
+        # Stored fields can be updated, derived ones cannot
+        first["priority"] = "low"
+        assert first.priority == "low"
+        try:
+            first["content_stats"] = {}
+            assert False, "derived fields are read-only"
+        except KeyError:
+            pass
+
+        restored = pickle.loads(pickle.dumps(second))
+        assert restored == second and restored.type is second.type
+
+        # Sorting works on FeedCards and plain dicts alike
+        plain = dict(second, id="plain", engagement_score=0, priority="low")
+        ordered = feed_gen.sort_by_priority_and_recency([plain, second])
+        assert [card["id"] for card in ordered] == [second["id"], "plain"]
+
+    print("✅ FeedCard test passed!")
+
+
+if __name__ == "__main__":
+    test_card_model()
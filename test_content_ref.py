@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+🧪 Test lazy card bodies - cards carry a ContentRef, not the page text
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.content_ref import ContentRef, load_card_content
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.wiki_parser import WikiParser
+
+
+def test_content_ref():
+    """
+    🚀 Parsed and dashboard cards hold a reference that reads the page on demand
+    """
+    print("🧪 Testing ContentRef with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        page = Path(wiki_dir) / "Guide.md"
+        page.write_bytes(b"# Guide\r\n\r\nFirst line.\r\nSecond line.\r\nThird line.\r\nFourth line.\r\n")
+
+        parser = WikiParser(wiki_dir, cache_dir=cache_dir)
+        card = parser.parse_markdown_to_card("Guide.md")
+        assert "content" not in card
+        assert card["content_ref"] == ContentRef(str(page))
+        assert card["preview_lines"] == ["First line.", "Second line.", "Third line."]
+
+        body = load_card_content(card)
+        print(f"📄 Loaded body: {body!r}")
+        assert body == "# Guide\n\nFirst line.\nSecond line.\nThird line.\nFourth line.\n"
+
+        # Ranges read just that slice of the file
+        assert ContentRef(str(page), 2, 7).read() == "Guide"
+
+        generator = FeedGenerator(parser)
+        dashboard_card = generator.create_wiki_card("Guide.md")
+        assert dashboard_card["content_preview"] == "First line.\nSecond line.\nThird line."
+        assert load_card_content(dashboard_card) == body
+
+        # Cards that still carry inline text keep working, missing pages read as empty
+        assert load_card_content({"content": "inline"}) == "inline"
+        page.unlink()
+        assert load_card_content(dashboard_card) == ""
+
+    print("✅ ContentRef test passed!")
+
+
+if __name__ == "__main__":
+    test_content_ref()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+🧪 Test section-level change detection for the activity feed
+Monday Madness Quality Assurance!
+"""
+
+from wiki_engine.wiki_parser import WikiParser
+
+
+OLD_PAGE = """Welcome to the team space.
+
+# Team Guide
+
+## Permissions
+| Role | Edit |
+| Admin | Yes |
+
+## Setup
+Clone the repo.
+Run the installer.
+
+```
+# not a heading - stays inside Setup
+```
+
+## Example
+First example.
+
+## Example
+Second example.
+"""
+
+NEW_PAGE = """Welcome to the team space.
+
+# Team Guide
+
+## Permissions
+| Role | Edit |
+| Admin | Yes |
+| Member | No |
+
+## Example
+First example.
+
+## Example
+Second example, now longer.
+Another line.
+
+## Billing
+Invoices are monthly.
+"""
+
+
+def test_detect_changes():
+    """
+    🚀 Added, removed and edited sections are reported with line counts
+    """
+    print("🧪 Testing detect_changes with Monday Madness energy!")
+    print("=" * 60)
+
+    parser = WikiParser("/nonexistent-wiki", cache_dir=None)
+
+    changes = parser.diff_sections(OLD_PAGE, NEW_PAGE)
+    for change in changes:
+        print(f"🔄 {change}")
+
+    # Page order: the removed Setup section stays where it was, between Permissions and Example
+    assert changes == [
+        {"section": "Permissions", "change": "edited", "lines_added": 1, "lines_removed": 0},
+        {"section": "Setup", "change": "removed", "lines_added": 0, "lines_removed": 8},
+        {"section": "Example", "change": "edited", "lines_added": 3, "lines_removed": 1},
+        {"section": "Billing", "change": "added", "lines_added": 2, "lines_removed": 0},
+    ]
+
+    assert parser.detect_changes(OLD_PAGE, NEW_PAGE) == [
+        "Permissions section edited (+1/-0 lines)",
+        "Setup section removed (8 lines)",
+        "Example section edited (+3/-1 lines)",
+        "Billing section added (2 lines)",
+    ]
+
+    # Removed sections at the very start and end keep their places too
+    changes = parser.diff_sections("# A\na\n# B\nb\n# C\nc\n# D\nd\n", "# B\nb\n# C\nc2\n")
+    assert [(change["section"], change["change"]) for change in changes] == [
+        ("A", "removed"), ("C", "edited"), ("D", "removed")]
+
+    # Identical pages produce no activity at all
+    assert parser.detect_changes(OLD_PAGE, OLD_PAGE) == []
+    assert parser.detect_changes("", "Just one line") == ["Introduction section added (1 line)"]
+
+    print("✅ detect_changes test passed!")
+
+
+if __name__ == "__main__":
+    test_detect_changes()
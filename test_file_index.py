@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the recursive scandir-based wiki file index
+Monday Madness Quality Assurance!
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from wiki_engine.file_index import WikiFileIndex
+
+
+def _bump_mtime(path: Path, step: int) -> None:
+    # Filesystems with coarse timestamps could otherwise hide a change
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + step))
+
+
+def test_file_index():
+    """
+    🚀 Nested pages are found and later refreshes report only what changed
+    """
+    print("🧪 Testing WikiFileIndex with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        (wiki / "verticals" / "food").mkdir(parents=True)
+        (wiki / ".git").mkdir()
+        (wiki / "Home.md").write_text("# Home")
+        (wiki / "verticals" / "food" / "Menu.md").write_text("# Menu")
+        (wiki / ".git" / "HEAD.md").write_text("hidden")
+        (wiki / "logo.png").write_bytes(b"png")
+
+        index = WikiFileIndex(wiki_dir)
+        first = index.refresh()
+        print(f"📂 Initial pages: {sorted(index.pages)}")
+        assert sorted(first["added"]) == ["Home.md", "verticals/food/Menu.md"]
+
+        assert index.refresh() == {"added": [], "removed": [], "modified": []}
+        version = index.version
+
+        (wiki / "verticals" / "food" / "Menu.md").unlink()
+        (wiki / "verticals" / "spa").mkdir()
+        (wiki / "verticals" / "spa" / "Booking.md").write_text("# Booking")
+        _bump_mtime(wiki / "verticals" / "food", 1000)
+        _bump_mtime(wiki / "verticals", 1000)
+
+        changes = index.refresh()
+        print(f"🔄 Changes: {changes}")
+        assert changes["added"] == ["verticals/spa/Booking.md"]
+        assert changes["removed"] == ["verticals/food/Menu.md"]
+        assert sorted(index.changes_since(version)) == ["verticals/food/Menu.md", "verticals/spa/Booking.md"]
+
+        # An in-place edit leaves the directory mtime alone but is still picked up
+        version = index.version
+        root_mtime = wiki.stat().st_mtime_ns
+        (wiki / "Home.md").write_text("# Home\nNow with more content.")
+        _bump_mtime(wiki / "Home.md", 1000)
+        assert wiki.stat().st_mtime_ns == root_mtime
+        assert index.refresh() == {"added": [], "removed": [], "modified": ["Home.md"]}
+        assert index.changes_since(version) == ["Home.md"]
+
+    print("\n" + "=" * 60)
+    print("🎉 WikiFileIndex Test Complete! NO MORE GLOBBING! 🚀")
+
+
+if __name__ == "__main__":
+    test_file_index()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+🧪 Test YAML front matter: header-only reads and explicit card metadata
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from wiki_engine.content_ref import load_card_content
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.front_matter import _parse_simple_yaml, read_front_matter, split_front_matter
+from wiki_engine.wiki_parser import WikiParser
+
+HEADER = """---
+title: "Member Permissions"
+type: Permissions Matrix
+author: Dana
+priority: high
+updated: 2026-03-01
+tags: [roles, access]
+reviewers:
+  - Sam
+  - Alex
+draft: false
+---
+"""
+
+BODY = """# Account Member Permissions
+Admins can invite members, manage permissions and create accounts for every user.
+
+- Invite members by email
+- Manage roles and permissions
+"""
+
+
+def test_front_matter():
+    """
+    🚀 Front matter is read from the header alone and drives the card fields
+    """
+    print("🧪 Testing front matter with Monday Madness energy!")
+    print("=" * 60)
+
+    fields = _parse_simple_yaml(HEADER.strip('-\n'))
+    print(f"🧾 Fallback parser: {fields}")
+    assert fields == {"title": "Member Permissions", "type": "Permissions Matrix", "author": "Dana",
+                      "priority": "high", "updated": "2026-03-01", "tags": ["roles", "access"],
+                      "reviewers": ["Sam", "Alex"], "draft": False}
+
+    data = (HEADER + BODY).encode("utf-8")
+    front_matter, body_start = split_front_matter(data)
+    assert front_matter["author"] == "Dana" and data[body_start:].startswith(b"# Account")
+    assert split_front_matter(b"# No header\n---\n") == ({}, 0)
+    assert split_front_matter(b"---\nnever closed\n") == ({}, 0)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        page = wiki / "Permissions.md"
+        page.write_bytes(data)
+        assert read_front_matter(page) == (front_matter, body_start)
+
+        # A huge body costs nothing when only the header is wanted
+        big = wiki / "Big.md"
+        big.write_text("---\ntitle: Big\nupdated: 2025-01-01\n---\n" + "filler line\n" * 2_000_000)
+        start = time.perf_counter()
+        assert read_front_matter(big)[0] == {"title": "Big", "updated": "2025-01-01"}
+        assert time.perf_counter() - start < 0.05
+
+        (wiki / "Plain.md").write_text(BODY)
+        parser = WikiParser(wiki_dir, cache_dir=None)
+        listing = parser.list_front_matter(sort_by="updated", reverse=True)
+        print(f"📇 Listing: {[(name, fm.get('updated')) for name, fm in listing]}")
+        assert [name for name, _ in listing] == ["Permissions.md", "Big.md", "Plain.md"]
+
+        # Explicit metadata beats the heuristics, the body starts after the header
+        card = parser.parse_markdown_to_card("Permissions.md")
+        assert card["title"] == "Member Permissions"
+        assert card["type"] == "permissions_matrix"
+        assert card["timestamp"].date().isoformat() == "2026-03-01"
+        assert load_card_content(card) == BODY
+        assert card["metadata"]["sections"][0]["start"] == body_start
+
+        dashboard_card = FeedGenerator(parser).create_wiki_card("Permissions.md")
+        assert dashboard_card["author"] == "Dana" and dashboard_card["priority"] == "high"
+
+        # The streaming parser handles the header the same way
+        streamed = WikiParser(wiki_dir, cache_dir=None, stream_threshold=0).parse_markdown_to_card("Permissions.md")
+        assert streamed == card
+
+    print("✅ Front matter test passed!")
+
+
+if __name__ == "__main__":
+    test_front_matter()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the batched git history index behind card authors
+Monday Madness Quality Assurance!
+"""
+
+import os
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.git_history import GitHistoryIndex
+from wiki_engine.wiki_parser import WikiParser
+
+
+FEATURES = "\n- Invite members by email\n- Manage roles and permissions\n"
+
+
+def commit(repo: Path, author: str, when: int, files: dict, message: str = "Update wiki") -> None:
+    """
+    📝 Write files (None deletes) and commit them as the given author at a fixed time
+    """
+    for name, text in files.items():
+        if text is None:
+            (repo / name).unlink()
+        else:
+            (repo / name).write_text(text + FEATURES)
+    env = {**os.environ, "GIT_AUTHOR_DATE": f"{when} +0000", "GIT_COMMITTER_DATE": f"{when} +0000"}
+    subprocess.run(['git', 'add', '-A'], cwd=repo, check=True)
+    subprocess.run(['git', '-c', f'user.name={author}', '-c', f'user.email={author.lower()}@example.com',
+                    'commit', '-q', '-m', message], cwd=repo, check=True, env=env)
+
+
+def test_git_history():
+    """
+    🚀 One git log builds the index, later syncs only read the new commits
+    """
+    print("🧪 Testing GitHistoryIndex with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as repo_dir:
+        repo = Path(repo_dir)
+        subprocess.run(['git', 'init', '-q'], cwd=repo, check=True)
+        commit(repo, "Ana", 1_700_000_000, {"Home.md": "# Home\nWelcome aboard, the wiki lives here.\n",
+                                            "Guide.md": "# Guide\nHow we set up new accounts.\n"})
+        commit(repo, "Ben", 1_700_100_000, {"Guide.md": "# Guide\nHow we set up new accounts and roles.\n"})
+        commit(repo, "Cy", 1_700_200_000, {"Pinned.md": "---\nauthor: Dana\n---\n# Pinned\nOwned by Dana.\n"})
+
+        history = GitHistoryIndex(repo)
+        assert history.update() == {"Home.md", "Guide.md", "Pinned.md"}
+        guide = history.get("Guide.md")
+        print(f"📜 Guide.md: {guide['author']}, {guide['edits']} edits, first seen {guide['first_seen']}")
+        assert guide["author"] == "Ben" and guide["edits"] == 2
+        assert guide["first_seen"] == datetime.fromtimestamp(1_700_000_000)
+        assert guide["last_edited"] == datetime.fromtimestamp(1_700_100_000)
+        assert history.author("Home.md") == "Ana" and history.author("Nope.md", "nobody") == "nobody"
+        assert history.update() == set()  # Nothing new since the indexed head
+
+        feed_gen = FeedGenerator(WikiParser(repo_dir, cache_dir=None))
+        authors = {card["title"]: card["author"] for card in feed_gen.generate_activity_timeline()}
+        print(f"👤 Authors: {authors}")
+        assert authors["Guide"] == "Ben" and authors["Home"] == "Ana"
+        assert authors["Pinned"] == "Dana"  # Front matter still wins
+
+        # A sync brings new commits: only they are read, and the cards follow
+        commit(repo, "Eve", 1_700_300_000, {"Home.md": "# Home\nWelcome aboard, the wiki moved.\n", "Guide.md": None})
+        result = feed_gen.apply_file_changes(["Home.md", "Guide.md"])
+        assert result["removed"] == ["Guide.md"]
+        assert feed_gen.feed_cache["Home.md"]["author"] == "Eve"
+        home = feed_gen.page_history("Home.md")
+        assert home["edits"] == 2 and home["first_seen"] == datetime.fromtimestamp(1_700_000_000)
+
+    with tempfile.TemporaryDirectory() as plain_dir:
+        # Outside a git repository the index stays empty and cards keep the fallback
+        (Path(plain_dir) / "Notes.md").write_text("# Notes\nNot under version control.\n")
+        history = GitHistoryIndex(plain_dir)
+        assert history.update() == set() and len(history) == 0
+        card = FeedGenerator(WikiParser(plain_dir, cache_dir=None)).create_wiki_card("Notes.md")
+        assert card["author"] == "SuperApp Team"
+
+    print("✅ Git history test passed!")
+
+
+if __name__ == "__main__":
+    test_git_history()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the long-lived cat-file reader, page snapshots and fork-light syncs
+Monday Madness Quality Assurance!
+"""
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+from wiki_engine.content_ref import load_card_content, load_card_section
+from wiki_engine.git_objects import GitObjectReader
+from wiki_engine.git_sync import GitSyncEngine
+from wiki_engine.wiki_parser import WikiParser
+
+GIT_IDENTITY = ['-c', 'user.name=Wiki Bot', '-c', 'user.email=bot@example.com']
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(['git', *GIT_IDENTITY, *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def commit_files(repo: Path, files: dict, message: str) -> str:
+    for name, text in files.items():
+        path = repo / name
+        if text is None:
+            path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', message)
+    return git(repo, 'rev-parse', 'HEAD')
+
+
+def test_git_objects():
+    """
+    🚀 Any page at any commit over one pipe; syncs fork only for git pull
+    """
+    print("🧪 Testing GitObjectReader with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        root = Path(root_dir)
+        upstream, wiki, writer = root / "up.git", root / "wiki", root / "writer"
+        git(root, 'init', '-q', '--bare', str(upstream))
+        git(root, 'clone', '-q', str(upstream), str(writer))
+
+        first = commit_files(writer, {
+            "Home.md": "# Home\nWelcome to the first version.\n\n## Roadmap\nShip signup.\n",
+            "guides/Setup.md": "# Setup\nInstall things.\n",
+            "notes": "plain file\n",
+        }, "First")
+        second = commit_files(writer, {
+            "Home.md": "# Home\nWelcome to the second version.\n\n## Roadmap\nShip billing.\n",
+            "guides/Setup.md": None,
+            "guides/Deploy.md": "# Deploy\nPush it.\n",
+            "notes": None,
+            "notes/Meeting.md": "# Meeting\nA file became a folder.\n",
+        }, "Second")
+
+        with GitObjectReader(writer) as reader:
+            assert reader.resolve("HEAD") == second
+            assert reader.read_blob(first, "guides/Setup.md") == b"# Setup\nInstall things.\n"
+            assert reader.read_blob(second, "guides/Setup.md") is None
+            assert sorted(reader.list_files(first)) == ["Home.md", "guides/Setup.md", "notes"]
+            assert sorted(reader.list_files(second, suffix=".md")) == ["Home.md", "guides/Deploy.md",
+                                                                       "notes/Meeting.md"]
+
+            # The tree diff matches git diff --name-only --no-renames
+            expected = git(writer, 'diff', '--name-only', '--no-renames', first, second).split('\n')
+            print(f"🔀 Changed: {reader.changed_paths(first, second)}")
+            assert reader.changed_paths(first, second) == sorted(expected)
+            assert reader.changed_paths(second, second) == []
+            assert reader.commit_time(second) is not None and reader.info("nope") is None
+
+            # A wiki in a subdirectory sees paths relative to itself
+            assert GitObjectReader(writer / "guides").list_files(second) != {}
+            assert list(GitObjectReader(writer / "guides").list_files(second)) == ["Deploy.md"]
+
+            # Pages parsed at a commit, without touching the working tree
+            parser = WikiParser(str(writer), cache_dir=None)
+            old_home = parser.parse_page_at("Home.md", first, reader)
+            assert "first version" in load_card_content(old_home)
+            assert load_card_section(old_home, "roadmap") == "## Roadmap\nShip signup.\n"
+            assert parser.parse_page_at("guides/Setup.md", second, reader)["status"] == "error"
+
+            first_view = parser.parse_snapshot(first, reader)
+            second_view = parser.parse_snapshot(second, reader)
+            assert sorted(first_view) == ["Home.md", "guides/Setup.md"]
+            assert "Meeting" in [card["title"] for card in second_view.values()]
+            assert len(parser._blob_cards) == 5  # Home at first was memoised from parse_page_at
+            parser.parse_snapshot(second, reader)
+            assert len(parser._blob_cards) == 5  # A repeated snapshot parses nothing
+
+            # Page names with spaces: git echoes the spec back in its "missing" answer
+            spaced = commit_files(writer, {"Release Notes.md": "# Release Notes\nShipped.\n"}, "Spaced")
+            assert reader.read_blob(spaced, "Release Notes.md") == b"# Release Notes\nShipped.\n"
+            assert reader.blob_id(second, "Release Notes.md") is None
+            assert reader.read_blob(second, "my old page.md") is None
+            assert parser.parse_page_at("Release Notes.md", second, reader)["status"] == "error"
+            assert parser.parse_page_at("Release Notes.md", spaced, reader)["title"] == "Release Notes"
+            assert reader.resolve("HEAD") == spaced  # The pipes survived every miss
+
+        # Syncs: after warm-up the only process a pull starts is git pull itself
+        git(writer, 'push', '-q', 'origin', 'HEAD')
+        git(root, 'clone', '-q', str(upstream), str(wiki))
+        engine = GitSyncEngine(str(wiki))
+        engine.pull_wiki_updates()
+        assert "second version" in engine.read_page("Home.md")  # Both pipes are now running
+        third = commit_files(writer, {"Home.md": "# Home\nThird version.\n", "New.md": "# New\nHi.\n"}, "Third")
+        git(writer, 'push', '-q', 'origin', 'HEAD')
+
+        started = []
+        original_popen = subprocess.Popen
+
+        class CountingPopen(original_popen):
+            def __init__(self, args, *rest, **kwargs):
+                started.append(args)
+                super().__init__(args, *rest, **kwargs)
+
+        subprocess.Popen = CountingPopen
+        try:
+            result = engine.pull_wiki_updates()
+        finally:
+            subprocess.Popen = original_popen
+
+        print(f"⚙️ Processes started by the sync: {started}")
+        assert [args[:2] for args in started] == [['git', 'pull']]
+        assert result["changes_detected"] and result["files_updated"] == ["Home.md", "New.md"]
+        assert result["commit_after"] == third[:8]
+        assert engine.read_page("Home.md", second).startswith("# Home\nWelcome to the second")
+        engine.close()
+
+    print("✅ GitObjectReader test passed!")
+
+
+if __name__ == "__main__":
+    test_git_objects()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🧪 Test concurrent GitSync pulls from many threads without touching the cwd
+Monday Madness Quality Assurance!
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from wiki_engine.git_sync import GitSyncEngine
+
+GIT_IDENTITY = ['-c', 'user.name=Wiki Bot', '-c', 'user.email=bot@example.com']
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(['git', *GIT_IDENTITY, *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def make_upstream(root: Path) -> Path:
+    """
+    🏗️ A bare upstream with one commit, ready to be cloned
+    """
+    upstream = root / "upstream.git"
+    git(root, 'init', '-q', '--bare', str(upstream))
+    seed = root / "seed"
+    git(root, 'clone', '-q', str(upstream), str(seed))
+    (seed / "Home.md").write_text("# Home\nWelcome.\n")
+    git(seed, 'add', '-A')
+    git(seed, 'commit', '-q', '-m', 'Initial page')
+    git(seed, 'push', '-q', 'origin', 'HEAD')
+    return seed
+
+
+def test_git_sync_concurrency():
+    """
+    🚀 Parallel syncs of two wikis each see the update exactly once
+    """
+    print("🧪 Testing concurrent GitSync with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        root = Path(root_dir)
+        seed = make_upstream(root)
+        clones = [root / "wiki_a", root / "wiki_b"]
+        for clone in clones:
+            git(root, 'clone', '-q', str(root / "upstream.git"), str(clone))
+
+        # Upstream moves on: one edited page, one new page
+        (seed / "Home.md").write_text("# Home\nWelcome, now with a roadmap.\n")
+        (seed / "Roadmap.md").write_text("# Roadmap\nSelf-signup first.\n")
+        git(seed, 'add', '-A')
+        git(seed, 'commit', '-q', '-m', 'Add roadmap')
+        git(seed, 'push', '-q', 'origin', 'HEAD')
+
+        original_cwd = os.getcwd()
+        results = {str(clone): [] for clone in clones}
+        cwd_seen = set()
+        start = threading.Barrier(9)
+
+        def sync(clone: Path) -> None:
+            engine = GitSyncEngine(str(clone))  # One engine per "session"
+            start.wait()
+            results[str(clone)].append(engine.pull_wiki_updates())
+            engine.detect_file_changes()
+
+        def watch_cwd() -> None:
+            start.wait()
+            for _ in range(200):
+                cwd_seen.add(os.getcwd())
+
+        threads = [threading.Thread(target=sync, args=(clones[i % 2],)) for i in range(8)]
+        threads.append(threading.Thread(target=watch_cwd))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cwd_seen == {original_cwd} and os.getcwd() == original_cwd
+        for clone in clones:
+            clone_results = results[str(clone)]
+            print(f"🔄 {clone.name}: {[result['status'] for result in clone_results]}")
+            assert all(result["status"] == "success" for result in clone_results)
+            changed = [result for result in clone_results if result["changes_detected"]]
+            assert len(changed) == 1  # Pulls into one repo are serialised: the first one sees the update
+            assert sorted(changed[0]["files_updated"]) == ["Home.md", "Roadmap.md"]
+
+        # One engine shared by several threads keeps a consistent history
+        shared = GitSyncEngine(str(clones[0]))
+        threads = [threading.Thread(target=shared.pull_wiki_updates) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [entry["sync_count"] for entry in shared.sync_history] == list(range(1, 7))
+
+        missing = GitSyncEngine(str(root / "nowhere")).pull_wiki_updates()
+        assert missing["status"] == "error" and missing["files_updated"] == []
+
+    print("✅ Concurrent GitSync test passed!")
+
+
+if __name__ == "__main__":
+    test_git_sync_concurrency()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+🧪 Test sanitized HTML rendering and the per-content-hash render cache
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import wiki_engine.card_components as card_components
+import wiki_engine.html_renderer as html_renderer
+from wiki_engine.card_components import WikiCard
+from wiki_engine.html_renderer import RenderCache, render_markdown
+from wiki_engine.section_tree import iter_sections
+from wiki_engine.wiki_parser import WikiParser
+
+PAGE = """# Team Guide
+Welcome, see the [setup notes](Setup.md) and *read* the `config_file`.
+<script>alert("hi")</script> and [trap](javascript:alert(1)) stay harmless.
+
+## Permissions
+| Role | Edit |
+|:-----|:----:|
+| **Admin** | ✅ |
+
+## Steps
+- Clone the repo
+  - Use `--depth 1`
+1. Run the installer
+
+```html
+<b>not bold</b>
+```
+
+## Steps
+Done.
+"""
+
+
+class RecordingStreamlit:
+    """
+    🎥 Stands in for streamlit and remembers the HTML it was asked to show
+    """
+
+    def __init__(self):
+        self.session_state = {}
+        self.shown_html = []
+
+    def html(self, body): self.shown_html.append(body)
+    def container(self): return self
+    def columns(self, cols): return [self] * cols
+    def markdown(self, text, **kwargs): pass
+    def metric(self, label, value): pass
+    def info(self, text): pass
+    def selectbox(self, label, options, **kwargs): return options[0]
+    def button(self, label, **kwargs): return False
+    def __enter__(self): return self
+    def __exit__(self, *args): pass
+
+
+def test_html_renderer():
+    """
+    🚀 Pages render to safe HTML once, and opening a card is served from the cache
+    """
+    print("🧪 Testing the HTML render cache with Monday Madness energy!")
+    print("=" * 60)
+
+    rendered = render_markdown(PAGE)
+    print(rendered[:200])
+    assert "<script>" not in rendered and "&lt;script&gt;" in rendered
+    assert "javascript:" not in rendered  # The unsafe link loses its href
+    assert '<a href="Setup.md">setup notes</a>' in rendered
+    assert "<em>read</em>" in rendered and "<code>config_file</code>" in rendered
+    assert '<th style="text-align:left">Role</th>' in rendered and "<strong>Admin</strong>" in rendered
+    assert '<ul><li>\nClone the repo\n<ul><li>' in rendered and '<ol><li>' in rendered
+    assert '<pre><code class="language-html">&lt;b&gt;not bold&lt;/b&gt;</code></pre>' in rendered
+
+    # Images, badge links and URLs with parentheses
+    assert render_markdown("![Logo](https://example.com/logo.png)") == \
+        '<p><img src="https://example.com/logo.png" alt="Logo"></p>'
+    assert render_markdown("[![build](badge.svg)](https://ci.example.com)") == \
+        '<p><a href="https://ci.example.com"><img src="badge.svg" alt="build"></a></p>'
+    assert render_markdown("[Foo](https://en.wikipedia.org/wiki/Foo_(bar)) rocks") == \
+        '<p><a href="https://en.wikipedia.org/wiki/Foo_(bar)">Foo</a> rocks</p>'
+    assert render_markdown("[x](javascript:alert(1))") == "<p>x</p>"
+    assert render_markdown("![x](javascript:alert(1))") == "<p>x</p>"  # Unsafe image: alt text only
+    assert render_markdown('![`cfg` file](a.png "Config (v2)")') == '<p><img src="a.png" alt="cfg file"></p>'
+    assert render_markdown('![q](x.png" onerror="alert(1))') == \
+        '<p>![q](x.png&quot; onerror=&quot;alert(1))</p>'  # Quotes can never open an attribute
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        (Path(wiki_dir) / "Guide.md").write_text(PAGE)
+        card = WikiParser(wiki_dir, cache_dir=None).parse_markdown_to_card("Guide.md")
+
+        # Heading ids are the section anchors, repeats included
+        anchors = [section["anchor"] for section in iter_sections(card["metadata"]["sections"])]
+        assert anchors == ["team-guide", "permissions", "steps", "steps-1"]
+        for anchor in anchors:
+            assert f'id="{anchor}"' in rendered
+
+        # Rendered once; reruns come from memory, a fresh process from disk
+        cache = RenderCache(cache_dir)
+        big_page = PAGE * 2000
+        start = time.perf_counter()
+        first = cache.render(big_page)
+        render_time = time.perf_counter() - start
+        start = time.perf_counter()
+        assert cache.render(big_page) == first
+        hit_time = time.perf_counter() - start
+        print(f"⏱️ {len(big_page) / 1e6:.1f}MB page: render {render_time * 1000:.0f}ms, cached {hit_time * 1000:.1f}ms")
+        assert cache.stats == {"memory_hits": 1, "disk_hits": 0, "renders": 1}
+        assert hit_time < render_time
+
+        restarted = RenderCache(cache_dir)
+        assert restarted.render(big_page) == first and restarted.stats["disk_hits"] == 1
+        assert restarted.render(PAGE + "\nEdited.") != rendered  # New content, new entry
+
+        # A tiny memory budget still keeps the newest page
+        small = RenderCache(None, memory_budget=10)
+        small.render(PAGE)
+        small.render(PAGE)
+        assert small.stats["memory_hits"] == 1
+
+        # Opening a card renders its body once, later reruns hit the cache
+        card_cache = html_renderer._default_cache = RenderCache(cache_dir)
+        recorder = RecordingStreamlit()
+        original_st, card_components.st = card_components.st, recorder
+        try:
+            for _ in range(3):
+                WikiCard({**card, "sections": card["metadata"]["sections"]})._show_full_content()
+        finally:
+            card_components.st = original_st
+            html_renderer._default_cache = None
+        assert recorder.shown_html == [rendered] * 3
+        assert card_cache.stats == {"memory_hits": 2, "disk_hits": 0, "renders": 1}
+
+    print("✅ HTML render cache test passed!")
+
+
+if __name__ == "__main__":
+    test_html_renderer()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+🧪 Test incremental feed updates from sync change sets
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.wiki_parser import WikiParser
+
+PAGE = """# {title}
+Admins can invite members, manage permissions and create accounts for every user.
+
+- Invite members by email
+- Manage roles and permissions
+- Create a default account
+"""
+
+
+def test_incremental_feed():
+    """
+    🚀 Only changed pages are re-parsed and the result matches a full rebuild
+    """
+    print("🧪 Testing incremental feed updates with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        for name in ("Account-Management", "User", "Invites"):
+            (wiki / f"{name}.md").write_text(PAGE.format(title=name.replace('-', ' ')))
+
+        feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=None))
+        timeline = feed_gen.generate_activity_timeline()
+        print(f"📊 Initial timeline: {[card['title'] for card in timeline]}")
+        assert len(timeline) == 3
+
+        # Simulate a sync: one page edited, one deleted, one added
+        (wiki / "User.md").write_text(PAGE.format(title="User Profile"))
+        (wiki / "Invites.md").unlink()
+        (wiki / "Permissions.md").write_text(PAGE.format(title="Permissions"))
+
+        parsed = []
+        original_parse = feed_gen.parser.parse_markdown_to_card
+        feed_gen.parser.parse_markdown_to_card = lambda md_file: parsed.append(md_file) or original_parse(md_file)
+
+        result = feed_gen.apply_file_changes(["User.md", "Invites.md", "Permissions.md", "logo.png"])
+        print(f"🔁 Change set applied: {result}")
+        assert sorted(parsed) == ["Permissions.md", "User.md"]
+        assert result["removed"] == ["Invites.md"]
+
+        incremental = [card["id"] for card in feed_gen.generate_activity_timeline()]
+        feed_gen.feed_cache.clear()
+        rebuilt = [card["id"] for card in feed_gen.generate_activity_timeline()]
+        print(f"📅 Incremental: {incremental}")
+        assert incremental == rebuilt
+
+    print("\n" + "=" * 60)
+    print("🎉 Incremental Feed Test Complete! SYNCS SCALE WITH THE DIFF! 🚀")
+
+
+if __name__ == "__main__":
+    test_incremental_feed()
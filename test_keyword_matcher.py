@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the shared multi-group keyword matcher
+Monday Madness Quality Assurance!
+"""
+
+import random
+
+from wiki_engine.keyword_matcher import (ACTION_WORDS, ENGAGING_WORDS, HEADING_VERBS, TECHNICAL_TERMS,
+                                         TYPE_KEYWORDS, WIKI_KEYWORDS, KeywordMatcher)
+
+
+def test_keyword_matcher():
+    """
+    🚀 One scan agrees with the per-list `in` loops it replaced
+    """
+    print("🧪 Testing KeywordMatcher with Monday Madness energy!")
+    print("=" * 60)
+
+    hits = WIKI_KEYWORDS.scan("we manage the management of users: api apis api")
+    print(f"🔎 {hits}")
+    assert hits["technical"] == {"api": 2}                      # "apis" is not the word "api"
+    assert hits["action"] == {"manage": 1}                      # "management" is not the word "manage"
+    assert hits["type"] == {"management": 1, "user": 1, "api": 3}
+    assert hits["heading_verbs"] == {"manage": 2}               # ...but it does contain it
+
+    assert WIKI_KEYWORDS.find("user account management", "type") == ["user", "account", "management"]
+    assert WIKI_KEYWORDS.find("edit permissions", "technical") == []
+    assert WIKI_KEYWORDS.find("the api docs", "technical") == ["api"]
+    assert WIKI_KEYWORDS.scan("nothing to see here") == {group: {} for group in WIKI_KEYWORDS.groups}
+
+    # Randomised agreement with the naive loops
+    vocabulary = sorted(TECHNICAL_TERMS | ACTION_WORDS) + list(TYPE_KEYWORDS) + [
+        "users", "apis", "profiles", "rebuild", "the", "a", "of", "team", "Manage", "API", "data", "|", "-"]
+    rng = random.Random(7)
+    for _ in range(300):
+        text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30))).lower()
+        words = text.split()
+        hits = WIKI_KEYWORDS.scan(text)
+
+        assert sum(hits["technical"].values()) == sum(1 for word in words if word in TECHNICAL_TERMS)
+        assert sum(hits["action"].values()) == sum(1 for word in words if word in ACTION_WORDS)
+        assert set(hits["type"]) == {keyword for keyword in TYPE_KEYWORDS if keyword in text}
+        assert set(hits["engaging"]) == {keyword for keyword in ENGAGING_WORDS if keyword in text}
+        assert set(hits["heading_verbs"]) == {keyword for keyword in HEADING_VERBS if keyword in text}
+
+    # Custom groups work the same way
+    matcher = KeywordMatcher({"langs": ["go"]}, {"tools": ["git", "github"]})
+    assert matcher.scan("go to github with git, going") == {"langs": {"go": 1}, "tools": {"github": 1, "git": 2}}
+
+    print("✅ KeywordMatcher test passed!")
+
+
+if __name__ == "__main__":
+    test_keyword_matcher()
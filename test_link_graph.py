@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the incremental wiki link graph (backlinks, orphans, broken links)
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.link_graph import LinkGraph, link_key
+from wiki_engine.wiki_parser import WikiParser
+
+PAGE = """# {title}
+Admins can invite members, manage permissions and create accounts for every user.
+
+- Invite members by email
+- Manage roles and permissions
+{links}
+"""
+
+
+def test_link_graph():
+    """
+    🚀 Edges update page by page and every query matches a fresh rebuild
+    """
+    print("🧪 Testing LinkGraph with Monday Madness energy!")
+    print("=" * 60)
+
+    assert link_key("docs/Account-Permissions.md#roles") == "account-permissions"
+    assert link_key("./Account%20Permissions") == "account-permissions"
+    assert link_key("#local-anchor") is None and link_key("images/logo.png") is None
+
+    graph = LinkGraph()
+    graph.update_page("Home.md", ["Account-Management", "Missing-Page"])
+    graph.update_page("Account-Management.md", ["./Permissions.md#roles", "Home"])
+    graph.update_page("Permissions.md", ["Permissions"])  # Self-links do not count
+    graph.update_page("Lonely.md", [])
+
+    assert graph.backlinks("Permissions.md") == ["Account-Management.md"]
+    assert graph.backlinks("Home.md") == ["Account-Management.md"]
+    assert graph.orphans() == ["Lonely.md"]  # Home is never an orphan
+    assert graph.broken_links() == {"Home.md": ["Missing-Page"]}
+
+    # Creating the missing page mends the link; relinking moves the backlinks
+    assert graph.update_page("guides/Missing-Page.md", []) == {"guides/Missing-Page.md"}
+    assert graph.broken_links() == {}
+    changed = graph.update_page("Account-Management.md", ["Lonely"])
+    assert changed == {"Permissions.md", "Home.md", "Lonely.md"}
+    assert graph.orphans() == ["Permissions.md"]
+
+    # Deleting a linked page turns its inbound links into broken ones
+    assert graph.remove_page("Lonely.md") == set()
+    assert graph.broken_links() == {"Account-Management.md": ["Lonely"]}
+    assert graph.links_from("Home.md") == ["Account-Management.md", "guides/Missing-Page.md"]
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        pages = {
+            "Account-Management": "See [permissions](Account-Permissions) and [users](User).",
+            "Account-Permissions": "Back to [accounts](Account-Management.md).",
+            "User": "Read the [guide](https://example.com/guide) and [setup](Setup).",
+        }
+        for name, links in pages.items():
+            (wiki / f"{name}.md").write_text(PAGE.format(title=name.replace('-', ' '), links=links))
+
+        feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=None))
+        timeline = {card["id"]: card for card in feed_gen.generate_activity_timeline()}
+        print(f"🔗 Referenced by: {[(card_id, card['referenced_by']) for card_id, card in timeline.items()]}")
+        assert timeline["wiki_card_wiki_User"]["referenced_by"] == ["Account-Management.md"]
+        assert feed_gen.link_report() == {"orphans": [], "broken_links": {"User.md": ["Setup"]}}
+
+        # A sync adds the missing page and unlinks User - only those cards move
+        (wiki / "Setup.md").write_text(PAGE.format(title="Setup", links=""))
+        (wiki / "Account-Management.md").write_text(
+            PAGE.format(title="Account Management", links="See [permissions](Account-Permissions)."))
+        feed_gen.apply_file_changes(["Setup.md", "Account-Management.md"])
+
+        user_card = feed_gen.feed_cache["User.md"]
+        assert user_card["referenced_by"] == []
+        assert feed_gen.feed_cache["Setup.md"]["referenced_by"] == ["User.md"]
+        assert feed_gen.link_report() == {"orphans": ["User.md"], "broken_links": {}}
+
+        incremental = feed_gen.link_report()
+        feed_gen.feed_cache.clear()
+        feed_gen.link_graph = LinkGraph()
+        feed_gen.generate_activity_timeline()
+        assert feed_gen.link_report() == incremental
+
+    print("✅ LinkGraph test passed!")
+
+
+if __name__ == "__main__":
+    test_link_graph()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+🧪 Test bulk parsing with WikiParser.parse_all
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.wiki_parser import PARALLEL_MIN_PAGES, WikiParser
+
+
+def test_parse_all():
+    """
+    🚀 Pool parsing matches serial parsing, in order, despite a broken page
+    """
+    print("🧪 Testing parse_all with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        page_count = PARALLEL_MIN_PAGES + 8
+        for i in range(page_count):
+            (wiki / f"Page-{i:03d}.md").write_text(
+                f"# Page {i}\nAdmins can invite members and manage permissions for account {i}.\n- Invite member {i}\n"
+            )
+        (wiki / "Broken.md").write_bytes(b"\xff\xfe not utf-8")
+
+        parser = WikiParser(wiki_dir, cache_dir=None)
+        md_files = sorted(path.name for path in parser.get_all_wiki_files())
+
+        serial = parser.parse_all(md_files, workers=1)
+        pooled = parser.parse_all(md_files, workers=2, chunk_size=8)
+
+        print(f"📊 Parsed {len(pooled)} pages across 2 workers")
+        assert [card["title"] for card in pooled] == [card["title"] for card in serial]
+        assert pooled[0]["status"] == "error"  # Broken.md sorts first
+        assert all(card["status"] == "success" for card in pooled[1:])
+
+    print("\n" + "=" * 60)
+    print("🎉 parse_all Test Complete! ALL CORES ENGAGED! 🚀")
+
+
+if __name__ == "__main__":
+    test_parse_all()
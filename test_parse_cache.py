@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the persistent parse cache
+Monday Madness Quality Assurance!
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from wiki_engine.wiki_parser import WikiParser
+
+
+def test_parse_cache():
+    """
+    🚀 Cards survive a parser restart and only re-parse when content changes
+    """
+    print("🧪 Testing ParseCache with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        page = Path(wiki_dir) / "Home.md"
+        page.write_text("# Home\nWelcome to the account management system for every user.\n")
+
+        first = WikiParser(wiki_dir, cache_dir=cache_dir).parse_markdown_to_card("Home.md")
+        assert first["status"] == "success"
+
+        # A brand new parser (think: new container) gets the card from disk without re-parsing
+        restarted = WikiParser(wiki_dir, cache_dir=cache_dir)
+        restarted._build_card = None  # Any re-parse would blow up here
+        assert restarted.parse_markdown_to_card("Home.md")["summary"] == first["summary"]
+        print("✅ Stat hit served from disk")
+
+        # Same bytes, new mtime (fresh clone): content hash matches, no re-parse
+        os.utime(page, (1_700_000_000, 1_700_000_000))
+        touched = restarted.parse_markdown_to_card("Home.md")
+        assert touched["timestamp"].timestamp() == 1_700_000_000
+        print("✅ Content-hash hit after touch")
+
+        # Real edit: parsed again
+        page.write_text("# Home\nInvite members and manage permissions for the account team.\n")
+        edited = WikiParser(wiki_dir, cache_dir=cache_dir).parse_markdown_to_card("Home.md")
+        assert edited["summary"] != first["summary"]
+        print(f"✅ Edited page re-parsed: {edited['summary']}")
+
+        # A capped parser sharing the cache never gets the uncapped ContentRef, or the reverse
+        page.write_text("# Home\n" + "Invite members and manage permissions for the account team.\n" * 50)
+        uncapped = WikiParser(wiki_dir, cache_dir=cache_dir).parse_markdown_to_card("Home.md")
+        capped = WikiParser(wiki_dir, cache_dir=cache_dir, body_limit=100).parse_markdown_to_card("Home.md")
+        assert uncapped["content_ref"].end is None
+        assert capped["content_ref"].end is not None and capped["content_ref"].end <= 100
+        again = WikiParser(wiki_dir, cache_dir=cache_dir).parse_markdown_to_card("Home.md")
+        assert again["content_ref"].end is None
+        print("✅ Cache entries kept apart per body_limit")
+
+    print("\n" + "=" * 60)
+    print("🎉 ParseCache Test Complete! WARM STARTS ACTIVATED! 🚀")
+
+
+if __name__ == "__main__":
+    test_parse_cache()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+🧪 Test table extraction and the bitset permissions-matrix queries
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.permissions_matrix import PermissionsMatrix, is_permissions_table
+from wiki_engine.tokenizer import MarkdownTokenizer
+from wiki_engine.wiki_parser import WikiParser
+
+PERMISSIONS_PAGE = """# Account Member Permissions
+Who can do what with account members.
+
+| **Permission/Role**             | **Owner** | **Admin** | **Manager** | **Staff** |
+|-------------------------------|----------|----------|----------|----------
+| Invite members to account     | ✅    | ✅    | ➖    |➖    |
+| Delete members from account     | ✅    | ✅    | ➖    |➖    |
+| See Account Pending invites     | ✅    | ✅    | ✅     |➖    |
+| Edit Account Info    | ✅    | ➖| ➖    |➖    |
+
+```
+| Not | A | Table |
+|---|---|---|
+```
+
+| Plan | Price |
+|---|---|
+| Pro \\| Team | $10 |
+"""
+
+
+def test_permissions_matrix():
+    """
+    🚀 Markdown tables become columns, permission tables answer role questions
+    """
+    print("🧪 Testing PermissionsMatrix with Monday Madness energy!")
+    print("=" * 60)
+
+    tables = MarkdownTokenizer.tokenize(PERMISSIONS_PAGE).tables
+    print(f"📋 Tables: {[table['header'] for table in tables]}")
+    assert len(tables) == 2
+    permissions_table, price_table = tables
+    assert permissions_table["header"] == ["Permission/Role", "Owner", "Admin", "Manager", "Staff"]
+    assert permissions_table["columns"][3] == ["➖", "➖", "✅", "➖"]
+    assert price_table["columns"] == [["Pro | Team"], ["$10"]]
+    assert is_permissions_table(permissions_table) and not is_permissions_table(price_table)
+
+    matrix = PermissionsMatrix(permissions_table)
+    assert matrix.roles_with("Invite members to account") == ["Owner", "Admin"]
+    assert matrix.roles_with("invites") == ["Owner", "Admin", "Manager"]  # Partial names match every mention
+    assert matrix.permissions_of("manager") == ["See Account Pending invites"]
+    assert matrix.permissions_of("Staff") == []
+    assert matrix.can("Admin", "delete members from  account")
+    assert not matrix.can("Admin", "Edit Account Info")
+    assert matrix.roles_with_all(["Invite members to account", "Edit Account Info"]) == ["Owner"]
+    assert matrix.permissions_of("Nobody") == [] and matrix.roles_with("Fly") == []
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        wiki = Path(wiki_dir)
+        page = wiki / "Account-Member-Permissions.md"
+        page.write_text(PERMISSIONS_PAGE)
+
+        parser = WikiParser(wiki_dir, cache_dir=cache_dir)
+        assert parser.get_tables("Account-Member-Permissions.md") == tables
+
+        feed_gen = FeedGenerator(parser)
+        assert feed_gen.roles_with_permission("Edit Account Info") == ["Owner"]
+        assert feed_gen.permissions_for_role("Manager") == ["See Account Pending invites"]
+
+        # A sync that edits the matrix rebuilds just that page's bitsets
+        page.write_text(PERMISSIONS_PAGE.replace("| Edit Account Info    | ✅    | ➖|",
+                                                 "| Edit Account Info    | ✅    | ✅|"))
+        feed_gen.apply_file_changes(["Account-Member-Permissions.md"])
+        assert feed_gen.roles_with_permission("Edit Account Info") == ["Owner", "Admin"]
+
+        page.unlink()
+        feed_gen.apply_file_changes(["Account-Member-Permissions.md"])
+        assert feed_gen.permissions_for_role("Owner") == []
+
+    print("✅ PermissionsMatrix test passed!")
+
+
+if __name__ == "__main__":
+    test_permissions_matrix()
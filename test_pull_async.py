@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+🧪 Test asyncio pulls with hard deadlines and cancellation
+Monday Madness Quality Assurance!
+"""
+
+import asyncio
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from wiki_engine.git_sync import GitSyncEngine, _repo_lock
+
+GIT_IDENTITY = ['-c', 'user.name=Wiki Bot', '-c', 'user.email=bot@example.com']
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(['git', *GIT_IDENTITY, *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout
+
+
+async def ticking(coroutine):
+    """
+    ⏱️ Run a coroutine while counting how often the event loop got to run something else
+    """
+    ticks = 0
+    task = asyncio.ensure_future(coroutine)
+    while not task.done():
+        ticks += 1
+        await asyncio.sleep(0.01)
+    return await task, ticks
+
+
+async def timed(coroutine):
+    """
+    ⏱️ ticking(), plus how long the coroutine took to return
+    """
+    start = time.perf_counter()
+    result, ticks = await ticking(coroutine)
+    return result, ticks, time.perf_counter() - start
+
+
+def test_pull_async():
+    """
+    🚀 A hung remote costs at most the timeout and never blocks the event loop
+    """
+    print("🧪 Testing asyncio pulls with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        root = Path(root_dir)
+        upstream, seed, wiki = root / "upstream.git", root / "seed", root / "wiki"
+        git(root, 'init', '-q', '--bare', str(upstream))
+        git(root, 'clone', '-q', str(upstream), str(seed))
+        (seed / "Home.md").write_text("# Home\nWelcome.\n")
+        git(seed, 'add', '-A')
+        git(seed, 'commit', '-q', '-m', 'Initial page')
+        git(seed, 'push', '-q', 'origin', 'HEAD')
+        git(root, 'clone', '-q', str(upstream), str(wiki))
+
+        (seed / "Roadmap.md").write_text("# Roadmap\nSelf-signup first.\n")
+        git(seed, 'add', '-A')
+        git(seed, 'commit', '-q', '-m', 'Add roadmap')
+        git(seed, 'push', '-q', 'origin', 'HEAD')
+
+        engine = GitSyncEngine(str(wiki))
+        result, ticks = asyncio.run(ticking(engine.pull_async(timeout=30)))
+        print(f"📥 Async pull: {result['files_updated']} ({ticks} loop ticks meanwhile)")
+        assert result["status"] == "success" and result["files_updated"] == ["Roadmap.md"]
+        assert set(result) == set(engine.pull_wiki_updates())  # Same shape as the blocking pull
+
+        # Reading HEAD or diffing trees never blocks the loop and counts against the deadline
+        # (timed inside the loop: asyncio.run then waits for the stalled worker thread)
+        (seed / "Team.md").write_text("# Team\nHello.\n")
+        git(seed, 'add', '-A')
+        git(seed, 'commit', '-q', '-m', 'Add team')
+        git(seed, 'push', '-q', 'origin', 'HEAD')
+        reader = engine.objects
+        for stalled_call in ("resolve", "changed_paths"):
+            setattr(reader, stalled_call, lambda *args, **kwargs: time.sleep(1.5))
+            logged = len(engine.sync_history)
+            slow, ticks, elapsed = asyncio.run(timed(engine.pull_async(timeout=0.5)))
+            delattr(reader, stalled_call)
+            print(f"🐢 Stalled {stalled_call}: {slow.get('error')} after {elapsed:.2f}s ({ticks} loop ticks)")
+            assert slow["status"] == "error" and "timed out" in slow["error"]
+            assert elapsed < 1.2 and ticks > 10
+            assert len(engine.sync_history) == logged  # No success logged for a timed-out sync
+
+        # A remote that never answers: the ssh "client" just sleeps
+        git(wiki, 'remote', 'set-url', 'origin', 'ssh://wiki.example.invalid/wiki.git')
+        git(wiki, 'config', 'core.sshCommand', "sh -c 'sleep 30' --")
+
+        start = time.perf_counter()
+        stalled, ticks = asyncio.run(ticking(engine.pull_async(timeout=0.5)))
+        elapsed = time.perf_counter() - start
+        print(f"⏰ Stalled async pull: {stalled['error']} after {elapsed:.2f}s ({ticks} loop ticks)")
+        assert stalled["status"] == "error" and "timed out" in stalled["error"]
+        assert set(stalled) == set(engine._error_result("x")) and stalled["files_updated"] == []
+        assert elapsed < 5 and ticks > 10  # The sleeping ssh was killed too; the loop kept running
+
+        start = time.perf_counter()
+        blocking = engine.pull_wiki_updates(timeout=0.5)
+        print(f"⏰ Stalled blocking pull: {blocking['error']} after {time.perf_counter() - start:.2f}s")
+        assert blocking["status"] == "error" and "timed out" in blocking["error"]
+        assert time.perf_counter() - start < 5
+
+        # Cancelling the task kills git and releases the repository
+        async def cancel_midway():
+            task = asyncio.ensure_future(engine.pull_async(timeout=None))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return "cancelled"
+            return "finished"
+
+        start = time.perf_counter()
+        assert asyncio.run(cancel_midway()) == "cancelled"
+        assert time.perf_counter() - start < 5
+        lock = _repo_lock(wiki)
+        assert lock.acquire(blocking=False)
+
+        # Waiting for another pull counts against the deadline as well
+        try:
+            busy, ticks = asyncio.run(ticking(engine.pull_async(timeout=0.3)))
+        finally:
+            lock.release()
+        assert busy["status"] == "error" and "timed out" in busy["error"] and ticks > 10
+
+        missing = asyncio.run(GitSyncEngine(str(root / "nowhere")).pull_async())
+        assert missing["status"] == "error" and missing["error"] == "Repository path does not exist"
+        engine.close()
+
+    print("✅ Asyncio pull test passed!")
+
+
+if __name__ == "__main__":
+    test_pull_async()
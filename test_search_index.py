@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the BM25 full-text search index
+Monday Madness Quality Assurance!
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import wiki_engine.search_index as search_index
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.search_index import SearchIndex
+from wiki_engine.wiki_parser import WikiParser
+
+
+PAGES = {
+    "Account-Management.md": "# Account Management\n\nAdmins invite users and manage account roles.\n\n"
+                             "- Invite team members by email\n- Remove inactive accounts\n",
+    "Permissions.md": "# Permissions\n\nRole based permissions decide who can edit menus.\n\n"
+                      "| Role | Edit menus |\n|------|------|\n| Admin | Yes |\n\n- Manage role permissions\n",
+    "Deploy-Guide.md": "# Deploy Guide\n\nRailway builds the dashboard from the main branch.\n\n"
+                       "- Configure environment variables\n- Build and deploy\n",
+}
+
+
+def test_search_index():
+    """
+    🚀 Ranked search, phrase queries, per-file updates and a saved index
+    """
+    print("🧪 Testing SearchIndex with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        wiki = Path(wiki_dir)
+        for name, text in PAGES.items():
+            (wiki / name).write_text(text)
+
+        feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=cache_dir))
+        feed_gen.generate_activity_timeline()
+        index = feed_gen.search_index
+        assert len(index) == 3
+
+        results = index.search_pages("invite account", k=3)
+        print(f"🔎 invite account -> {results}")
+        assert results[0][0] == "Account-Management.md"
+        assert index.search("invite account", k=1) == [feed_gen.feed_cache["Account-Management.md"]["id"]]
+
+        # Cards come back through the feed generator too
+        assert [card["title"] for card in feed_gen.search("railway deploy")] == ["Deploy Guide"]
+        assert feed_gen.search("nonexistentterm") == []
+
+        # Quoted phrases must appear verbatim
+        assert [page for page, _ in index.search_pages('"edit menus"')] == ["Permissions.md"]
+        assert index.search_pages('"menus edit"') == []
+
+        # Per-file updates from a sync change set
+        (wiki / "Deploy-Guide.md").write_text("# Deploy Guide\n\nShip it with Kubernetes now.\n\n- Build and deploy\n")
+        stat = (wiki / "Deploy-Guide.md").stat()
+        os.utime(wiki / "Deploy-Guide.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (wiki / "Permissions.md").unlink()
+        feed_gen.apply_file_changes(["Deploy-Guide.md", "Permissions.md"])
+        assert index.search_pages("railway") == []
+        assert [page for page, _ in index.search_pages("kubernetes")] == ["Deploy-Guide.md"]
+        assert "Permissions.md" not in index.pages
+
+        # The saved index loads back identically, and queries take milliseconds
+        reloaded = SearchIndex(str(Path(cache_dir) / "search_index.bin"))
+        assert sorted(reloaded.pages) == sorted(index.pages)
+        for query in ("invite account", "kubernetes", '"build and deploy"', "role"):
+            assert reloaded.search_pages(query) == index.search_pages(query)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            reloaded.search("invite account roles", k=10)
+        elapsed_ms = (time.perf_counter() - start) * 10
+        print(f"⚡ {elapsed_ms:.3f} ms per query")
+        assert elapsed_ms < 50
+
+        # Sessions saving the shared index at once never install a mixed file
+        index_path = Path(cache_dir) / "shared" / "search_index.bin"
+        writers = []
+        for number in range(4):
+            writer = SearchIndex(str(index_path))
+            for page in range(1 + number * 300):  # Different sizes, so overlapping writes would corrupt
+                writer.add_page(f"Page-{page}.md", f"card-{page}", ["kubernetes", "deploy", f"step{page}"] * 20)
+            writers.append(writer)
+
+        def save_repeatedly(writer):
+            for _ in range(40):
+                writer.save(force=True)
+
+        threads = [threading.Thread(target=save_repeatedly, args=(writer,)) for writer in writers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        final = SearchIndex(str(index_path))
+        assert len(final) in {len(writer) for writer in writers} and final.search_pages("kubernetes deploy")
+        assert list(index_path.parent.glob("*.tmp")) == []
+
+    # A cold build indexes the terms the (parallel) parse already extracted - no second read
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        wiki = Path(wiki_dir)
+        for number in range(40):
+            (wiki / f"Guide-{number}.md").write_text(
+                f"---\ntags: onboarding{number}\n---\n# Guide {number}\n\nStep {number} of the rollout.\n\n"
+                "- Invite team members by email\n- Manage role permissions\n"
+            )
+
+        class NoSecondPass:
+            def __init__(self, *args, **kwargs):
+                raise AssertionError("page tokenized a second time for the search index")
+
+        original_tokenizer, search_index.MarkdownTokenizer = search_index.MarkdownTokenizer, NoSecondPass
+        try:
+            feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=cache_dir), workers=2)
+            feed_gen.generate_activity_timeline()
+        finally:
+            search_index.MarkdownTokenizer = original_tokenizer
+        assert len(feed_gen.search_index) == 40 and feed_gen.parser._search_docs == {}
+
+        # Same index as reading every file again, front matter included
+        reread = SearchIndex()
+        for page in feed_gen.search_index.pages:
+            reread.index_file(page, feed_gen.feed_cache[page]["id"], wiki / page)
+        for query in ("onboarding7", "rollout step", '"invite team members"', "guide 12"):
+            assert feed_gen.search_index.search_pages(query) == reread.search_pages(query)
+        assert [page for page, _ in feed_gen.search_index.search_pages("onboarding7")] == ["Guide-7.md"]
+
+    print("✅ SearchIndex test passed!")
+
+
+if __name__ == "__main__":
+    test_search_index()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🧪 Test the per-page section tree and single-section retrieval
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.content_ref import load_card_section
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.section_tree import find_section, iter_sections, slugify
+from wiki_engine.wiki_parser import WikiParser
+
+SAMPLE_PAGE = (
+    "Intro text before any heading.\r\n"
+    "# Account Management\r\n"
+    "Overview of the account.\r\n"
+    "## 1. Invite new Members\r\n"
+    "- Invite by email\r\n"
+    "```bash\r\n"
+    "# not a heading\r\n"
+    "```\r\n"
+    "### Example\r\n"
+    "Invite example.\r\n"
+    "## Permissions ✅\r\n"
+    "| Role | Invite |\r\n"
+    "|---|---|\r\n"
+    "### Example\r\n"
+    "Permission example.\r\n"
+)
+
+
+def test_section_tree():
+    """
+    🚀 Headings nest into a tree whose byte ranges slice the file exactly
+    """
+    print("🧪 Testing section trees with Monday Madness energy!")
+    print("=" * 60)
+
+    assert slugify("1. Invite new Members") == "1-invite-new-members"
+    assert slugify("See [the docs](Docs) `now`!") == "see-the-docs-now"
+
+    with tempfile.TemporaryDirectory() as wiki_dir, tempfile.TemporaryDirectory() as cache_dir:
+        page = Path(wiki_dir) / "Account-Management.md"
+        page.write_bytes(SAMPLE_PAGE.encode("utf-8"))
+        raw = page.read_bytes()
+
+        parser = WikiParser(wiki_dir, cache_dir=cache_dir)
+        card = parser.parse_markdown_to_card("Account-Management.md")
+        tree = card["metadata"]["sections"]
+
+        outline = [(s["level"], s["anchor"]) for s in iter_sections(tree)]
+        print(f"🌳 Outline: {outline}")
+        assert outline == [(1, "account-management"), (2, "1-invite-new-members"), (3, "example"),
+                           (2, "permissions-"), (3, "example-1")]
+
+        # Byte ranges: a section runs to the next heading at its level or above
+        root = tree[0]
+        assert raw[root["start"]:].startswith(b"# Account Management")
+        assert root["end"] == len(raw)
+        invite, permissions = root["children"]
+        assert raw[invite["start"]:invite["end"]].endswith(b"Invite example.\r\n")
+        assert permissions["end"] == len(raw)
+
+        # One section, read straight from its byte range
+        section = parser.get_section("Account-Management.md", "Permissions ✅")
+        print(f"📑 Permissions section: {section!r}")
+        assert section == ("## Permissions ✅\n| Role | Invite |\n|---|---|\n"
+                           "### Example\nPermission example.\n")
+        assert parser.get_section("Account-Management.md", "#example-1") == "### Example\nPermission example.\n"
+        assert parser.get_section("Account-Management.md", "example") == "### Example\nInvite example.\n"
+        assert parser.get_section("Account-Management.md", "Missing") is None
+        assert find_section(tree, "1. Invite new Members") is invite
+
+        # An unchanged page is never re-read or re-parsed to find a section
+        def no_reparse(*args):
+            raise AssertionError("page was parsed again")
+        parser._read_and_parse = no_reparse
+        assert parser.get_section("Account-Management.md", "permissions-") == section
+        del parser._read_and_parse
+
+        # Dashboard cards carry the tree so the full view can open one section
+        dashboard_card = FeedGenerator(parser).create_wiki_card("Account-Management.md")
+        assert dashboard_card["sections"] == tree
+        assert load_card_section(dashboard_card, "1-invite-new-members").startswith("## 1. Invite new Members\n")
+        assert load_card_section(card, "permissions-") == section
+
+    print("✅ Section tree test passed!")
+
+
+if __name__ == "__main__":
+    test_section_tree()
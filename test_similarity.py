@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+🧪 Test MinHash page signatures and near-duplicate collapsing in the feed
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+from pathlib import Path
+
+from wiki_engine.feed_generator import FeedGenerator
+from wiki_engine.similarity import MinHasher, SimilarityIndex, estimate_similarity
+from wiki_engine.tokenizer import MarkdownTokenizer
+from wiki_engine.wiki_parser import WikiParser
+
+ONBOARDING = "# Onboarding Guide\n" + "\n".join(
+    f"Step {i}: new engineers set up laptop number {i} and request access to service {i * 7}."
+    for i in range(60)
+) + "\n"
+
+# The same page copy-pasted with a couple of tweaks
+ONBOARDING_COPY = ONBOARDING.replace("# Onboarding Guide", "# Onboarding Guide (Old)").replace(
+    "Step 3:", "Step three:")
+
+RELEASES = "# Release Process\n" + "\n".join(
+    f"Release train {i} ships on Tuesday after QA signs off ticket {i * 13} for the mobile app."
+    for i in range(60)
+) + "\n"
+
+
+def signature_of(text: str) -> bytes:
+    tokenizer = MarkdownTokenizer(signature=True)
+    tokenizer.feed(text)
+    tokenizer.close()
+    return tokenizer.signature
+
+
+def test_similarity():
+    """
+    🚀 Copies cluster together, distinct pages stay apart, the feed folds copies
+    """
+    print("🧪 Testing near-duplicate detection with Monday Madness energy!")
+    print("=" * 60)
+
+    original, copy, releases = signature_of(ONBOARDING), signature_of(ONBOARDING_COPY), signature_of(RELEASES)
+    assert signature_of(ONBOARDING) == original  # Stable across runs and processes
+    print(f"📏 copy ≈ {estimate_similarity(original, copy):.2f}, other ≈ {estimate_similarity(original, releases):.2f}")
+    assert estimate_similarity(original, copy) >= 0.8
+    assert estimate_similarity(original, releases) < 0.3
+
+    # Batch boundaries do not change the signature
+    words = ONBOARDING.split()
+    hasher = MinHasher()
+    for start in range(0, len(words), 7):
+        hasher.update(words[start:start + 7])
+    whole = MinHasher()
+    whole.update(words)
+    assert hasher.signature() == whole.signature()
+    assert MinHasher().signature() is None
+
+    index = SimilarityIndex()
+    index.add_page("Onboarding.md", original)
+    index.add_page("Onboarding-Old.md", copy)
+    index.add_page("Releases.md", releases)
+    assert index.near_duplicates("Onboarding.md") == ["Onboarding-Old.md"]
+    assert index.clusters(["Releases.md", "Onboarding-Old.md", "Onboarding.md"]) == [
+        ["Onboarding-Old.md", "Onboarding.md"]]
+    assert index.remove_page("Onboarding-Old.md") and index.clusters() == []
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        wiki = Path(wiki_dir)
+        (wiki / "Onboarding.md").write_text(ONBOARDING)
+        (wiki / "Onboarding-Old.md").write_text(ONBOARDING_COPY)
+        (wiki / "Releases.md").write_text(RELEASES)
+
+        feed_gen = FeedGenerator(WikiParser(wiki_dir, cache_dir=None))
+        timeline = feed_gen.generate_activity_timeline()
+        collapsed = feed_gen.collapse_near_duplicates(timeline)
+        print(f"🗂️ {len(timeline)} cards -> {len(collapsed)} after collapsing")
+        assert len(collapsed) == 2
+        folded = [card for card in collapsed if card["duplicates"]]
+        assert len(folded) == 1 and len(folded[0]["duplicates"]) == 1
+
+        # The cached cards are untouched: an uncollapsed timeline and search show no duplicates
+        assert all(folded[0] is not card for card in feed_gen.feed_cache.values())
+        assert all(card["duplicates"] == [] for card in feed_gen.generate_activity_timeline())
+        assert all(card["duplicates"] == [] for card in feed_gen.search("onboarding", k=3))
+        assert feed_gen.collapse_near_duplicates(timeline) == collapsed  # Same result every rerun
+
+        # Rewriting the copy into its own page un-folds it on the next sync
+        (wiki / "Onboarding-Old.md").write_text(RELEASES.replace("Release", "Hotfix").replace("Tuesday", "Friday"))
+        feed_gen.apply_file_changes(["Onboarding-Old.md"])
+        assert len(feed_gen.collapse_near_duplicates(feed_gen.generate_activity_timeline())) == 3
+
+    print("✅ Similarity test passed!")
+
+
+if __name__ == "__main__":
+    test_similarity()
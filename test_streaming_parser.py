@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+🧪 Test streaming parser mode for very large wiki pages
+Monday Madness Quality Assurance!
+"""
+
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from wiki_engine.content_ref import load_card_content
+from wiki_engine.wiki_parser import WikiParser
+
+
+SECTION = (
+    "## Release {n}\r\n"
+    "\r\n"
+    "We implement user account management and API validation for release {n}. "
+    "Admins can invite members! Does it migrate the database?\r"
+    "- Manage invites for team {n}\n"
+    "1. Configure the [endpoint](https://docs.example.com/{n})\n"
+    "| Role | Edit |\n"
+    "```\n# not a heading\n```\n"
+)
+
+
+def _comparable(card):
+    card = dict(card)
+    card.pop("content_ref")
+    return card
+
+
+def test_streaming_parser():
+    """
+    🚀 Streamed pages produce the in-memory card with bounded memory
+    """
+    print("🧪 Testing streaming parser mode with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as wiki_dir:
+        page = Path(wiki_dir) / "Meeting-Notes.md"
+        page.write_bytes(("# Meeting Notes\n\n" + "".join(SECTION.format(n=n) for n in range(200))).encode("utf-8"))
+
+        in_memory = WikiParser(wiki_dir, cache_dir=None, stream_threshold=None)
+        streaming = WikiParser(wiki_dir, cache_dir=None, stream_threshold=0)
+
+        expected = in_memory.parse_markdown_to_card("Meeting-Notes.md")
+        streamed = streaming.parse_markdown_to_card("Meeting-Notes.md")
+        assert streamed["status"] == "success"
+        assert _comparable(streamed) == _comparable(expected)
+        print(f"✅ Same card: {streamed['title']} / {streamed['metadata']['metrics']['word_count']} words")
+
+        # Same digest, so an unchanged page is recognised without tokenizing
+        _, _, digest = in_memory._read_and_parse("Meeting-Notes.md")
+        card, _, streamed_digest = streaming._read_and_parse("Meeting-Notes.md", digest)
+        assert card is None and streamed_digest == digest
+
+        # The body cap stops on a line boundary in both modes
+        for parser in (WikiParser(wiki_dir, cache_dir=None, stream_threshold=None, body_limit=1000),
+                       WikiParser(wiki_dir, cache_dir=None, stream_threshold=0, body_limit=1000)):
+            body = load_card_content(parser.parse_markdown_to_card("Meeting-Notes.md"))
+            assert 0 < len(body) <= 1000 and body.endswith("\n")
+            assert page.read_text().startswith(body)
+
+        # Memory stays well below the page size when streaming a several-MB page
+        big = Path(wiki_dir) / "Generated-API.md"
+        with open(big, "w") as f:
+            f.write("# Generated API\n\n")
+            for n in range(60000):
+                f.write(f"The endpoint number {n} returns a JSON document describing the account.\n")
+        size = big.stat().st_size
+
+        tracemalloc.start()
+        card = streaming.parse_markdown_to_card("Generated-API.md")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"📏 {size // 1024} KB page streamed with a {peak // 1024} KB peak")
+        assert card["status"] == "success"
+        assert card["metadata"]["metrics"]["line_count"] == 60003
+        assert peak < size // 4
+
+    print("✅ Streaming parser test passed!")
+
+
+if __name__ == "__main__":
+    test_streaming_parser()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+🧪 Test syncing several wikis at once and merging them into one timeline
+Monday Madness Quality Assurance!
+"""
+
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from wiki_engine.feed_generator import MultiWikiFeed
+from wiki_engine.git_sync import GitSyncPool
+
+GIT_IDENTITY = ['-c', 'user.name=Wiki Bot', '-c', 'user.email=bot@example.com']
+FEATURES = "\n- Invite members by email\n- Manage roles and permissions\n"
+WIKIS = ["clients-hub", "food", "spa", "gym"]
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(['git', *GIT_IDENTITY, *args], cwd=repo, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def push_pages(seed: Path, pages: dict) -> None:
+    for name, text in pages.items():
+        (seed / name).write_text(text + FEATURES)
+    git(seed, 'add', '-A')
+    git(seed, 'commit', '-q', '-m', f'Update {", ".join(pages)}')
+    git(seed, 'push', '-q', 'origin', 'HEAD')
+
+
+def test_sync_pool():
+    """
+    🚀 N wikis sync in about the time of the slowest and share one timeline
+    """
+    print("🧪 Testing GitSyncPool and MultiWikiFeed with Monday Madness energy!")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        root = Path(root_dir)
+        seeds, clones = {}, {}
+        for name in WIKIS:
+            upstream, seeds[name], clones[name] = root / f"{name}.git", root / f"{name}-seed", root / name
+            git(root, 'init', '-q', '--bare', str(upstream))
+            git(root, 'clone', '-q', str(upstream), str(seeds[name]))
+            push_pages(seeds[name], {"Home.md": f"# {name} Home\nWelcome to {name}.\n",
+                                     f"{name.title()}-Guide.md": f"# {name} guide\nHow {name} works.\n"})
+            git(root, 'clone', '-q', str(upstream), str(clones[name]))
+
+        # One timeline over all wikis, with no clashing Home.md cards
+        feed = MultiWikiFeed.for_repositories(clones, cache_dir=str(root / "cache"))
+        timeline = feed.generate_activity_timeline()
+        assert len(timeline) == 2 * len(WIKIS)
+        assert len({card["id"] for card in timeline}) == len(timeline)
+        assert sorted({card["wiki"] for card in timeline}) == sorted(WIKIS)
+        assert "wiki_card_food_wiki_Home" in [card["id"] for card in timeline]
+        now = datetime.now()
+        scores = [feed.feeds[card["wiki"]]._ranking_score(card, now) for card in timeline]
+        assert scores == sorted(scores, reverse=True)  # Merged in rank order
+
+        # A wiki whose kept ranking was scored long ago still merges by today's scores
+        stale = feed.feeds["spa"]
+        stale._ranked_at = now - timedelta(days=30)
+        stale._rank_keys = {page: -stale._ranking_score(stale.feed_cache[page], stale._ranked_at)
+                            for page in stale._rank_keys}
+        stale._ranking = sorted((key, page) for page, key in stale._rank_keys.items())
+        merged = feed.generate_activity_timeline()
+        now = datetime.now()
+        scores = [feed.feeds[card["wiki"]]._ranking_score(card, now) for card in merged]
+        assert scores == sorted(scores, reverse=True) and len(merged) == len(timeline)
+        assert [score for score, _, _ in stale.ranked_items(now)] == sorted(
+            (stale._ranking_score(card, now) for card in stale.feed_cache.values()), reverse=True)
+        assert {card["wiki"] for card in feed.search("how works", k=8)} == set(WIKIS)
+
+        # Two wikis move upstream; one sync pulls everything and reports per repo
+        push_pages(seeds["food"], {"Menu.md": "# Menu\nDishes and prices.\n"})
+        push_pages(seeds["gym"], {"Home.md": "# gym Home\nNow with memberships.\n"})
+        pool = GitSyncPool(clones, max_workers=4)
+        result = pool.sync_all()
+        print(f"🔄 Changes: {result['changes']}, timings: {result['timings']}")
+        assert result["status"] == "success" and result["failed"] == []
+        assert result["changes"] == {"food": ["Menu.md"], "gym": ["Home.md"]}
+        assert set(result["repos"]) == set(WIKIS)
+        assert all(repo["duration"] >= 0 for repo in result["repos"].values())
+        assert result["timings"]["slowest_repo"] in WIKIS
+
+        applied = feed.apply_sync(result)
+        assert applied["food"]["updated"] == ["Menu.md"] and set(applied) == {"food", "gym"}
+        timeline = feed.generate_activity_timeline()
+        assert len(timeline) == 2 * len(WIKIS) + 1
+        assert "Menu" in [card["title"] for card in timeline if card["wiki"] == "food"]
+
+        # Slow remotes (each pull stalls 0.5s): workers overlap them, and the bound holds
+        for name in WIKIS:
+            git(clones[name], 'remote', 'set-url', 'origin', f'ssh://{name}.example.invalid/wiki.git')
+            git(clones[name], 'config', 'core.sshCommand', "sh -c 'sleep 0.5; exit 1' --")
+
+        parallel = pool.sync_all()
+        print(f"⏱️ 4 workers: wall {parallel['timings']['wall_time']:.2f}s, "
+              f"summed {parallel['timings']['total_repo_time']:.2f}s")
+        assert parallel["status"] == "error" and sorted(parallel["failed"]) == sorted(WIKIS)
+        assert parallel["timings"]["total_repo_time"] >= 2.0
+        assert parallel["timings"]["wall_time"] < parallel["timings"]["slowest_time"] + 0.5
+
+        bounded = GitSyncPool(clones, max_workers=2).sync_all()
+        print(f"⏱️ 2 workers: wall {bounded['timings']['wall_time']:.2f}s")
+        assert bounded["timings"]["wall_time"] >= 1.0  # Two rounds of two
+
+        # One healthy wiki among broken ones is a partial sync
+        git(clones["spa"], 'remote', 'set-url', 'origin', str(root / "spa.git"))
+        partial = pool.sync_all()
+        assert partial["status"] == "partial" and "spa" not in partial["failed"]
+        assert partial["repos"]["spa"]["status"] == "success" and partial["changes"] == {}
+        pool.close()
+
+    print("✅ GitSyncPool test passed!")
+
+
+if __name__ == "__main__":
+    test_sync_pool()
@@ -6,8 +6,13 @@ Monday Madness Implementation - Making Documentation ALIVE!
 """
 
 from .wiki_parser import WikiParser
-from .git_sync import GitSyncEngine
-from .feed_generator import FeedGenerator
+from .git_sync import GitSyncEngine, GitSyncPool
+from .feed_generator import FeedGenerator, MultiWikiFeed
+from .card_model import FeedCard
+from .search_index import SearchIndex
+from .link_graph import LinkGraph
+from .permissions_matrix import PermissionsMatrix
+from .similarity import SimilarityIndex
 from .card_components import WikiCard, ExpandableCard, ActionButton
 
 __version__ = "1.0.0"
@@ -17,7 +22,14 @@ __author__ = "SuperApp Team - Monday Madness Session"
 __all__ = [
     "WikiParser",
     "GitSyncEngine", 
+    "GitSyncPool",
     "FeedGenerator",
+    "MultiWikiFeed",
+    "FeedCard",
+    "SearchIndex",
+    "LinkGraph",
+    "PermissionsMatrix",
+    "SimilarityIndex",
     "WikiCard",
     "ExpandableCard",
     "ActionButton"
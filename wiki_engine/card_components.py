@@ -15,10 +15,12 @@ except ImportError:
     class MockStreamlit:
         def container(self): return self
         def markdown(self, text, **kwargs): pass
+        def html(self, body): pass
         def info(self, text): pass
         def json(self, data): pass
         def columns(self, cols): return [self] * (cols if isinstance(cols, int) else len(cols))
         def button(self, label, **kwargs): return False
+        def selectbox(self, label, options, **kwargs): return options[0] if options else None
         def progress(self, value): pass
         def metric(self, label, value): pass
         def __enter__(self): return self
@@ -29,6 +31,10 @@ except ImportError:
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from .content_ref import load_card_content, load_card_section
+from .html_renderer import default_render_cache
+from .section_tree import iter_sections
+
 class WikiCard:
     """
     🎴 Base wiki card component for documentation display
@@ -80,6 +86,18 @@ class WikiCard:
                 with col3:
                     st.metric("Read Time", read_time)
                 
+                # Pages that link here
+                referenced_by = self.data.get('referenced_by', [])
+                if referenced_by:
+                    names = [page.rsplit('/', 1)[-1].replace('.md', '').replace('-', ' ') for page in referenced_by]
+                    st.markdown(f"*Referenced by: {', '.join(names)}*")
+                
+                # Near-duplicate pages folded into this card
+                duplicates = self.data.get('duplicates', [])
+                if duplicates:
+                    st.markdown(f"*Also covers {len(duplicates)} similar page{'s' if len(duplicates) != 1 else ''}: "
+                                f"{', '.join(duplicates)}*")
+                
                 # Action buttons - clean labels
                 col1, col2 = st.columns(2)
                 with col1:
@@ -121,11 +139,21 @@ class WikiCard:
                 read_time = self.data.get('content_stats', {}).get('read_time', 'Unknown')
                 st.metric("⏱️ Read Time", read_time)
             
-            # Full content
-            content = self.data.get('content', '')
+            # Long pages can be read one section at a time
+            titles = {"": "Whole page"}
+            for section in iter_sections(self.data.get('sections', [])):
+                titles[section["anchor"]] = "\u2003" * (section["level"] - 1) + section["title"]
+            anchor = ""
+            if len(titles) > 2:
+                anchor = st.selectbox("📑 Section", list(titles), format_func=titles.get,
+                                      key=f"section_{card_id}")
+            
+            # Full content (read from disk on demand - cards only carry a ContentRef),
+            # rendered to HTML once per content hash so reruns skip the conversion
+            content = load_card_section(self.data, anchor) if anchor else load_card_content(self.data)
             if content:
                 st.markdown("## 📄 Full Documentation")
-                st.markdown(content)
+                st.html(default_render_cache().render(content))
             else:
                 st.info("No detailed content available")
             
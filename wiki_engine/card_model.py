@@ -0,0 +1,128 @@
+"""
+FeedCard - Slotted Dashboard Cards That Still Read Like Dicts
+"""
+
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+# Values stored on the card itself
+STORED_FIELDS = (
+    "id", "title", "summary", "content_ref", "content_preview", "timestamp", "author",
+    "type", "expanded", "actions", "engagement_score", "priority", "features", "metrics",
+    "style_class", "icon", "sections", "referenced_by", "duplicates", "wiki",
+)
+
+# Values computed from the stored ones when asked for
+DERIVED_FIELDS = {
+    "expandable": lambda card: True,
+    "monday_madness_level": lambda card: card.metrics["engagement_potential"],
+    "content_stats": lambda card: {
+        "read_time": f"{card.metrics['estimated_read_time']} min read",
+        "complexity": card.metrics["complexity_score"],
+        "feature_count": card.metrics["feature_count"],
+        "word_count": card.metrics["word_count"]
+    },
+}
+
+# Same key order the dict cards always had
+CARD_KEYS = (
+    "id", "title", "summary", "content_ref", "content_preview", "timestamp", "author", "type",
+    "expandable", "expanded", "actions", "engagement_score", "priority", "features", "metrics",
+    "style_class", "icon", "monday_madness_level", "content_stats", "sections", "referenced_by",
+    "duplicates", "wiki",
+)
+
+# Small, endlessly repeated strings - one shared copy each
+INTERNED_FIELDS = frozenset(["type", "priority", "author", "style_class", "icon"])
+
+
+class FeedCard(Mapping):
+    """
+    🃏 One dashboard card: a slot per field, derived fields computed on read
+
+    Behaves like the card dicts it replaces (card["title"], card.get("icon"),
+    "features" in card, dict(card)), so WikiCard and the dashboard need no
+    changes. Features and metrics are stored once instead of being copied
+    into content_stats and metadata, and repeated strings such as type,
+    priority and style class are interned.
+    """
+
+    __slots__ = STORED_FIELDS
+
+    def __init__(self, id: str, title: str, summary: str, content_ref: Any, content_preview: str,
+                 timestamp: datetime, author: str, type: str, actions: List[Dict], engagement_score: int,
+                 priority: str, features: List[str], metrics: Dict, style_class: str, icon: str,
+                 expanded: bool = False, sections: Optional[List[Dict]] = None,
+                 referenced_by: Optional[List[str]] = None, duplicates: Optional[List[str]] = None,
+                 wiki: Optional[str] = None):
+        self.id = id
+        self.title = title
+        self.summary = summary
+        self.content_ref = content_ref
+        self.content_preview = content_preview
+        self.timestamp = timestamp
+        self.author = sys.intern(author)
+        self.type = sys.intern(type)
+        self.expanded = expanded
+        self.actions = actions
+        self.engagement_score = engagement_score
+        self.priority = sys.intern(priority)
+        self.features = features
+        self.metrics = metrics
+        self.style_class = sys.intern(style_class)
+        self.icon = sys.intern(icon)
+        self.sections = sections if sections is not None else []
+        self.referenced_by = referenced_by if referenced_by is not None else []
+        self.duplicates = duplicates if duplicates is not None else []
+        self.wiki = wiki  # Which wiki the page belongs to, when feeds are merged
+
+    def __getitem__(self, key: str) -> Any:
+        if key in STORED_FIELDS:
+            return getattr(self, key)
+        derive = DERIVED_FIELDS.get(key)
+        if derive is None:
+            raise KeyError(key)
+        return derive(self)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in STORED_FIELDS:
+            raise KeyError(f"{key!r} is not a stored card field")
+        setattr(self, key, sys.intern(value) if key in INTERNED_FIELDS else value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in STORED_FIELDS or key in DERIVED_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CARD_KEYS)
+
+    def __len__(self) -> int:
+        return len(CARD_KEYS)
+
+    def copy(self, **changes: Any) -> "FeedCard":
+        """
+        📄 Shallow copy with some stored fields replaced (the original is left alone)
+        """
+        fields = {field: getattr(self, field) for field in STORED_FIELDS}
+        fields.update(changes)
+        return FeedCard(**fields)
+
+    def to_dict(self) -> Dict:
+        """
+        📦 Plain dict copy (the old card shape) for serialisation
+        """
+        return {key: self[key] for key in CARD_KEYS}
+
+    def __repr__(self) -> str:
+        return f"FeedCard(id={self.id!r}, type={self.type!r}, priority={self.priority!r})"
+
+    def __reduce__(self):
+        return (_restore_card, ({field: getattr(self, field) for field in STORED_FIELDS},))
+
+
+def _restore_card(fields: Dict) -> "FeedCard":
+    """
+    📥 Unpickle a FeedCard (re-interning its repeated strings)
+    """
+    return FeedCard(**fields)
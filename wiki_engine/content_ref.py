@@ -0,0 +1,89 @@
+"""
+ContentRef - Point at Page Bodies Instead of Carrying Them Around
+"""
+
+from typing import Dict, Optional
+
+from .section_tree import find_section
+
+
+class ContentRef:
+    """
+    📎 Lightweight handle to a page body (or a byte range of it) on disk
+
+    Cards hold one of these instead of the full markdown so every session's
+    feed stays small; the text is only read when a card is expanded.
+    """
+
+    __slots__ = ("path", "start", "end")
+
+    def __init__(self, path: str, start: int = 0, end: Optional[int] = None):
+        self.path = path
+        self.start = start
+        self.end = end
+
+    def read(self) -> str:
+        """
+        📖 Load the referenced text (empty string if the page is gone)
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.start)
+                data = f.read() if self.end is None else f.read(max(0, self.end - self.start))
+        except OSError:
+            return ""
+
+        return decode_page_text(data)
+
+    def slice(self, start: int, end: Optional[int]) -> "ContentRef":
+        """
+        ✂️ A ref to a byte range of the same page (e.g. one section)
+        """
+        return ContentRef(self.path, start, end)
+
+    def __repr__(self) -> str:
+        return f"ContentRef({self.path!r}, {self.start}, {self.end})"
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, ContentRef)
+                and (self.path, self.start, self.end) == (other.path, other.start, other.end))
+
+    def __hash__(self) -> int:
+        return hash((self.path, self.start, self.end))
+
+
+def decode_page_text(data: bytes) -> str:
+    """
+    🔤 Page bytes as text with Unix line endings
+    """
+    text = data.decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def load_card_content(card: Dict) -> str:
+    """
+    📄 Full markdown for a card, whether it carries the text or a ContentRef
+    """
+    content = card.get("content")
+    if content:
+        return content
+
+    content_ref = card.get("content_ref")
+    return content_ref.read() if content_ref is not None else ""
+
+
+def load_card_section(card: Dict, anchor: str) -> Optional[str]:
+    """
+    📑 Just one section of a card's page (None if the page has no such section)
+    """
+    sections = card.get("sections")
+    if sections is None:
+        sections = card.get("metadata", {}).get("sections", [])
+    section = find_section(sections, anchor)
+
+    content_ref = card.get("content_ref")
+    if section is None or content_ref is None:
+        return None
+    return content_ref.slice(section["start"], section["end"]).read()
@@ -0,0 +1,170 @@
+"""
+CorpusSummarizer - Pick Each Page's Most Distinctive Sentence, Wiki-Wide
+"""
+
+import math
+from typing import Dict, List, Optional
+
+# NumPy is optional - without it the same scoring runs in plain Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .tokenizer import TERM_PATTERN
+
+SUMMARY_MAX_LENGTH = 150
+
+
+class CorpusSummarizer:
+    """
+    📚 TF-IDF sentence scoring across every page at once
+
+    Each page contributes its candidate summary sentences. Document
+    frequencies are counted per page and adjusted incrementally as pages
+    are added, changed or removed. Summarizing rescores every candidate
+    sentence in the wiki as one sparse TF-IDF matrix (COO arrays):
+
+        weight(sentence, term) = (1 + log tf) * idf(term)
+        score(sentence)        = sum of weights / sqrt(terms in sentence)
+
+    and keeps each page's top sentence. Terms that appear on every page
+    score low, so the winner is the sentence that sets the page apart.
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else (use_numpy and NUMPY_AVAILABLE)
+
+        self._term_ids: Dict[str, int] = {}
+        self._df: List[int] = []
+
+        # page -> (sentences, rows, terms, counts, sentence lengths, distinct terms)
+        self._pages: Dict[str, tuple] = {}
+        self._best: Optional[Dict[str, str]] = None
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page: object) -> bool:
+        return page in self._pages
+
+    def update_page(self, page: str, sentences: List[str]) -> None:
+        """
+        🔁 Add a page or replace its candidate sentences
+        """
+        self.remove_page(page)
+
+        pair_counts: Dict[tuple, int] = {}
+        lengths = []
+        for row, sentence in enumerate(sentences):
+            terms = TERM_PATTERN.findall(sentence.lower())
+            lengths.append(len(terms))
+            for term in terms:
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = self._term_ids[term] = len(self._df)
+                    self._df.append(0)
+                pair_counts[row, term_id] = pair_counts.get((row, term_id), 0) + 1
+
+        distinct = {term_id for _, term_id in pair_counts}
+        for term_id in distinct:
+            self._df[term_id] += 1
+
+        # One sparse (row, term, tf) triple per distinct term of each sentence
+        rows = [row for row, _ in pair_counts]
+        terms = [term_id for _, term_id in pair_counts]
+        counts = list(pair_counts.values())
+        if self.use_numpy:
+            rows, terms = np.array(rows, dtype=np.int64), np.array(terms, dtype=np.int64)
+            counts, lengths = np.array(counts, dtype=np.float64), np.array(lengths, dtype=np.float64)
+
+        self._pages[page] = (list(sentences), rows, terms, counts, lengths, distinct)
+        self._best = None
+
+    def remove_page(self, page: str) -> bool:
+        """
+        ➖ Forget a page and its term statistics; True if it was there
+        """
+        entry = self._pages.pop(page, None)
+        if entry is None:
+            return False
+
+        for term_id in entry[5]:
+            self._df[term_id] -= 1
+        self._best = None
+        return True
+
+    def summaries(self, max_length: int = SUMMARY_MAX_LENGTH) -> Dict[str, str]:
+        """
+        🎯 page -> its most distinctive sentence (pages without candidates are left out)
+        """
+        if self._best is None:
+            self._best = self._score_numpy() if self.use_numpy else self._score_python()
+
+        return {page: self._truncate(sentence, max_length) for page, sentence in self._best.items()}
+
+    def summary(self, page: str, max_length: int = SUMMARY_MAX_LENGTH) -> Optional[str]:
+        """
+        📝 Summary for one page, or None if it has no candidate sentences
+        """
+        if self._best is None:
+            self.summaries()
+        sentence = self._best.get(page)
+        return self._truncate(sentence, max_length) if sentence is not None else None
+
+    # Helper methods for CorpusSummarizer
+
+    def _idf(self, df: float) -> float:
+        # Smoothed idf: a term on every page still weighs a little
+        return math.log((1 + len(self._pages)) / (1 + df)) + 1
+
+    def _score_numpy(self) -> Dict[str, str]:
+        """
+        ⚡ Score every candidate sentence in the wiki in one batched computation
+        """
+        pages = [page for page, entry in self._pages.items() if entry[0]]
+        if not pages:
+            return {}
+        entries = [self._pages[page] for page in pages]
+
+        # Row offsets turn page-local sentence rows into global matrix rows
+        sentence_counts = np.array([len(entry[0]) for entry in entries], dtype=np.int64)
+        row_offsets = np.cumsum(sentence_counts) - sentence_counts
+        triples = np.array([len(entry[1]) for entry in entries], dtype=np.int64)
+
+        rows = np.concatenate([entry[1] for entry in entries]) + np.repeat(row_offsets, triples)
+        terms = np.concatenate([entry[2] for entry in entries])
+        counts = np.concatenate([entry[3] for entry in entries])
+        lengths = np.concatenate([entry[4] for entry in entries])
+
+        idf = np.log((1 + len(self._pages)) / (1 + np.array(self._df, dtype=np.float64))) + 1
+        weights = (1 + np.log(counts)) * idf[terms]
+        scores = np.bincount(rows, weights=weights, minlength=len(lengths)) / np.sqrt(np.maximum(lengths, 1))
+
+        # Best row per page: sort by (page, -score); the stable sort keeps the earliest tie first
+        page_of_row = np.repeat(np.arange(len(pages)), sentence_counts)
+        order = np.lexsort((-scores, page_of_row))
+        best_rows = order[row_offsets] - row_offsets
+
+        return {page: entry[0][best] for page, entry, best in zip(pages, entries, best_rows.tolist())}
+
+    def _score_python(self) -> Dict[str, str]:
+        """
+        🐍 Same scoring as _score_numpy, one sentence at a time
+        """
+        best = {}
+        for page, (sentences, rows, terms, counts, lengths, _) in self._pages.items():
+            if not sentences:
+                continue
+            scores = [0.0] * len(sentences)
+            for row, term_id, count in zip(rows, terms, counts):
+                scores[row] += (1 + math.log(count)) * self._idf(self._df[term_id])
+            scores = [score / math.sqrt(max(length, 1)) for score, length in zip(scores, lengths)]
+            best[page] = sentences[max(range(len(sentences)), key=lambda row: (scores[row], -row))]
+        return best
+
+    def _truncate(self, sentence: str, max_length: int) -> str:
+        if len(sentence) > max_length:
+            return sentence[:max_length - 3] + "..."
+        return sentence
@@ -2,10 +2,35 @@
 FeedGenerator - Transform Wiki Content into Dashboard Cards
 """
 
+import bisect
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .card_model import FeedCard
+from .corpus_summarizer import CorpusSummarizer
+from .git_history import GitHistoryIndex
+from .link_graph import LinkGraph
+from .parse_cache import DEFAULT_CACHE_DIR
+from .permissions_matrix import PermissionsIndex
+from .search_index import SearchIndex
+from .similarity import SimilarityIndex
 from .wiki_parser import WikiParser
 
+# Saved next to the parse cache
+SEARCH_INDEX_FILE = "search_index.bin"
+
+# Ranking weights, shared by every _ranking_score call
+PRIORITY_WEIGHTS = {"high": 3, "medium": 2, "low": 1}
+TYPE_WEIGHTS = {
+    "permissions_matrix": 10,  # Always important
+    "account_management": 8,   # Core functionality
+    "user_system": 6,         # User-facing features
+    "api_documentation": 4,    # Technical docs
+    "welcome": 2,             # Nice to have
+    "general_documentation": 3 # Default
+}
+
 class FeedGenerator:
     """
     🎨 The artist that creates beautiful dashboard cards from wiki content
@@ -13,9 +38,41 @@ class FeedGenerator:
     Monday Madness Level: CREATIVE GENIUS! 🎪
     """
     
-    def __init__(self, wiki_parser: Optional[WikiParser] = None):
+    def __init__(self, wiki_parser: Optional[WikiParser] = None, workers: Optional[int] = None,
+                 wiki_name: Optional[str] = None):
         self.parser = wiki_parser or WikiParser()
         self.feed_cache = {}
+        self.workers = workers
+        
+        # Set when this feed is one of several merged ones: tags cards, keeps ids unique
+        self.wiki_name = wiki_name
+        self._actions_by_type = {}
+        
+        # Full-text search over every page, persisted alongside the parse cache
+        cache = getattr(self.parser, "cache", None)
+        self.search_index = SearchIndex(str(cache.cache_dir / SEARCH_INDEX_FILE) if cache is not None else None)
+        self.parser.collect_search_docs = True  # Indexed from the parser's own tokens, not a second read
+        
+        # Internal links between pages, kept current as pages change
+        self.link_graph = LinkGraph()
+        
+        # Wiki-wide TF-IDF summaries; term statistics follow page changes
+        self.summarizer = CorpusSummarizer()
+        
+        # Role x permission tables, rebuilt only for pages that change
+        self.permissions = PermissionsIndex()
+        
+        # MinHash signatures in an LSH index, for collapsing near-duplicate pages
+        self.similarity = SimilarityIndex()
+        
+        # Authors and edit counts from one batched git log, advanced on every sync
+        self.history = GitHistoryIndex(self.parser.wiki_dir)
+        
+        # Ranked timeline kept between rebuilds: sorted (-score, wiki_page) pairs
+        self._ranking = None
+        self._rank_keys = {}
+        self._ranked_at = None
+        self._index_version = 0
         
     def create_wiki_card(self, wiki_page: str) -> Dict:
         """
@@ -28,109 +85,234 @@ class FeedGenerator:
             Dict containing card HTML, metadata, and actions
         """
         # Parse the wiki page using our WikiParser
-        card_data = self.parser.parse_markdown_to_card(wiki_page)
+        return self._build_dashboard_card(wiki_page, self.parser.parse_markdown_to_card(wiki_page))
+    
+    def generate_activity_timeline(self) -> List[Dict]:
+        """
+        📅 Generate chronological activity timeline from all wiki content
         
-        if card_data["status"] != "success":
-            return self._create_error_card(wiki_page, card_data.get("error", "Unknown error"))
+        The ranked timeline is kept between calls and patched by
+        apply_file_changes (for sync change sets and for pages the file
+        index saw appear, change or disappear); clearing feed_cache forces
+        a full rebuild.
+        """
+        if self._ranking is not None and self.feed_cache:
+            file_index = self.parser.file_index
+            file_index.refresh()
+            changed_pages = file_index.changes_since(self._index_version)
+            
+            if changed_pages is not None:
+                self._index_version = file_index.version
+                if changed_pages:
+                    self.apply_file_changes(changed_pages)
+                return [self.feed_cache[wiki_page] for _, wiki_page in self._ranking]
         
-        # Generate engagement score based on content metrics
-        metrics = card_data["metadata"]["metrics"]
-        engagement_score = self._calculate_engagement_score(metrics)
+        ranked_pages = []
         
-        # Determine card priority and styling
-        priority = self._determine_card_priority(card_data["type"], engagement_score)
+        # Whole history in one git log before any card needs an author
+        self.history.update()
         
-        # Generate contextual action buttons
-        actions = self.generate_action_buttons(card_data["type"])
-        
-        # Create the final dashboard card
-        dashboard_card = {
-            "id": f"wiki_card_{card_data['id']}",
-            "title": card_data["title"],
-            "summary": card_data["summary"],
-            "content": card_data["content"],
-            "content_preview": self._create_content_preview(card_data["content"]),
-            "timestamp": card_data["timestamp"],
-            "author": self._extract_author_from_git(wiki_page),
-            "type": card_data["type"],
-            "expandable": True,
-            "expanded": False,
-            "actions": actions,
-            "engagement_score": engagement_score,
-            "priority": priority,
-            "features": card_data["metadata"]["features"],
-            "metrics": metrics,
-            "style_class": self._get_card_style_class(card_data["type"], priority),
-            "icon": self._get_card_icon(card_data["type"]),
-            "monday_madness_level": metrics["engagement_potential"],
-            "content_stats": {
-                "read_time": f"{metrics['estimated_read_time']} min read",
-                "complexity": metrics["complexity_score"],
-                "feature_count": metrics["feature_count"],
-                "word_count": metrics["word_count"]
-            }
-        }
+        # Get all wiki files and parse them in bulk (cache misses fan out to worker processes)
+        filenames = self.parser.list_wiki_pages()
+        self._index_version = self.parser.file_index.version
+        parsed_pages = self.parser.parse_all(filenames, workers=self.workers)
         
-        # Cache the card for performance
-        self.feed_cache[wiki_page] = dashboard_card
+        for filename, card_data in zip(filenames, parsed_pages):
+            self._track_page(filename, card_data)
+            search_doc = self.parser.take_search_doc(filename)
+            
+            # Create card for each wiki file
+            card = self._build_dashboard_card(filename, card_data)
+            
+            if card.get("engagement_score", 0) > 0:  # Only include valid cards
+                ranked_pages.append(filename)
+                self._index_page(filename, card, search_doc)
         
-        return dashboard_card
+        # Pages gone since the saved index was written
+        for wiki_page in set(self.search_index.pages) - set(ranked_pages):
+            self.search_index.remove_page(wiki_page)
+        self.search_index.save()
+        
+        # Backlinks are only complete once every page is in the graph
+        for wiki_page in set(self.link_graph.pages) - set(filenames):
+            self._untrack_page(wiki_page)
+        self._refresh_references(ranked_pages)
+        self._refresh_summaries()
+        
+        # Sort by priority and recency, remembering the ranking so later
+        # syncs only re-rank what changed
+        self._ranked_at = datetime.now()
+        self._rank_keys = {
+            wiki_page: -self._ranking_score(self.feed_cache[wiki_page], self._ranked_at)
+            for wiki_page in ranked_pages
+        }
+        self._ranking = sorted((key, wiki_page) for wiki_page, key in self._rank_keys.items())
+        
+        return [self.feed_cache[wiki_page] for _, wiki_page in self._ranking]
     
-    def generate_activity_timeline(self) -> List[Dict]:
+    def apply_file_changes(self, changed_files: List[str]) -> Dict:
         """
-        📅 Generate chronological activity timeline from all wiki content
+        🔁 Incrementally update the feed from a sync change set
+        
+        Only added/modified markdown pages are re-parsed and deleted pages are
+        dropped; the rest of the ranked timeline is left untouched. Git
+        history advances by the new commits only (one git log per call), and
+        pages those commits touched are refreshed too so their authors move.
+        
+        Args:
+            changed_files: Repo-relative paths, e.g. GitSyncEngine's files_updated
+            
+        Returns:
+            Dict listing updated and removed pages
         """
-        timeline = []
+        updated, removed = [], []
+        relinked = set()
         
-        # Get all wiki files
-        wiki_files = self.parser.get_all_wiki_files()
+        # (A first read covers the whole log - every page, not just new edits)
+        incremental_history = self.history.head is not None
+        history_changed = self.history.update()
+        if incremental_history:
+            changed_files = list(dict.fromkeys([*changed_files, *sorted(history_changed)]))
         
-        for wiki_file in wiki_files:
-            filename = wiki_file.name
+        for wiki_page in changed_files:
+            if not wiki_page.endswith('.md'):
+                continue
             
-            # Create card for each wiki file
-            card = self.create_wiki_card(filename)
+            self._unrank(wiki_page)
             
-            if card.get("engagement_score", 0) > 0:  # Only include valid cards
-                timeline.append(card)
+            if (self.parser.wiki_dir / wiki_page).exists():
+                card_data = self.parser.parse_markdown_to_card(wiki_page)
+                search_doc = self.parser.take_search_doc(wiki_page)
+                relinked |= self._track_page(wiki_page, card_data)
+                card = self._build_dashboard_card(wiki_page, card_data)
+                if card.get("engagement_score", 0) > 0:
+                    self._rank(wiki_page, card)
+                    self._index_page(wiki_page, card, search_doc)
+                else:
+                    self.feed_cache.pop(wiki_page, None)
+                    self.search_index.remove_page(wiki_page)
+                updated.append(wiki_page)
+            else:
+                self.feed_cache.pop(wiki_page, None)
+                self.parser.invalidate(wiki_page)
+                self.search_index.remove_page(wiki_page)
+                relinked |= self._untrack_page(wiki_page)
+                removed.append(wiki_page)
+        
+        self.search_index.save()
+        
+        # "Referenced by" moves on the pages whose inbound links changed
+        self._refresh_references(relinked)
+        
+        # Term weights shift with every page, so every summary is rescored (one batch)
+        if updated or removed:
+            self._refresh_summaries()
+        
+        return {
+            "updated": updated,
+            "removed": removed,
+            "total_cards": len(self.feed_cache)
+        }
+    
+    def search(self, query: str, k: int = 10) -> List[Dict]:
+        """
+        🔎 Cards for the k pages that best match a query (BM25), best first
+        """
+        if self._ranking is None:
+            self.generate_activity_timeline()
+        
+        return [self.feed_cache[wiki_page] for wiki_page, _ in self.search_index.search_pages(query, k)
+                if wiki_page in self.feed_cache]
+    
+    def roles_with_permission(self, permission: str, wiki_page: Optional[str] = None) -> List[str]:
+        """
+        👥 Which roles have a permission, from the wiki's permission matrices
+        """
+        if self._ranking is None:
+            self.generate_activity_timeline()
+        return self.permissions.roles_with(permission, wiki_page)
+    
+    def permissions_for_role(self, role: str, wiki_page: Optional[str] = None) -> List[str]:
+        """
+        📋 What a role can do, from the wiki's permission matrices
+        """
+        if self._ranking is None:
+            self.generate_activity_timeline()
+        return self.permissions.permissions_of(role, wiki_page)
+    
+    def collapse_near_duplicates(self, cards: List[Dict], threshold: Optional[float] = None) -> List[Dict]:
+        """
+        👯 Fold each cluster of near-duplicate pages into its first card
         
-        # Sort by priority and recency
-        sorted_timeline = self.sort_by_priority_and_recency(timeline)
+        Clusters come from the LSH similarity index, so only pages that
+        share a signature band are ever compared. The kept card comes back
+        as a copy listing the folded pages' titles under "duplicates", so
+        the cached cards (and search results, or a later uncollapsed
+        timeline) never show them; order is preserved.
+        """
+        page_by_id = {card["id"]: wiki_page for wiki_page, card in self.feed_cache.items()}
+        pages = [page_by_id.get(card.get("id")) for card in cards]
+        
+        folded = {}
+        for cluster in self.similarity.clusters([page for page in pages if page is not None], threshold):
+            folded[cluster[0]] = cluster[1:]
+            folded.update((page, None) for page in cluster[1:])
+        
+        collapsed = []
+        for wiki_page, card in zip(pages, cards):
+            duplicates = folded.get(wiki_page, [])
+            if duplicates is None:
+                continue
+            if duplicates:
+                titles = [self.feed_cache[page]["title"] for page in duplicates]
+                card = card.copy(duplicates=titles) if isinstance(card, FeedCard) else {**card, "duplicates": titles}
+            collapsed.append(card)
+        return collapsed
+    
+    def page_history(self, wiki_page: str) -> Optional[Dict]:
+        """
+        📜 Last author, last commit, edit count and first-seen time of a page
+        """
+        if self._ranking is None:
+            self.generate_activity_timeline()
         
-        return sorted_timeline
+        return self.history.get(wiki_page)
+    
+    def link_report(self) -> Dict:
+        """
+        🕸️ Orphan pages and broken internal links across the wiki
+        """
+        if self._ranking is None:
+            self.generate_activity_timeline()
+        
+        return {
+            "orphans": self.link_graph.orphans(),
+            "broken_links": self.link_graph.broken_links()
+        }
     
     def sort_by_priority_and_recency(self, cards: List[Dict]) -> List[Dict]:
         """
         🎯 Smart sorting: most important and recent content first
         """
-        def sort_key(card):
-            # Multi-factor sorting algorithm
-            engagement = card.get("engagement_score", 0)
-            priority_weight = {"high": 3, "medium": 2, "low": 1}.get(card.get("priority", "low"), 1)
-            
-            # Timestamp recency (more recent = higher score)
-            timestamp = card.get("timestamp", datetime.now())
-            hours_old = (datetime.now() - timestamp).total_seconds() / 3600
-            recency_score = max(0, 100 - hours_old)  # Decay over time
-            
-            # Type importance weights
-            type_weights = {
-                "permissions_matrix": 10,  # Always important
-                "account_management": 8,   # Core functionality
-                "user_system": 6,         # User-facing features
-                "api_documentation": 4,    # Technical docs
-                "welcome": 2,             # Nice to have
-                "general_documentation": 3 # Default
-            }
-            type_weight = type_weights.get(card.get("type", "general_documentation"), 3)
-            
-            # Final score calculation
-            total_score = (engagement * 0.4) + (recency_score * 0.3) + (priority_weight * type_weight * 0.3)
-            
-            return total_score
+        now = datetime.now()
         
         # Sort in descending order (highest score first)
-        return sorted(cards, key=sort_key, reverse=True)
+        return sorted(cards, key=lambda card: self._ranking_score(card, now), reverse=True)
+    
+    def ranked_items(self, now: Optional[datetime] = None) -> List[Tuple[float, str, Dict]]:
+        """
+        🏅 (score, wiki page, card) for every timeline card, best first, scored against now
+        
+        The kept ranking scores recency as of its last full rebuild; pass one
+        shared now to compare this feed's cards with another feed's.
+        """
+        self.generate_activity_timeline()
+        now = now or datetime.now()
+        
+        items = [(self._ranking_score(self.feed_cache[wiki_page], now), wiki_page, self.feed_cache[wiki_page])
+                 for _, wiki_page in self._ranking]
+        items.sort(key=lambda item: (-item[0], item[1]))
+        return items
     
     def create_expandable_content(self, full_markdown: str) -> Dict:
         """
@@ -198,6 +380,162 @@ class FeedGenerator:
     
     # Helper methods for FeedGenerator
     
+    def _build_dashboard_card(self, wiki_page: str, card_data: Dict) -> Dict:
+        """
+        🧱 Turn parsed page data into a dashboard card and cache it
+        """
+        if card_data["status"] != "success":
+            return self._create_error_card(wiki_page, card_data.get("error", "Unknown error"))
+        
+        # Generate engagement score based on content metrics
+        metrics = card_data["metadata"]["metrics"]
+        engagement_score = self._calculate_engagement_score(metrics)
+        
+        # Determine card priority and styling
+        priority = self._determine_card_priority(card_data["type"], engagement_score)
+        
+        # Explicit front matter beats the heuristics
+        front_matter = card_data["metadata"].get("front_matter", {})
+        if str(front_matter.get("priority", "")).lower() in PRIORITY_WEIGHTS:
+            priority = str(front_matter["priority"]).lower()
+        
+        # Contextual action buttons - one shared list per card type
+        actions = self._actions_by_type.get(card_data["type"])
+        if actions is None:
+            actions = self._actions_by_type[card_data["type"]] = self.generate_action_buttons(card_data["type"])
+        
+        # Create the final dashboard card (content_stats and the energy
+        # level are derived from metrics when read, not stored twice)
+        dashboard_card = FeedCard(
+            id=f"wiki_card_{self.wiki_name}_{card_data['id']}" if self.wiki_name else f"wiki_card_{card_data['id']}",
+            title=card_data["title"],
+            summary=card_data["summary"],
+            content_ref=card_data["content_ref"],  # Body is loaded only when the card is opened
+            content_preview=self._create_content_preview(card_data["preview_lines"]),
+            timestamp=card_data["timestamp"],
+            author=str(front_matter.get("author") or self._extract_author_from_git(wiki_page)),
+            type=card_data["type"],
+            actions=actions,
+            engagement_score=engagement_score,
+            priority=priority,
+            features=card_data["metadata"]["features"],
+            metrics=metrics,
+            style_class=self._get_card_style_class(card_data["type"], priority),
+            icon=self._get_card_icon(card_data["type"]),
+            sections=card_data["metadata"].get("sections", []),
+            referenced_by=self.link_graph.backlinks(wiki_page),
+            wiki=self.wiki_name
+        )
+        
+        # Cache the card for performance
+        self.feed_cache[wiki_page] = dashboard_card
+        
+        return dashboard_card
+    
+    def _index_page(self, wiki_page: str, card: Dict, search_doc: Optional[Dict] = None) -> None:
+        """
+        🔎 Keep the search index in step with a (re)built card (terms from the parse when it has them)
+        """
+        try:
+            self.search_index.index_file(wiki_page, card["id"], self.parser.wiki_dir / wiki_page, search_doc)
+        except OSError:
+            self.search_index.remove_page(wiki_page)
+    
+    def _track_page(self, wiki_page: str, card_data: Dict) -> Set[str]:
+        """
+        🗂️ Bring every page-level index up to date with a parsed page
+        
+        Links, summary candidates, permission tables and the similarity
+        signature all come straight off the parsed card - nothing is re-read.
+        
+        Returns:
+            Pages whose backlinks changed
+        """
+        if card_data.get("status") != "success":
+            return self._untrack_page(wiki_page)
+        
+        metadata = card_data["metadata"]
+        self.summarizer.update_page(wiki_page, card_data.get("summary_candidates", []))
+        self.permissions.update_page(wiki_page, metadata.get("tables", []))
+        self.similarity.add_page(wiki_page, metadata.get("signature"))
+        return self.link_graph.update_page(wiki_page, [link["url"] for link in metadata.get("internal_links", [])])
+    
+    def _untrack_page(self, wiki_page: str) -> Set[str]:
+        """
+        🧹 Drop a page from every page-level index
+        
+        Returns:
+            Pages whose backlinks changed
+        """
+        self.summarizer.remove_page(wiki_page)
+        self.permissions.remove_page(wiki_page)
+        self.similarity.remove_page(wiki_page)
+        return self.link_graph.remove_page(wiki_page)
+    
+    def _refresh_references(self, wiki_pages: Iterable[str]) -> None:
+        """
+        🔗 Copy current backlinks onto the cached cards of these pages
+        """
+        for wiki_page in wiki_pages:
+            card = self.feed_cache.get(wiki_page)
+            if isinstance(card, FeedCard):
+                card["referenced_by"] = self.link_graph.backlinks(wiki_page)
+    
+    def _refresh_summaries(self) -> None:
+        """
+        📝 Give every cached card its corpus-level summary
+        """
+        for wiki_page, summary in self.summarizer.summaries().items():
+            card = self.feed_cache.get(wiki_page)
+            if isinstance(card, FeedCard):
+                card["summary"] = summary
+    
+    def _ranking_score(self, card: Dict, now: datetime) -> float:
+        """
+        🏆 Multi-factor score used to order the timeline
+        """
+        if isinstance(card, FeedCard):
+            # Plain attribute reads - no mapping lookups on the hot sort path
+            engagement, priority, card_type, timestamp = card.engagement_score, card.priority, card.type, card.timestamp
+        else:
+            engagement = card.get("engagement_score", 0)
+            priority = card.get("priority", "low")
+            card_type = card.get("type", "general_documentation")
+            timestamp = card.get("timestamp", now)
+        
+        priority_weight = PRIORITY_WEIGHTS.get(priority, 1)
+        
+        # Timestamp recency (more recent = higher score)
+        hours_old = (now - timestamp).total_seconds() / 3600
+        recency_score = max(0, 100 - hours_old)  # Decay over time
+        
+        # Type importance weights
+        type_weight = TYPE_WEIGHTS.get(card_type, 3)
+        
+        # Final score calculation
+        return (engagement * 0.4) + (recency_score * 0.3) + (priority_weight * type_weight * 0.3)
+    
+    def _rank(self, wiki_page: str, card: Dict) -> None:
+        """
+        ➕ Insert a card into the kept ranking (scored at the last full rebuild time)
+        """
+        if self._ranking is None:
+            return
+        key = -self._ranking_score(card, self._ranked_at)
+        self._rank_keys[wiki_page] = key
+        bisect.insort(self._ranking, (key, wiki_page))
+    
+    def _unrank(self, wiki_page: str) -> None:
+        """
+        ➖ Remove a page from the kept ranking, if present
+        """
+        key = self._rank_keys.pop(wiki_page, None)
+        if self._ranking is None or key is None:
+            return
+        index = bisect.bisect_left(self._ranking, (key, wiki_page))
+        if index < len(self._ranking) and self._ranking[index] == (key, wiki_page):
+            del self._ranking[index]
+    
     def _create_error_card(self, wiki_page: str, error: str) -> Dict:
         """
         ❌ Create error card for failed parsing
@@ -251,21 +589,14 @@ class FeedGenerator:
         else:
             return "low"
     
-    def _create_content_preview(self, content: str, max_lines: int = 3) -> str:
+    def _create_content_preview(self, preview_lines: List[str], max_lines: int = 3) -> str:
         """
         👀 Create preview snippet of content for collapsed view
-        """
-        lines = content.split('\n')
-        preview_lines = []
         
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):  # Skip headers
-                preview_lines.append(line)
-                if len(preview_lines) >= max_lines:
-                    break
-        
-        preview = '\n'.join(preview_lines)
+        Args:
+            preview_lines: Leading non-heading lines collected by the tokenizer
+        """
+        preview = '\n'.join(preview_lines[:max_lines])
         if len(preview) > 200:
             preview = preview[:197] + "..."
             
@@ -273,11 +604,9 @@ class FeedGenerator:
     
     def _extract_author_from_git(self, wiki_page: str) -> str:
         """
-        👤 Extract author from git history (fallback to team member)
+        👤 Last author from the git history index (fallback to team member)
         """
-        # For now, return team member based on content type
-        # In real implementation, could use git log to get actual author
-        return "SuperApp Team"
+        return self.history.author(wiki_page, "SuperApp Team")
     
     def _get_card_style_class(self, card_type: str, priority: str) -> str:
         """
@@ -311,4 +640,64 @@ class FeedGenerator:
             "general_documentation": "📖"
         }
         
-        return icons.get(card_type, "📄") 
\ No newline at end of file
+        return icons.get(card_type, "📄") 
+
+
+class MultiWikiFeed:
+    """
+    🌐 One timeline across several wikis, each kept by its own FeedGenerator
+
+    Every feed keeps its own indexes current; the combined timeline is a
+    k-way merge of the feeds' ranked_items, all scored against one shared
+    reference time so recency compares across wikis rebuilt at different
+    times. Feeds built by for_repositories tag cards with their wiki name
+    and prefix card ids with it, so pages like Home.md never clash.
+    """
+
+    def __init__(self, feeds: Dict[str, FeedGenerator]):
+        self.feeds = feeds
+
+    @classmethod
+    def for_repositories(cls, repositories: Dict[str, str], cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                         workers: Optional[int] = None) -> "MultiWikiFeed":
+        """
+        🏗️ A feed per wiki (name -> directory), each caching under its own cache_dir/name
+        """
+        return cls({
+            name: FeedGenerator(WikiParser(str(path), cache_dir=str(Path(cache_dir) / name) if cache_dir else None),
+                                workers=workers, wiki_name=name)
+            for name, path in repositories.items()
+        })
+
+    def generate_activity_timeline(self) -> List[Dict]:
+        """
+        📅 Every wiki's cards in one ranked timeline
+        """
+        now = datetime.now()
+        rankings = [
+            [(-score, name, wiki_page, card) for score, wiki_page, card in feed.ranked_items(now)]
+            for name, feed in self.feeds.items()
+        ]
+
+        # (name, wiki_page) is unique, so ties never fall through to comparing cards
+        return [card for _, _, _, card in heapq.merge(*rankings)]
+
+    def apply_sync(self, sync_result: Dict) -> Dict[str, Dict]:
+        """
+        🔁 Apply a GitSyncPool.sync_all result: each wiki re-parses only its own change set
+        """
+        return {
+            name: self.feeds[name].apply_file_changes(files_updated)
+            for name, files_updated in sync_result.get("changes", {}).items()
+            if name in self.feeds
+        }
+
+    def search(self, query: str, k: int = 10) -> List[Dict]:
+        """
+        🔎 Best matches from every wiki (each wiki's top k, interleaved by rank)
+        """
+        results = [self.feeds[name].search(query, k) for name in self.feeds]
+        merged = []
+        for rank in range(k):
+            merged.extend(cards[rank] for cards in results if rank < len(cards))
+        return merged[:k]
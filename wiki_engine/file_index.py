@@ -0,0 +1,183 @@
+"""
+WikiFileIndex - Know Every Wiki Page Without Listing the Wiki Every Time
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# How many individual page changes to remember for changes_since() callers
+CHANGE_LOG_LIMIT = 10000
+
+
+class WikiFileIndex:
+    """
+    📂 Recursive index of markdown pages, kept fresh by watching directory mtimes
+
+    The first refresh walks the tree with os.scandir; later refreshes only
+    stat the directories we already know and rescan the ones whose mtime
+    moved (a page was added, removed or replaced). Pages edited in place
+    leave their directory's mtime alone, so the known pages of unchanged
+    directories are stat'ed too - one stat each, never a listing. Hidden
+    entries such as .git are skipped.
+    """
+
+    def __init__(self, root: str, suffix: str = ".md"):
+        self.root = Path(root)
+        self.suffix = suffix
+
+        # Page path (relative, '/'-separated) -> (size, mtime_ns)
+        self.pages: Dict[str, Tuple[int, int]] = {}
+
+        # Bumped on every page change; see changes_since()
+        self.version = 0
+
+        self._dir_mtimes: Dict[str, int] = {}
+        self._dir_pages: Dict[str, set] = {}
+        self._dir_children: Dict[str, set] = {}
+        self._change_log: List[Tuple[int, str]] = []
+        self._log_floor = 0
+
+    def refresh(self) -> Dict[str, List[str]]:
+        """
+        🔄 Bring the index up to date
+
+        Returns:
+            Dict with "added", "removed" and "modified" page paths
+        """
+        changes = {"added": [], "removed": [], "modified": []}
+
+        if not self.root.is_dir():
+            for page in list(self.pages):
+                self._record(page, None, changes)
+            self._dir_mtimes.clear()
+            self._dir_pages.clear()
+            self._dir_children.clear()
+            return changes
+
+        if not self._dir_mtimes:
+            self._scan_dir("", changes)
+            return changes
+
+        for rel_dir in list(self._dir_mtimes):
+            if rel_dir not in self._dir_mtimes:
+                continue  # Dropped while rescanning its parent
+            try:
+                mtime_ns = os.stat(self._abs(rel_dir)).st_mtime_ns
+            except OSError:
+                self._drop_dir(rel_dir, changes)
+                continue
+            if mtime_ns != self._dir_mtimes[rel_dir]:
+                self._scan_dir(rel_dir, changes, recursive=False)
+            else:
+                self._stat_pages(rel_dir, changes)
+
+        return changes
+
+    def changes_since(self, version: int) -> Optional[List[str]]:
+        """
+        📜 Pages changed after the given index version
+
+        Returns None when the change log no longer reaches back that far,
+        in which case the caller should treat everything as changed.
+        """
+        if version < self._log_floor:
+            return None
+        if not self._change_log:
+            return []
+
+        # Versions in the log are consecutive, so jump straight to the first newer entry
+        start = max(0, version - self._change_log[0][0] + 1)
+        return list(dict.fromkeys(page for _, page in self._change_log[start:]))
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    # Helper methods for WikiFileIndex
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.root, rel_path) if rel_path else str(self.root)
+
+    def _scan_dir(self, rel_dir: str, changes: Dict[str, List[str]], recursive: bool = True) -> None:
+        """
+        🔍 (Re)scan one directory; new subdirectories are always scanned in full
+        """
+        abs_dir = self._abs(rel_dir)
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            self._drop_dir(rel_dir, changes)
+            return
+
+        seen_pages, seen_children = set(), set()
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    seen_children.add(rel_path)
+                    if recursive or rel_path not in self._dir_mtimes:
+                        self._scan_dir(rel_path, changes)
+                elif entry.name.endswith(self.suffix) and entry.is_file():
+                    stat = entry.stat()
+                    seen_pages.add(rel_path)
+                    self._record(rel_path, (stat.st_size, stat.st_mtime_ns), changes)
+            except OSError:
+                continue
+
+        for page in self._dir_pages.get(rel_dir, set()) - seen_pages:
+            self._record(page, None, changes)
+        for child in self._dir_children.get(rel_dir, set()) - seen_children:
+            self._drop_dir(child, changes)
+
+        self._dir_mtimes[rel_dir] = dir_mtime
+        self._dir_pages[rel_dir] = seen_pages
+        self._dir_children[rel_dir] = seen_children
+
+    def _stat_pages(self, rel_dir: str, changes: Dict[str, List[str]]) -> None:
+        """
+        ✏️ Pick up in-place edits to the known pages of an unchanged directory
+        """
+        pages = self._dir_pages.get(rel_dir, set())
+        for page in list(pages):
+            try:
+                stat = os.stat(self._abs(page))
+            except OSError:
+                pages.discard(page)
+                self._record(page, None, changes)
+                continue
+            self._record(page, (stat.st_size, stat.st_mtime_ns), changes)
+
+    def _drop_dir(self, rel_dir: str, changes: Dict[str, List[str]]) -> None:
+        """
+        🗑️ Forget a directory and everything below it
+        """
+        for child in self._dir_children.pop(rel_dir, set()):
+            self._drop_dir(child, changes)
+        for page in self._dir_pages.pop(rel_dir, set()):
+            self._record(page, None, changes)
+        self._dir_mtimes.pop(rel_dir, None)
+
+    def _record(self, page: str, state: Optional[Tuple[int, int]], changes: Dict[str, List[str]]) -> None:
+        """
+        📝 Update one page entry and log it if anything changed
+        """
+        previous = self.pages.get(page)
+        if state == previous:
+            return
+
+        if state is None:
+            del self.pages[page]
+            changes["removed"].append(page)
+        else:
+            self.pages[page] = state
+            changes["added" if previous is None else "modified"].append(page)
+
+        self.version += 1
+        self._change_log.append((self.version, page))
+        if len(self._change_log) > CHANGE_LOG_LIMIT:
+            drop = len(self._change_log) - CHANGE_LOG_LIMIT
+            self._log_floor = self._change_log[drop - 1][0]
+            del self._change_log[:drop]
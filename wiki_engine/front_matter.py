@@ -0,0 +1,172 @@
+"""
+FrontMatter - Explicit Page Metadata From the YAML Header Block
+"""
+
+import re
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+# PyYAML is optional - without it a small parser handles the common header shapes
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+FRONT_MATTER_FENCE = b'---'
+FRONT_MATTER_END_FENCES = (b'---', b'...')
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# A header bigger than this is treated as an ordinary page that happens to start with ---
+FRONT_MATTER_MAX_BYTES = 64 * 1024
+
+NUMBER_PATTERN = re.compile(r'^[-+]?\d+(\.\d+)?$')
+BOOLEANS = {"true": True, "yes": True, "on": True, "false": False, "no": False, "off": False}
+
+
+def read_front_matter(path) -> Tuple[Dict, int]:
+    """
+    📖 Read only a page's header block from disk
+
+    Returns:
+        (front matter dict, byte offset where the page body starts);
+        ({}, 0) when the page has no front matter
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _scan(iter(lambda: f.readline(FRONT_MATTER_MAX_BYTES), b''))
+    except OSError:
+        return {}, 0
+
+
+def split_front_matter(data: bytes) -> Tuple[Dict, int]:
+    """
+    ✂️ Same as read_front_matter for a page already held in memory
+    """
+    if not data.startswith((FRONT_MATTER_FENCE, UTF8_BOM + FRONT_MATTER_FENCE)):
+        return {}, 0
+    return _scan(data[:FRONT_MATTER_MAX_BYTES + 1].splitlines(keepends=True))
+
+
+def parse_front_matter(text: str) -> Dict:
+    """
+    🧾 Parse the YAML between the fences (PyYAML if installed, else the fallback)
+    """
+    if YAML_AVAILABLE:
+        try:
+            loaded = yaml.safe_load(text)
+        except yaml.YAMLError:
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        return {str(key): _plain(value) for key, value in loaded.items()}
+
+    return _parse_simple_yaml(text)
+
+
+def front_matter_datetime(front_matter: Dict, keys: Tuple[str, ...] = ("updated", "date")) -> Optional[datetime]:
+    """
+    🕐 First parseable ISO date among the given keys, or None
+    """
+    for key in keys:
+        value = front_matter.get(key)
+        if isinstance(value, str):
+            try:
+                moment = datetime.fromisoformat(value)
+            except ValueError:
+                continue
+            # Local naive time, like the mtime-based card timestamps
+            return moment.astimezone().replace(tzinfo=None) if moment.tzinfo else moment
+    return None
+
+
+# Helpers for front matter parsing
+
+def _scan(lines: Iterable[bytes]) -> Tuple[Dict, int]:
+    """
+    🔍 Walk header lines up to the closing fence, never past FRONT_MATTER_MAX_BYTES
+    """
+    lines = iter(lines)
+    first = next(lines, b'')
+    if first.lstrip(UTF8_BOM).rstrip() != FRONT_MATTER_FENCE:
+        return {}, 0
+
+    size = len(first)
+    header = []
+    for line in lines:
+        size += len(line)
+        if size > FRONT_MATTER_MAX_BYTES:
+            break
+        if line.rstrip() in FRONT_MATTER_END_FENCES:
+            return parse_front_matter(b''.join(header).decode('utf-8', errors='replace')), size
+        header.append(line)
+
+    return {}, 0
+
+
+def _parse_simple_yaml(text: str) -> Dict:
+    """
+    🪶 Flat YAML: key: scalar, key: [a, b] and key: followed by "- item" lines
+    """
+    result = {}
+    list_key = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        if stripped.startswith('- ') or stripped == '-':
+            if list_key is not None:
+                if not isinstance(result[list_key], list):
+                    result[list_key] = []
+                result[list_key].append(_scalar(stripped[1:].strip()))
+            continue
+
+        if line[:1].isspace():
+            continue  # Nested mappings need PyYAML
+
+        key, separator, value = stripped.partition(':')
+        if not separator:
+            continue
+        key, value = key.strip().strip('"\''), value.strip()
+        if value:
+            result[key] = _scalar(value)
+            list_key = None
+        else:
+            result[key] = None
+            list_key = key
+
+    return result
+
+
+def _scalar(value: str):
+    """
+    🔢 One YAML scalar (or inline [list]) the way safe_load would type it
+    """
+    if value.startswith('[') and value.endswith(']'):
+        return [_scalar(item.strip()) for item in value[1:-1].split(',') if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+
+    value = value.split(' #', 1)[0].strip()
+    lowered = value.lower()
+    if lowered in BOOLEANS:
+        return BOOLEANS[lowered]
+    if lowered in ('null', '~', ''):
+        return None
+    if NUMBER_PATTERN.match(value):
+        return float(value) if '.' in value else int(value)
+    return value
+
+
+def _plain(value):
+    """
+    📅 Dates as ISO strings so both parsers hand back the same types
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
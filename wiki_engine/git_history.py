@@ -0,0 +1,128 @@
+"""
+GitHistory - Who Touched Each Page, From One Batched git log
+"""
+
+import codecs
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# Starts each commit record in the log output; fields are separated by \x1f
+RECORD_MARK = '\x1e'
+LOG_FORMAT = '--format=' + RECORD_MARK + '%H%x1f%an%x1f%ae%x1f%at'
+
+
+class GitHistoryIndex:
+    """
+    📜 Page -> last author, last commit, edit count and first seen
+
+    One `git log --name-only` covers the whole history, so no page ever
+    costs its own git process. Later updates only read the commits after
+    the last indexed one, which is one git invocation per sync. Paths are
+    relative to repo_path, which may be a subdirectory of the repository.
+    """
+
+    def __init__(self, repo_path):
+        self.repo_path = Path(repo_path)
+        self.head: Optional[str] = None
+        self._pages: Dict[str, Dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page: object) -> bool:
+        return page in self._pages
+
+    @property
+    def pages(self) -> List[str]:
+        return list(self._pages)
+
+    def get(self, page: str) -> Optional[Dict]:
+        """
+        📇 History entry for a page: author, email, last_commit, last_edited, edits, first_seen
+        """
+        return self._pages.get(page)
+
+    def author(self, page: str, default: str = "") -> str:
+        entry = self._pages.get(page)
+        return entry["author"] if entry else default
+
+    def update(self) -> Set[str]:
+        """
+        🔁 Read the commits since the last indexed one (the whole log the first time)
+
+        Returns:
+            Pages whose history changed; empty when nothing moved or git is unavailable
+        """
+        if self.head is not None:
+            commits = self._read_log(f"{self.head}..HEAD")
+            if commits is not None:
+                return self._merge(commits)
+            # The indexed commit is gone (rewritten history) - start over
+            self.head, self._pages = None, {}
+
+        commits = self._read_log("HEAD")
+        return self._merge(commits) if commits is not None else set()
+
+    # Helper methods for GitHistoryIndex
+
+    def _read_log(self, revisions: str) -> Optional[List[Dict]]:
+        """
+        📥 Commits in a revision range, newest first, each with the pages it touched
+        """
+        command = ['git', '-c', 'core.quotePath=false', 'log', '--name-only', '--no-renames', '--relative',
+                   LOG_FORMAT, revisions, '--']
+        try:
+            process = subprocess.Popen(command, cwd=self.repo_path, stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL, text=True, encoding='utf-8', errors='replace')
+        except OSError:
+            return None
+
+        commits = []
+        with process:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                if line.startswith(RECORD_MARK):
+                    commit, author, email, timestamp = line[1:].split('\x1f')
+                    commits.append({"commit": commit, "author": author, "email": email,
+                                    "time": datetime.fromtimestamp(int(timestamp)), "files": []})
+                elif line and commits:
+                    commits[-1]["files"].append(_unquote(line))
+
+        return commits if process.returncode == 0 else None
+
+    def _merge(self, commits: List[Dict]) -> Set[str]:
+        """
+        🧮 Fold newest-first commits (all newer than the index) into the page map
+        """
+        changed = set()
+        for commit in commits:
+            for page in commit["files"]:
+                entry = self._pages.get(page)
+                if page not in changed:
+                    # Newest commit for this page in the batch - it is the last edit
+                    entry = self._pages[page] = {
+                        "author": commit["author"],
+                        "email": commit["email"],
+                        "last_commit": commit["commit"],
+                        "last_edited": commit["time"],
+                        "edits": entry["edits"] if entry else 0,
+                        "first_seen": entry["first_seen"] if entry else commit["time"],
+                    }
+                    changed.add(page)
+                entry["edits"] += 1
+                entry["first_seen"] = min(entry["first_seen"], commit["time"])
+
+        if commits:
+            self.head = commits[0]["commit"]
+        return changed
+
+
+def _unquote(path: str) -> str:
+    """
+    🔤 Undo git's C-style quoting of unusual file names
+    """
+    if len(path) >= 2 and path[0] == path[-1] == '"':
+        return codecs.escape_decode(path[1:-1].encode('utf-8'))[0].decode('utf-8', errors='replace')
+    return path
@@ -0,0 +1,260 @@
+"""
+GitObjects - Pages Straight From the Object Store, Over One Long-Lived Pipe
+"""
+
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .content_ref import decode_page_text
+
+TREE_MODE = b'40000'
+
+
+class GitObjectReader:
+    """
+    🗃️ Persistent `git cat-file --batch` / `--batch-check` co-processes
+
+    Each query is one line written to an already-running git process, so
+    reading any page at any commit costs no fork, no checkout and no
+    working-tree access. Trees are walked over the same pipe, which lists
+    a commit's pages and diffs two commits without extra processes.
+    Paths are relative to repo_path (it may be a subdirectory). Queries
+    from several threads are serialised per pipe; a git process that died
+    is restarted on the next query.
+    """
+
+    def __init__(self, repo_path):
+        self.repo_path = Path(repo_path)
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._locks = {"--batch": threading.Lock(), "--batch-check": threading.Lock()}
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def info(self, spec: str) -> Optional[Tuple[str, str, int]]:
+        """
+        🔎 (object id, type, size) for a revision or rev:path spec, or None if missing
+        """
+        header = self._query("--batch-check", spec)
+        return header[:3] if header else None
+
+    def resolve(self, revision: str) -> Optional[str]:
+        """
+        📍 Full object id of a revision (e.g. "HEAD"), or None
+        """
+        found = self.info(revision)
+        return found[0] if found else None
+
+    def read_object(self, spec: str) -> Optional[Tuple[str, bytes]]:
+        """
+        📦 (type, raw content) of any object, or None if missing
+        """
+        header = self._query("--batch", spec)
+        return (header[1], header[3]) if header else None
+
+    def blob_id(self, commit: str, path: str) -> Optional[str]:
+        """
+        🆔 Blob id of a file as of a commit (None if it was not a file there)
+        """
+        found = self.info(self._path_spec(commit, path))
+        return found[0] if found and found[1] == "blob" else None
+
+    def read_blob(self, commit: str, path: str) -> Optional[bytes]:
+        """
+        📄 Bytes of a file as of a commit (None if it did not exist there)
+        """
+        found = self.read_object(self._path_spec(commit, path))
+        return found[1] if found and found[0] == "blob" else None
+
+    def list_files(self, commit: str, suffix: Optional[str] = None) -> Dict[str, str]:
+        """
+        📂 Every file under repo_path at a commit: path -> blob id
+        """
+        files = {}
+        for path, (mode, object_id) in self._walk(self._path_spec(commit, "")).items():
+            if suffix is None or path.endswith(suffix):
+                files[path] = object_id
+        return files
+
+    def changed_paths(self, before: str, after: str) -> List[str]:
+        """
+        🔀 Files added, modified or deleted between two commits (renames as delete + add)
+
+        Only subtrees whose ids differ are opened, so a small change in a
+        big repository reads a handful of tree objects.
+        """
+        changed = []
+        self._diff_trees(self._path_spec(before, ""), self._path_spec(after, ""), "", changed)
+        return sorted(changed)
+
+    def commit_time(self, commit: str) -> Optional[datetime]:
+        """
+        🕐 Committer time of a commit (local naive time, like file mtimes)
+        """
+        found = self.read_object(commit)
+        if not found or found[0] != "commit":
+            return None
+        for line in found[1].split(b'\n'):
+            if not line:
+                break  # Headers end at the first blank line
+            if line.startswith(b'committer '):
+                return datetime.fromtimestamp(int(line.rsplit(b' ', 2)[-2]))
+        return None
+
+    def close(self) -> None:
+        """
+        🛑 Stop the co-processes (they restart on the next query)
+        """
+        for mode, lock in self._locks.items():
+            with lock:
+                self._stop(mode)
+
+    # Helper methods for GitObjectReader
+
+    def _path_spec(self, commit: str, path: str) -> str:
+        # "./" makes git resolve the path against our cwd, i.e. repo_path
+        return f"{commit}:./{path}"
+
+    def _query(self, mode: str, spec: str) -> Optional[Tuple[str, str, int, Optional[bytes]]]:
+        """
+        📨 One request/response on a pipe: (object id, type, size, content or None)
+        """
+        if '\n' in spec:
+            return None  # The batch protocol is line based
+
+        with self._locks[mode]:
+            for attempt in range(2):
+                process = self._process(mode)
+                try:
+                    process.stdin.write(spec.encode('utf-8') + b'\n')
+                    process.stdin.flush()
+                    header = process.stdout.readline()
+                    if not header:
+                        raise BrokenPipeError("git cat-file exited")
+
+                    if header.endswith((b' missing\n', b' ambiguous\n')):
+                        return None  # The spec is echoed back and may itself contain spaces
+                    fields = header.split()
+                    if len(fields) != 3:
+                        raise ValueError(f"unexpected git cat-file header: {header!r}")
+                    object_id, object_type, size = fields[0].decode(), fields[1].decode(), int(fields[2])
+
+                    content = None
+                    if mode == "--batch":
+                        content = process.stdout.read(size + 1)[:size]  # Content, then a newline
+                        if len(content) != size:
+                            raise BrokenPipeError("git cat-file output cut short")
+                    return object_id, object_type, size, content
+                except (OSError, ValueError):
+                    self._stop(mode)
+                    if attempt:
+                        raise
+        return None
+
+    def _process(self, mode: str) -> subprocess.Popen:
+        process = self._processes.get(mode)
+        if process is None or process.poll() is not None:
+            process = self._processes[mode] = subprocess.Popen(
+                ['git', 'cat-file', mode], cwd=self.repo_path,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        return process
+
+    def _stop(self, mode: str) -> None:
+        process = self._processes.pop(mode, None)
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+    def _tree_entries(self, spec: str) -> Dict[str, Tuple[bytes, str]]:
+        """
+        🌲 name -> (mode, object id) for one tree object (empty if it is not a tree)
+        """
+        found = self._query("--batch", spec)
+        if not found or found[1] != "tree":
+            return {}
+
+        data, id_bytes = found[3], len(found[0]) // 2  # SHA-1 or SHA-256 repositories
+        entries = {}
+        position = 0
+        while position < len(data):
+            space = data.index(b' ', position)
+            nul = data.index(b'\0', space)
+            object_id = data[nul + 1:nul + 1 + id_bytes].hex()
+            entries[data[space + 1:nul].decode('utf-8', errors='surrogateescape')] = (data[position:space], object_id)
+            position = nul + 1 + id_bytes
+        return entries
+
+    def _walk(self, spec: str, prefix: str = "") -> Dict[str, Tuple[bytes, str]]:
+        files = {}
+        for name, (mode, object_id) in self._tree_entries(spec).items():
+            if mode == TREE_MODE:
+                files.update(self._walk(object_id, f"{prefix}{name}/"))
+            else:
+                files[prefix + name] = (mode, object_id)
+        return files
+
+    def _diff_trees(self, before: Optional[str], after: Optional[str], prefix: str, changed: List[str]) -> None:
+        old = self._tree_entries(before) if before else {}
+        new = self._tree_entries(after) if after else {}
+        for name in old.keys() | new.keys():
+            old_entry, new_entry = old.get(name), new.get(name)
+            if old_entry == new_entry:
+                continue
+            old_tree = old_entry[1] if old_entry and old_entry[0] == TREE_MODE else None
+            new_tree = new_entry[1] if new_entry and new_entry[0] == TREE_MODE else None
+            if old_entry and not old_tree:
+                changed.append(prefix + name)
+            if new_entry and not new_tree and (not old_entry or old_tree):
+                changed.append(prefix + name)
+            if old_tree or new_tree:
+                self._diff_trees(old_tree, new_tree, f"{prefix}{name}/", changed)
+
+
+class BlobRef:
+    """
+    📎 ContentRef twin for a page body inside a git blob
+
+    Reads go through the shared GitObjectReader, so a snapshot card can be
+    opened without the page ever existing in the working tree.
+    """
+
+    __slots__ = ("reader", "blob", "start", "end")
+
+    def __init__(self, reader: GitObjectReader, blob: str, start: int = 0, end: Optional[int] = None):
+        self.reader = reader
+        self.blob = blob
+        self.start = start
+        self.end = end
+
+    def read(self) -> str:
+        found = self.reader.read_object(self.blob)
+        if not found:
+            return ""
+        return decode_page_text(found[1][self.start:self.end])
+
+    def slice(self, start: int, end: Optional[int]) -> "BlobRef":
+        return BlobRef(self.reader, self.blob, start, end)
+
+    def __repr__(self) -> str:
+        return f"BlobRef({self.blob[:12]!r}, {self.start}, {self.end})"
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, BlobRef)
+                and (self.blob, self.start, self.end) == (other.blob, other.start, other.end))
+
+    def __hash__(self) -> int:
+        return hash((self.blob, self.start, self.end))
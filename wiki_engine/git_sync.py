@@ -2,16 +2,84 @@
 GitSync Engine - Keep Our Dashboard ALIVE with Real-Time Wiki Updates
 """
 
-import subprocess
+import asyncio
 import os
-from datetime import datetime
+import queue
+import random
+import signal
+import subprocess
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .content_ref import decode_page_text
+from .git_objects import GitObjectReader
+
+# One lock per repository (by resolved path), shared by every engine in the
+# process: git itself refuses concurrent pulls into one working tree
+_REPO_LOCKS: Dict[str, threading.Lock] = {}
+_REPO_LOCKS_GUARD = threading.Lock()
+
+# Auto-sync waits are spread by ±10% so many sessions do not pull in lockstep,
+# and consecutive failures double the wait up to 8x the interval
+AUTO_SYNC_JITTER = 0.1
+AUTO_SYNC_MAX_BACKOFF = 8
+
+# Default deadline (seconds) for one whole pull, so a stalled remote or a
+# credential helper waiting for input cannot hold a session forever
+PULL_TIMEOUT = 60
+
+# Pulls GitSyncPool runs at once (they mostly wait on the network)
+POOL_WORKERS = 8
+
+
+def _repo_lock(repo_path: Path) -> threading.Lock:
+    """
+    🔒 The process-wide pull lock for a repository
+    """
+    key = str(repo_path.resolve())
+    with _REPO_LOCKS_GUARD:
+        return _REPO_LOCKS.setdefault(key, threading.Lock())
+
+
+# Each git command leads its own process group (POSIX), so a timeout can kill
+# everything it spawned
+_NEW_SESSION = os.name == 'posix'
+
+
+def _git_env() -> Dict[str, str]:
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+def _kill_process_group(process) -> None:
+    """
+    💀 Kill a git command and its children (subprocess.Popen or asyncio Process)
+    """
+    try:
+        if _NEW_SESSION:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass  # Already gone
+
 
 class GitSyncEngine:
     """
     🔄 The engine that keeps our dashboard synced with wiki reality
     
+    Every git command runs with an explicit working directory (cwd=), never
+    os.chdir, so engines in different Streamlit sessions or worker threads
+    can sync and read at the same time. Pulls into the same repository are
+    serialised; reads never wait for them. Auto-sync and request_sync pull
+    on a daemon thread and hand each result to subscribers, so a Streamlit
+    render never waits on git. Pulls have a deadline, after which git and
+    every process it started are killed.
+    
     Monday Madness Level: UNSTOPPABLE! ⚡
     """
     
@@ -20,103 +88,94 @@ class GitSyncEngine:
         self.last_sync = None
         self.sync_history = []
         
-    def pull_wiki_updates(self) -> Dict:
+        # Guards last_sync and sync_history
+        self._state_lock = threading.Lock()
+        
+        # Long-lived cat-file reader, started on first use
+        self._objects = None
+        
+        # Background scheduler: a daemon thread woken by its interval, request_sync or stop
+        self.next_sync = None
+        self.consecutive_failures = 0
+        self._sync_interval = None  # Seconds; None syncs only on request
+        self._subscribers: List[Callable[[Dict], None]] = []
+        self._scheduler = None
+        self._scheduler_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+    
+    def pull_wiki_updates(self, timeout: Optional[float] = PULL_TIMEOUT) -> Dict:
         """
         📥 Pull latest wiki updates from Git repository
         
+        Args:
+            timeout: Seconds git pull may take before it is killed (None waits forever)
+        
         Returns:
             Dict with sync status, changes, and metadata
         """
-        if not self.repo_path.exists():
-            return {
-                "status": "error",
-                "error": "Repository path does not exist",
-                "changes_detected": False,
-                "files_updated": [],
-                "sync_time": datetime.now()
-            }
+        problem = self._repo_problem()
+        if problem:
+            return self._error_result(problem)
         
         try:
-            # Save current working directory
-            original_cwd = os.getcwd()
-            
-            # Change to repo directory (ensure it's absolute path)
-            repo_abs_path = self.repo_path.resolve()
-            os.chdir(repo_abs_path)
-            
-            # Check if it's a git repository (use current directory after cd)
-            if not Path(".git").exists():
-                os.chdir(original_cwd)
-                return {
-                    "status": "error",
-                    "error": "Not a git repository",
-                    "changes_detected": False,
-                    "files_updated": [],
-                    "sync_time": datetime.now()
-                }
-            
-            # Get current commit hash before pull
-            result_before = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                         capture_output=True, text=True, check=True)
-            commit_before = result_before.stdout.strip()
-            
-            # Perform git pull
-            result_pull = subprocess.run(['git', 'pull'], 
-                                       capture_output=True, text=True, check=True)
-            
-            # Get commit hash after pull
-            result_after = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                        capture_output=True, text=True, check=True)
-            commit_after = result_after.stdout.strip()
-            
-            # Detect changes
-            changes_detected = commit_before != commit_after
-            files_updated = []
-            
-            if changes_detected:
-                # Get list of changed files
-                result_files = subprocess.run(['git', 'diff', '--name-only', commit_before, commit_after], 
-                                            capture_output=True, text=True, check=True)
-                files_updated = [f.strip() for f in result_files.stdout.split('\n') if f.strip()]
-            
-            # Restore original working directory
-            os.chdir(original_cwd)
-            
-            sync_result = {
-                "status": "success",
-                "changes_detected": changes_detected,
-                "files_updated": files_updated,
-                "commit_before": commit_before[:8],  # Short hash
-                "commit_after": commit_after[:8],
-                "pull_output": result_pull.stdout,
-                "sync_time": datetime.now(),
-                "monday_madness_energy": "MAXIMUM SYNC POWER! ⚡🔄" if changes_detected else "STABLE AND READY! 💪"
-            }
-            
-            # Log the sync activity
-            self.log_sync_activity(sync_result)
-            self.last_sync = sync_result["sync_time"]
+            with _repo_lock(self.repo_path):
+                # Get current commit hash before pull (over the cat-file pipe, no fork)
+                commit_before = self._head()
+                
+                # Perform git pull - the only new process a sync starts
+                result_pull = self._git('pull', timeout=timeout)
+                
+                commit_after, files_updated = self._changes_since(commit_before)
+                return self._sync_result(commit_before, commit_after, files_updated, result_pull.stdout)
+        
+        except subprocess.TimeoutExpired:
+            return self._error_result(f"Git pull timed out after {timeout:g}s")
+        except subprocess.CalledProcessError as e:
+            return self._error_result(f"Git command failed: {e.stderr}")
+        except Exception as e:
+            return self._error_result(str(e))
+    
+    async def pull_async(self, timeout: Optional[float] = PULL_TIMEOUT) -> Dict:
+        """
+        ⚡ pull_wiki_updates for asyncio code: same result dict, never blocks the loop
+        
+        timeout is the deadline for the whole sync, waiting for another pull
+        into the repository included; each git command gets what is left of
+        it and is killed with its children when that runs out. Reading HEAD
+        and diffing trees (blocking cat-file pipe reads) run in a worker
+        thread under the same deadline. Cancelling the task kills git too,
+        releases the repository and re-raises.
+        """
+        problem = self._repo_problem()
+        if problem:
+            return self._error_result(problem)
+        
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        lock = _repo_lock(self.repo_path)
+        
+        try:
+            # The repo lock is a threading.Lock: poll it rather than park a loop thread on it
+            while not lock.acquire(blocking=False):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise asyncio.TimeoutError
+                await asyncio.sleep(0.05)
             
-            return sync_result
+            try:
+                commit_before = await self._off_loop(self._head, deadline)
+                result_pull = await self._git_async('pull', deadline=deadline)
+                commit_after, files_updated = await self._off_loop(self._changes_since, deadline, commit_before)
+            finally:
+                lock.release()
             
+            return self._sync_result(commit_before, commit_after, files_updated, result_pull.stdout)
+        
+        except asyncio.TimeoutError:
+            return self._error_result(f"Git pull timed out after {timeout:g}s")
         except subprocess.CalledProcessError as e:
-            os.chdir(original_cwd) if 'original_cwd' in locals() else None
-            return {
-                "status": "error",
-                "error": f"Git command failed: {e.stderr}",
-                "changes_detected": False,
-                "files_updated": [],
-                "sync_time": datetime.now()
-            }
+            return self._error_result(f"Git command failed: {e.stderr}")
         except Exception as e:
-            os.chdir(original_cwd) if 'original_cwd' in locals() else None
-            return {
-                "status": "error", 
-                "error": str(e),
-                "changes_detected": False,
-                "files_updated": [],
-                "sync_time": datetime.now()
-            }
+            return self._error_result(str(e))
     
     def detect_file_changes(self, commit_before: str = None, commit_after: str = None) -> List[Dict]:
         """
@@ -126,25 +185,19 @@ class GitSyncEngine:
             return []
         
         try:
-            original_cwd = os.getcwd()
-            os.chdir(self.repo_path)
-            
             # If no commits provided, compare with last known state
             if not commit_before or not commit_after:
                 # Get recent commits
-                result = subprocess.run(['git', 'log', '--oneline', '-n', '2'], 
-                                      capture_output=True, text=True, check=True)
+                result = self._git('log', '--oneline', '-n', '2')
                 commits = result.stdout.strip().split('\n')
                 if len(commits) >= 2:
                     commit_after = commits[0].split()[0]
                     commit_before = commits[1].split()[0]
                 else:
-                    os.chdir(original_cwd)
                     return []
             
             # Get detailed file changes
-            result = subprocess.run(['git', 'diff', '--name-status', commit_before, commit_after], 
-                                  capture_output=True, text=True, check=True)
+            result = self._git('diff', '--name-status', commit_before, commit_after)
             
             file_changes = []
             for line in result.stdout.strip().split('\n'):
@@ -156,7 +209,7 @@ class GitSyncEngine:
                         
                         change_type = {
                             'A': 'added',
-                            'M': 'modified', 
+                            'M': 'modified',
                             'D': 'deleted',
                             'R': 'renamed',
                             'C': 'copied'
@@ -170,11 +223,9 @@ class GitSyncEngine:
                             "monday_madness_impact": "HIGH! 🚀" if filename.endswith('.md') else "LOW 📄"
                         })
             
-            os.chdir(original_cwd)
             return file_changes
-            
+        
         except Exception as e:
-            os.chdir(original_cwd) if 'original_cwd' in locals() else None
             return []
     
     def trigger_dashboard_refresh(self, changed_files: List[str]) -> bool:
@@ -206,7 +257,7 @@ class GitSyncEngine:
                 return True
             
             return False
-            
+        
         except Exception as e:
             self.log_sync_activity({
                 "type": "refresh_trigger_error",
@@ -218,54 +269,409 @@ class GitSyncEngine:
         """
         📝 Log sync activities for debugging and analytics
         """
-        self.sync_history.append({
-            **activity,
-            "timestamp": datetime.now(),
-            "sync_count": len(self.sync_history) + 1
-        })
-        
-        # Keep only last 100 entries
-        if len(self.sync_history) > 100:
-            self.sync_history = self.sync_history[-100:]
+        with self._state_lock:
+            self.sync_history.append({
+                **activity,
+                "timestamp": datetime.now(),
+                "sync_count": len(self.sync_history) + 1
+            })
+            
+            # Keep only last 100 entries
+            if len(self.sync_history) > 100:
+                self.sync_history = self.sync_history[-100:]
     
     def get_repo_status(self) -> Dict:
         """
         📊 Get current repository status and health
         """
-        return {
-            "repo_exists": self.repo_path.exists(),
-            "is_git_repo": (self.repo_path / ".git").exists(),
-            "last_sync": self.last_sync,
-            "sync_count": len(self.sync_history),
-            "health_status": "EXCELLENT! 💪"
-        }
+        with self._state_lock:
+            return {
+                "repo_exists": self.repo_path.exists(),
+                "is_git_repo": (self.repo_path / ".git").exists(),
+                "last_sync": self.last_sync,
+                "sync_count": len(self.sync_history),
+                "auto_sync_running": self._scheduler is not None and self._scheduler.is_alive(),
+                "next_sync": self.next_sync,
+                "consecutive_failures": self.consecutive_failures,
+                "health_status": "EXCELLENT! 💪"
+            }
     
-    def setup_auto_sync(self, interval_minutes: int = 30) -> bool:
+    def setup_auto_sync(self, interval_minutes: float = 30) -> bool:
         """
-        ⏰ Setup automatic sync every X minutes
+        ⏰ Setup automatic sync every X minutes on a background daemon thread
+        
+        Each wait is jittered by AUTO_SYNC_JITTER and doubled per consecutive
+        failure (up to AUTO_SYNC_MAX_BACKOFF times the interval). Calling it
+        again changes the interval from the next wait on.
         """
         try:
-            # For now, we'll return setup success
-            # In a real implementation, this would set up a background scheduler
+            if interval_minutes <= 0:
+                raise ValueError("interval_minutes must be positive")
+            
+            self._sync_interval = interval_minutes * 60
+            self._start_scheduler()
             self.log_sync_activity({
                 "type": "auto_sync_setup",
                 "interval_minutes": interval_minutes,
                 "status": "configured",
-                "next_sync": datetime.now().replace(minute=datetime.now().minute + interval_minutes),
+                "next_sync": datetime.now() + timedelta(minutes=interval_minutes),
                 "monday_madness_scheduler": f"AUTO-SYNC ACTIVATED! Every {interval_minutes} minutes! ⏰🚀"
             })
             
             return True
-            
+        
         except Exception as e:
             self.log_sync_activity({
-                "type": "auto_sync_setup_error", 
+                "type": "auto_sync_setup_error",
                 "error": str(e)
             })
             return False
     
+    def stop_auto_sync(self, timeout: Optional[float] = 10) -> None:
+        """
+        ⏹️ Stop the background scheduler (waits up to timeout for a running pull)
+        """
+        with self._scheduler_lock:
+            scheduler, self._scheduler = self._scheduler, None
+            self._sync_interval = None
+            self._stop_event.set()
+            self._wake.set()
+        
+        if scheduler is not None and scheduler is not threading.current_thread():
+            scheduler.join(timeout)
+        with self._state_lock:
+            self.next_sync = None
+    
+    def request_sync(self) -> None:
+        """
+        📨 Sync as soon as possible in the background and return immediately
+        
+        The result reaches subscribers; without auto-sync the scheduler
+        thread is started and then idles until the next request.
+        """
+        self._start_scheduler()
+        self._wake.set()
+    
+    def subscribe(self, callback: Callable[[Dict], None]) -> None:
+        """
+        📣 Receive every background sync result (the same dict pull_wiki_updates returns)
+        
+        Callbacks run on the scheduler thread and should only hand the result
+        over (e.g. queue.put); files_updated is the change set to apply.
+        """
+        with self._state_lock:
+            self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[Dict], None]) -> None:
+        """
+        🔕 Stop receiving background sync results
+        """
+        with self._state_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+    
     def force_sync_now(self) -> Dict:
         """
         🚨 Force immediate sync (for manual refresh)
         """
-        return self.pull_wiki_updates() 
\ No newline at end of file
+        return self.pull_wiki_updates()
+    
+    @property
+    def objects(self) -> GitObjectReader:
+        """
+        🗃️ This repository's persistent cat-file reader (shared by all threads)
+        """
+        with self._state_lock:
+            if self._objects is None:
+                self._objects = GitObjectReader(self.repo_path)
+            return self._objects
+    
+    def read_page(self, path: str, commit: str = "HEAD") -> Optional[str]:
+        """
+        📄 A page's text as of a commit, straight from the object store
+        """
+        data = self.objects.read_blob(commit, path)
+        return decode_page_text(data) if data is not None else None
+    
+    def close(self) -> None:
+        """
+        🛑 Stop auto-sync and the cat-file reader (the reader restarts if used again)
+        """
+        self.stop_auto_sync()
+        if self._objects is not None:
+            self._objects.close()
+    
+    # Helper methods for GitSyncEngine
+    
+    def _git(self, *args: str, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        🛠️ Run one git command in the repository (raises CalledProcessError on failure)
+        
+        The repository is passed as cwd= for this child process only, so the
+        process-wide working directory is never touched. GIT_TERMINAL_PROMPT=0
+        makes a missing credential fail instead of waiting on a prompt. On
+        timeout (TimeoutExpired) git's whole process group is killed: a
+        surviving ssh or remote helper would otherwise keep the pipes open.
+        """
+        process = subprocess.Popen(['git', *args], cwd=self.repo_path, stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, text=True, env=_git_env(),
+                                   start_new_session=_NEW_SESSION)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except BaseException:
+            _kill_process_group(process)
+            process.communicate()
+            raise
+        
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, process.args, stdout, stderr)
+        return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+    
+    async def _git_async(self, *args: str, deadline: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        🛠️ _git on asyncio: raises asyncio.TimeoutError once the monotonic deadline passes
+        """
+        process = await asyncio.create_subprocess_exec(
+            'git', *args, cwd=self.repo_path, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE, env=_git_env(), start_new_session=_NEW_SESSION
+        )
+        try:
+            remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+            stdout, stderr = await asyncio.wait_for(process.communicate(), remaining)
+        except BaseException:  # Timeout or cancellation
+            _kill_process_group(process)
+            await asyncio.shield(process.wait())
+            raise
+        
+        command = ['git', *args]
+        stdout, stderr = stdout.decode('utf-8', errors='replace'), stderr.decode('utf-8', errors='replace')
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+    
+    async def _off_loop(self, function: Callable, deadline: Optional[float], *args):
+        """
+        🧵 Run blocking work in a worker thread, giving up (asyncio.TimeoutError) at the deadline
+        
+        function gets the seconds left as its timeout argument, so a git
+        subprocess it falls back to is killed at the deadline as well.
+        """
+        remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+        return await asyncio.wait_for(asyncio.to_thread(function, *args, timeout=remaining), remaining)
+    
+    def _head(self, timeout: Optional[float] = None) -> str:
+        """
+        📍 Full commit id of HEAD (rev-parse only if the reader cannot answer)
+        """
+        head = self.objects.resolve('HEAD')
+        return head if head is not None else self._git('rev-parse', 'HEAD', timeout=timeout).stdout.strip()
+    
+    def _changes_since(self, commit_before: str, timeout: Optional[float] = None) -> Tuple[str, List[str]]:
+        """
+        🔀 HEAD after a pull and the files changed since commit_before
+        """
+        # Get commit hash after pull
+        commit_after = self._head(timeout)
+        
+        if commit_after == commit_before:
+            return commit_after, []
+        
+        # Changed files from a tree diff over the same pipe (a rename is delete + add)
+        return commit_after, self.objects.changed_paths(commit_before, commit_after)
+    
+    def _repo_problem(self) -> Optional[str]:
+        if not self.repo_path.exists():
+            return "Repository path does not exist"
+        
+        # Check if it's a git repository
+        if not (self.repo_path / ".git").exists():
+            return "Not a git repository"
+        return None
+    
+    def _sync_result(self, commit_before: str, commit_after: str, files_updated: List[str],
+                     pull_output: str) -> Dict:
+        """
+        📋 Build and log the success result of a pull from commit_before to commit_after
+        """
+        # Detect changes
+        changes_detected = commit_before != commit_after
+        
+        sync_result = {
+            "status": "success",
+            "changes_detected": changes_detected,
+            "files_updated": files_updated,
+            "commit_before": commit_before[:8],  # Short hash
+            "commit_after": commit_after[:8],
+            "pull_output": pull_output,
+            "sync_time": datetime.now(),
+            "monday_madness_energy": "MAXIMUM SYNC POWER! ⚡🔄" if changes_detected else "STABLE AND READY! 💪"
+        }
+        
+        # Log the sync activity
+        self.log_sync_activity(sync_result)
+        with self._state_lock:
+            self.last_sync = sync_result["sync_time"]
+        
+        return sync_result
+    
+    def _start_scheduler(self) -> None:
+        with self._scheduler_lock:
+            if self._scheduler is not None and self._scheduler.is_alive():
+                return
+            self._stop_event = threading.Event()  # A thread still finishing after stop keeps the old one
+            self._wake.clear()
+            self._scheduler = threading.Thread(target=self._auto_sync_loop, args=(self._stop_event,),
+                                               name=f"wiki-auto-sync:{self.repo_path.name}", daemon=True)
+            self._scheduler.start()
+    
+    def _auto_sync_loop(self, stop: threading.Event) -> None:
+        """
+        🔁 Scheduler thread: wait (interval, backoff, jitter), pull, publish, repeat
+        """
+        while not stop.is_set():
+            delay = self._next_delay()
+            with self._state_lock:
+                if not stop.is_set():  # stop_auto_sync clears next_sync; do not set it back
+                    self.next_sync = datetime.now() + timedelta(seconds=delay) if delay is not None else None
+            self._wake.wait(delay)
+            self._wake.clear()  # A request arriving now is covered by the pull below
+            if stop.is_set():
+                break
+            
+            result = self.pull_wiki_updates()
+            with self._state_lock:
+                self.consecutive_failures = 0 if result["status"] == "success" else self.consecutive_failures + 1
+            self._publish(result)
+    
+    def _next_delay(self) -> Optional[float]:
+        interval = self._sync_interval
+        if interval is None:
+            return None
+        with self._state_lock:
+            backoff = min(2 ** self.consecutive_failures, AUTO_SYNC_MAX_BACKOFF)
+        return interval * backoff * random.uniform(1 - AUTO_SYNC_JITTER, 1 + AUTO_SYNC_JITTER)
+    
+    def _publish(self, result: Dict) -> None:
+        with self._state_lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(result)
+            except Exception as e:
+                self.log_sync_activity({
+                    "type": "subscriber_error",
+                    "error": str(e)
+                })
+    
+    def _error_result(self, error: str) -> Dict:
+        return {
+            "status": "error",
+            "error": error,
+            "changes_detected": False,
+            "files_updated": [],
+            "sync_time": datetime.now()
+        }
+
+
+class SyncInbox:
+    """
+    📬 One reader's queue of background sync results from a shared engine
+    
+    Meant for one engine per process shared by many Streamlit sessions:
+    each session keeps an inbox in its session state and drains it on
+    render. The engine only holds a weak reference, so when the session
+    (and its inbox) goes away the subscription is dropped with it;
+    close() unsubscribes right away.
+    """
+    
+    def __init__(self, engine: GitSyncEngine):
+        self.results = queue.Queue()
+        inbox = weakref.ref(self)
+        
+        def deliver(result: Dict) -> None:
+            alive = inbox()
+            if alive is not None:
+                alive.results.put(result)
+        
+        engine.subscribe(deliver)
+        self._unsubscribe = weakref.finalize(self, engine.unsubscribe, deliver)
+    
+    def drain(self) -> List[Dict]:
+        """
+        📥 Every result delivered since the last drain, oldest first
+        """
+        drained = []
+        while True:
+            try:
+                drained.append(self.results.get_nowait())
+            except queue.Empty:
+                return drained
+    
+    def close(self) -> None:
+        """
+        🔕 Stop receiving results
+        """
+        self._unsubscribe()
+
+
+class GitSyncPool:
+    """
+    🌊 Several wiki repositories synced at once by a bounded set of workers
+    
+    Each repository keeps its own GitSyncEngine (and so its own lock and
+    cat-file reader). Pulls mostly wait on the network, so with enough
+    workers syncing N wikis takes about as long as the slowest one.
+    """
+    
+    def __init__(self, repositories: Dict[str, str], max_workers: int = POOL_WORKERS):
+        self.engines = {name: GitSyncEngine(str(path)) for name, path in repositories.items()}
+        self.max_workers = max_workers
+    
+    def sync_all(self, timeout: Optional[float] = PULL_TIMEOUT) -> Dict:
+        """
+        🔄 Pull every repository concurrently
+        
+        Returns:
+            Dict with overall status, each repository's pull result (plus its
+            duration), the change sets of repositories that moved, and timings
+        """
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.engines)))) as executor:
+            results = dict(zip(self.engines, executor.map(
+                lambda engine: self._timed_pull(engine, timeout), self.engines.values()
+            )))
+        wall_time = time.perf_counter() - start
+        
+        durations = {name: result["duration"] for name, result in results.items()}
+        slowest_repo = max(durations, key=durations.get) if durations else None
+        failed = [name for name, result in results.items() if result["status"] != "success"]
+        changes = {name: result["files_updated"] for name, result in results.items() if result["changes_detected"]}
+        
+        return {
+            "status": "error" if failed and len(failed) == len(results) else "partial" if failed else "success",
+            "repos": results,
+            "changes": changes,
+            "changes_detected": bool(changes),
+            "failed": failed,
+            "timings": {
+                "wall_time": wall_time,
+                "total_repo_time": sum(durations.values()),
+                "slowest_repo": slowest_repo,
+                "slowest_time": durations[slowest_repo] if slowest_repo else 0.0
+            },
+            "sync_time": datetime.now()
+        }
+    
+    def close(self) -> None:
+        """
+        🛑 Stop every engine's auto-sync and cat-file reader
+        """
+        for engine in self.engines.values():
+            engine.close()
+    
+    # Helper methods for GitSyncPool
+    
+    def _timed_pull(self, engine: GitSyncEngine, timeout: Optional[float]) -> Dict:
+        start = time.perf_counter()
+        result = engine.pull_wiki_updates(timeout=timeout)
+        return {**result, "duration": time.perf_counter() - start}
@@ -0,0 +1,382 @@
+"""
+HtmlRenderer - Page Bodies as Sanitized HTML, Rendered Once per Content Hash
+"""
+
+import html
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .parse_cache import DEFAULT_CACHE_DIR, content_digest
+from .section_tree import CLOSING_HASHES_PATTERN, slugify
+from .tokenizer import HEADING_PATTERN, TABLE_CELL_SPLIT_PATTERN, TABLE_DELIMITER_PATTERN
+
+# Bump whenever the HTML produced for the same markdown changes (old files on disk are then ignored)
+RENDER_VERSION = 1
+
+# Rendered pages kept in memory, counted in characters of HTML
+MEMORY_BUDGET_CHARS = 16 * 1024 * 1024
+
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)\s*([\w+-]*)')
+RULE_PATTERN = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+
+# Inline patterns run on already-escaped text
+CODE_SPAN_PATTERN = re.compile(r'`([^`]+)`')
+# (url "optional title") - the url may hold balanced parentheses, as in Foo_(bar)
+LINK_TARGET = r'\(\s*((?:[^()\s]|\([^()\s]*\))+)(?:\s+&quot;.*?&quot;)?\s*\)'
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]' + LINK_TARGET)
+INLINE_LINK_PATTERN = re.compile(r'\[([^\]]*)\]' + LINK_TARGET)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+AUTOLINK_PATTERN = re.compile(r'&lt;((?:https?://|mailto:)[^\s&]+)&gt;')
+LINE_BREAK_PATTERN = re.compile(r'&lt;br\s*/?&gt;', re.IGNORECASE)
+EMPHASIS_PATTERNS = [
+    (re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<!\w)__(?=\S)(.+?)(?<=\S)__(?!\w)'), r'<strong>\1</strong>'),
+    (re.compile(r'\*(?=\S)(.+?)(?<=\S)\*'), r'<em>\1</em>'),
+    (re.compile(r'(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)'), r'<em>\1</em>'),
+    (re.compile(r'~~(?=\S)(.+?)(?<=\S)~~'), r'<del>\1</del>'),
+]
+STASH_PATTERN = re.compile('\x00(\\d+)\x00')
+
+# Links may only point at these schemes (or be relative / in-page)
+SAFE_URL_SCHEMES = frozenset(['http', 'https', 'mailto'])
+URL_SCHEME_PATTERN = re.compile(r'^([a-z][a-z0-9+.-]*):')
+URL_IGNORED_PATTERN = re.compile(r'[\x00-\x20\x7f]+')
+TABLE_ALIGNMENTS = {(True, False): 'left', (False, True): 'right', (True, True): 'center'}
+
+
+def render_markdown(text: str) -> str:
+    """
+    🖼️ Markdown to sanitized HTML in one pass over the lines
+
+    Every piece of page text is HTML-escaped and only a fixed set of tags is
+    generated, so raw HTML in a page shows up as text (except <br>). Link
+    targets are limited to SAFE_URL_SCHEMES. Heading ids match the section
+    tree anchors, so sections can be linked to.
+    """
+    renderer = _BlockRenderer()
+    for line in text.splitlines():
+        renderer.feed(line)
+    return renderer.close()
+
+
+class RenderCache:
+    """
+    🗄️ Rendered HTML keyed by a hash of the markdown, in memory and on disk
+
+    A card opened again - or kept open across Streamlit reruns - is served
+    from memory; after a restart the HTML comes back from disk. Edited
+    pages hash differently, so nothing ever needs invalidating.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, memory_budget: int = MEMORY_BUDGET_CHARS):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_budget = memory_budget
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "renders": 0}
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_chars = 0
+        self._lock = threading.Lock()
+
+    def render(self, text: str) -> str:
+        """
+        🖼️ Sanitized HTML for a page body (or section), rendered at most once per content
+        """
+        key = content_digest(f"{RENDER_VERSION}\n{text}".encode('utf-8', errors='surrogatepass'))
+
+        with self._lock:
+            rendered = self._memory.get(key)
+            if rendered is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return rendered
+
+        rendered = self._read_disk(key)
+        if rendered is not None:
+            self.stats["disk_hits"] += 1
+        else:
+            rendered = render_markdown(text)
+            self.stats["renders"] += 1
+            self._write_disk(key, rendered)
+
+        self._remember(key, rendered)
+        return rendered
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_chars = 0
+
+    # Helper methods for RenderCache
+
+    def _remember(self, key: str, rendered: str) -> None:
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = rendered
+            self._memory_chars += len(rendered)
+            while self._memory_chars > self.memory_budget and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_chars -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.html"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return self._path(key).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _write_disk(self, key: str, rendered: str) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(rendered, encoding='utf-8')
+            os.replace(temporary, path)  # Readers never see a half-written file
+        except OSError:
+            # A read-only or full disk only costs us the disk copy
+            try:
+                temporary.unlink()
+            except OSError:
+                pass
+
+
+_default_cache: Optional[RenderCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_render_cache() -> RenderCache:
+    """
+    🗄️ Process-wide render cache stored next to the parse cache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = RenderCache(os.path.join(DEFAULT_CACHE_DIR, "rendered"))
+        return _default_cache
+
+
+# Helpers for markdown rendering
+
+class _BlockRenderer:
+    """
+    🧱 Line-by-line block state machine: paragraphs, headings, lists, code, tables, quotes
+    """
+
+    def __init__(self):
+        self.out: List[str] = []
+        self.paragraph: List[str] = []
+        self.quote: List[str] = []
+        self.lists: List[tuple] = []  # (indent, tag) of every open list, outermost first
+        self.fence: Optional[str] = None
+        self.code: List[str] = []
+        self.code_language = ""
+        self.table_alignments: Optional[List[Optional[str]]] = None
+        self.anchors: Dict[str, int] = {}
+
+    def feed(self, line: str) -> None:
+        if self.fence is not None:
+            if line.strip().startswith(self.fence):
+                code = html.escape('\n'.join(self.code))
+                self.out.append(f'<pre><code{self.code_language}>{code}</code></pre>')
+                self.fence, self.code = None, []
+            else:
+                self.code.append(line)
+            return
+
+        if self.table_alignments is not None:
+            if '|' in line and line.strip():
+                self._table_row(line, 'td')
+                return
+            self.out.append('</tbody></table>')
+            self.table_alignments = None
+
+        stripped = line.strip()
+        if not stripped:
+            self._flush_paragraph()
+            self._flush_quote()
+            return
+
+        fence = FENCE_PATTERN.match(line)
+        if fence:
+            self._close_blocks()
+            self.fence = fence.group(1)
+            self.code_language = f' class="language-{fence.group(2)}"' if fence.group(2) else ''
+            return
+
+        # A delimiter row turns the line before it into a table header
+        if (TABLE_DELIMITER_PATTERN.match(stripped) and '|' in stripped
+                and self.paragraph and '|' in self.paragraph[-1]):
+            header = self.paragraph.pop()
+            self._close_blocks()
+            self.table_alignments = [
+                TABLE_ALIGNMENTS.get((cell.startswith(':'), cell.endswith(':')))
+                for cell in _split_cells(stripped)
+            ]
+            self.out.append('<table><thead>')
+            self._table_row(header, 'th')
+            self.out.append('</thead><tbody>')
+            return
+
+        heading = HEADING_PATTERN.match(stripped)
+        if heading:
+            self._close_blocks()
+            level = len(heading.group(1))
+            title = CLOSING_HASHES_PATTERN.sub('', heading.group(2))
+            self.out.append(f'<h{level} id="{html.escape(self._anchor(title))}">{_inline(title)}</h{level}>')
+            return
+
+        if RULE_PATTERN.match(line):
+            self._close_blocks()
+            self.out.append('<hr>')
+            return
+
+        if stripped.startswith('>'):
+            self._flush_paragraph()
+            self._close_lists()
+            self.quote.append(stripped[1:].strip())
+            return
+
+        item = LIST_ITEM_PATTERN.match(line)
+        if item:
+            self._flush_paragraph()
+            self._flush_quote()
+            self._list_item(len(item.group(1).expandtabs(4)), 'ol' if item.group(2)[0].isdigit() else 'ul',
+                            item.group(3))
+            return
+
+        if self.lists and line[:1].isspace():
+            # Indented text continues the open list item
+            self.out.append(' ' + _inline(stripped))
+            return
+
+        self._close_lists()
+        self._flush_quote()
+        self.paragraph.append(stripped)
+
+    def close(self) -> str:
+        if self.fence is not None:
+            self.feed(self.fence)
+        if self.table_alignments is not None:
+            self.out.append('</tbody></table>')
+            self.table_alignments = None
+        self._close_blocks()
+        return '\n'.join(self.out)
+
+    def _anchor(self, title: str) -> str:
+        # Same -1, -2 suffixes as the section tree, so ids match section anchors
+        anchor = slugify(title)
+        repeats = self.anchors.get(anchor, 0)
+        self.anchors[anchor] = repeats + 1
+        return f"{anchor}-{repeats}" if repeats else anchor
+
+    def _list_item(self, indent: int, tag: str, text: str) -> None:
+        lists = self.lists
+        while lists and (lists[-1][0] > indent or (lists[-1][0] == indent and lists[-1][1] != tag)):
+            self.out.append(f'</li></{lists.pop()[1]}>')
+        if lists and lists[-1][0] == indent:
+            self.out.append('</li><li>')
+        else:
+            lists.append((indent, tag))
+            self.out.append(f'<{tag}><li>')
+        self.out.append(_inline(text))
+
+    def _table_row(self, line: str, cell_tag: str) -> None:
+        cells = _split_cells(line.strip())
+        row = []
+        for position, cell in enumerate(cells):
+            alignment = self.table_alignments[position] if position < len(self.table_alignments) else None
+            style = f' style="text-align:{alignment}"' if alignment else ''
+            row.append(f'<{cell_tag}{style}>{_inline(cell)}</{cell_tag}>')
+        self.out.append('<tr>' + ''.join(row) + '</tr>')
+
+    def _flush_paragraph(self) -> None:
+        if self.paragraph:
+            self.out.append('<p>' + _inline('\n'.join(self.paragraph)) + '</p>')
+            self.paragraph = []
+
+    def _flush_quote(self) -> None:
+        if self.quote:
+            self.out.append('<blockquote><p>' + _inline('\n'.join(self.quote)) + '</p></blockquote>')
+            self.quote = []
+
+    def _close_lists(self) -> None:
+        while self.lists:
+            self.out.append(f'</li></{self.lists.pop()[1]}>')
+
+    def _close_blocks(self) -> None:
+        self._flush_paragraph()
+        self._flush_quote()
+        self._close_lists()
+
+
+def _split_cells(line: str) -> List[str]:
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in TABLE_CELL_SPLIT_PATTERN.split(line)]
+
+
+def _inline(text: str) -> str:
+    """
+    ✨ Escape a run of text, then add code spans, links and emphasis
+    """
+    stash: List[str] = []
+
+    def keep(fragment: str) -> str:
+        stash.append(fragment)
+        return f'\x00{len(stash) - 1}\x00'
+
+    def unstash(fragment: str) -> str:
+        while '\x00' in fragment:
+            fragment = STASH_PATTERN.sub(lambda match: stash[int(match.group(1))], fragment)
+        return fragment
+
+    def image(match) -> str:
+        # Alt text is plain text, even when the label held a code span
+        alt = TAG_PATTERN.sub('', unstash(match.group(1)))
+        url = _safe_url(match.group(2))
+        return keep(f'<img src="{url}" alt="{alt}">' if url and not url.startswith('mailto:') else alt)
+
+    def link(match) -> str:
+        # The label may already hold a stashed image (badge links)
+        label = _emphasis(match.group(1)) or match.group(2)
+        url = _safe_url(match.group(2))
+        return keep(f'<a href="{url}">{label}</a>' if url else label)
+
+    text = html.escape(text.replace('\x00', ''))
+    text = CODE_SPAN_PATTERN.sub(lambda match: keep(f'<code>{match.group(1)}</code>'), text)
+    text = IMAGE_PATTERN.sub(image, text)
+    text = INLINE_LINK_PATTERN.sub(link, text)
+    text = AUTOLINK_PATTERN.sub(lambda match: keep(f'<a href="{match.group(1)}">{match.group(1)}</a>'), text)
+    text = LINE_BREAK_PATTERN.sub(lambda match: keep('<br>'), text)
+    text = _emphasis(text)
+
+    # Stashed fragments can hold other stash markers (a code span or image inside link text)
+    return unstash(text)
+
+
+def _emphasis(text: str) -> str:
+    for pattern, replacement in EMPHASIS_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _safe_url(escaped_url: str) -> Optional[str]:
+    """
+    🛡️ The (still escaped) URL if its scheme is allowed, else None
+    """
+    scheme = URL_SCHEME_PATTERN.match(URL_IGNORED_PATTERN.sub('', html.unescape(escaped_url)).lower())
+    if scheme and scheme.group(1) not in SAFE_URL_SCHEMES:
+        return None
+    return escaped_url
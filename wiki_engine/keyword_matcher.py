@@ -0,0 +1,122 @@
+"""
+KeywordMatcher - Every Keyword List, One Compiled Pattern, One Pass
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Counted only when a whole whitespace-separated word matches
+TECHNICAL_TERMS = frozenset(['api', 'authentication', 'permission', 'validation', 'migration', 'database'])
+ACTION_WORDS = frozenset(['create', 'build', 'implement', 'manage', 'invite', 'configure'])
+
+# Found anywhere inside the text ("users" contains "user")
+TYPE_KEYWORDS = ('permission', 'account', 'management', 'user', 'registration', 'profile', 'api', 'endpoint')
+ENGAGING_WORDS = ('account', 'user', 'permission', 'invite', 'management', 'system', 'feature', 'implement', 'create')
+HEADING_VERBS = ('invite', 'remove', 'change', 'edit', 'manage', 'create')
+
+
+class KeywordMatcher:
+    """
+    🔎 Multi-group keyword matcher built on a single compiled alternation
+
+    Word groups count whole whitespace-separated words, substring groups
+    count keywords anywhere. Matches are leftmost-longest and do not
+    overlap, so "management" is one match that also credits "manage".
+    Counting happens in C via Counter(findall), and only the distinct
+    keywords found touch Python. Feed it lowercased text.
+    """
+
+    def __init__(self, word_groups: Dict[str, Iterable[str]], substring_groups: Dict[str, Iterable[str]]):
+        self.groups = list(word_groups) + list(substring_groups)
+
+        self._word_groups = self._invert(word_groups)
+        substrings = self._invert(substring_groups)
+
+        # keyword -> [(group, keyword), ...] earned by each match of it
+        self._credits: Dict[str, List[Tuple[str, str]]] = {
+            keyword: [(group, other) for other, groups in substrings.items() if keyword.startswith(other)
+                      for group in groups]
+            for keyword in set(self._word_groups) | set(substrings)
+        }
+
+        self._pattern = re.compile(self._trie_pattern(sorted(self._credits)) if self._credits else r'(?!)')
+
+    def scan(self, text: str, words: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        ⚡ One pass over text: group -> {keyword: occurrences}
+        
+        Pass words if the caller already has text.split() at hand.
+        """
+        hits = {group: {} for group in self.groups}
+        matches = Counter(self._pattern.findall(text))
+        if not matches:
+            return hits
+
+        for keyword, count in matches.items():
+            for group, credited in self._credits[keyword]:
+                bucket = hits[group]
+                bucket[credited] = bucket.get(credited, 0) + count
+
+        # Whole-word counts, only when a word keyword showed up at all
+        if not self._word_groups.keys().isdisjoint(matches):
+            words = words if words is not None else text.split()
+            for keyword, count in Counter(filter(self._word_groups.__contains__, words)).items():
+                for group in self._word_groups[keyword]:
+                    hits[group][keyword] = count
+
+        return hits
+
+    def find(self, text: str, group: str) -> List[str]:
+        """
+        🎯 Distinct keywords of one group in a short text (a title, a sentence)
+        """
+        found = []
+        words = None
+        for keyword in dict.fromkeys(self._pattern.findall(text)):
+            for credited_group, credited in self._credits[keyword]:
+                if credited_group == group and credited not in found:
+                    found.append(credited)
+            if group in self._word_groups.get(keyword, ()):
+                words = words if words is not None else text.split()
+                if keyword in words and keyword not in found:
+                    found.append(keyword)
+        return found
+
+    # Helper methods for KeywordMatcher
+
+    def _trie_pattern(self, keywords: List[str]) -> str:
+        """
+        🌲 Alternation factored into a trie ("m(?:anage(?:ment)?|igration)")
+        
+        Shared prefixes are only tried once per position, and at each
+        branch the longer keyword wins.
+        """
+        branches = {}
+        ends_here = False
+        for keyword in keywords:
+            if keyword:
+                branches.setdefault(keyword[0], []).append(keyword[1:])
+            else:
+                ends_here = True
+        
+        if not branches:
+            return ''
+        
+        alternatives = [re.escape(char) + self._trie_pattern(rest) for char, rest in sorted(branches.items())]
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        return '(?:' + body + ')?' if ends_here else body
+
+    def _invert(self, groups: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+        keywords = {}
+        for group, group_keywords in groups.items():
+            for keyword in group_keywords:
+                keywords.setdefault(keyword, []).append(group)
+        return keywords
+
+
+# Shared matcher for the parser and tokenizer, compiled once at import
+WIKI_KEYWORDS = KeywordMatcher(
+    word_groups={"technical": TECHNICAL_TERMS, "action": ACTION_WORDS},
+    substring_groups={"type": TYPE_KEYWORDS, "engaging": ENGAGING_WORDS, "heading_verbs": HEADING_VERBS},
+)
@@ -0,0 +1,198 @@
+"""
+LinkGraph - Who Links Where Across the Whole Wiki
+"""
+
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import unquote
+
+# Files a link can point at that are not wiki pages
+ASSET_EXTENSIONS = frozenset(['png', 'jpg', 'jpeg', 'gif', 'svg', 'webp', 'pdf', 'zip', 'csv', 'txt'])
+
+# Pages reached through the wiki chrome rather than links, never reported as orphans
+ROOT_PAGE_KEYS = frozenset(['home', '_sidebar', '_footer'])
+
+
+def page_key(name: str) -> str:
+    """
+    🔑 Normalised page name links resolve by ("docs/Account-Management.md" -> "account-management")
+    """
+    name = PurePosixPath(name).name
+    if name.lower().endswith('.md'):
+        name = name[:-3]
+    return name.strip().lower().replace(' ', '-')
+
+
+def link_key(target: str) -> Optional[str]:
+    """
+    🔗 Page key an internal link points at, or None for anchors, mail and asset links
+    """
+    target = target.strip()
+    if not target or target.startswith(('#', 'mailto:')) or '://' in target:
+        return None
+
+    target = unquote(target.split('#', 1)[0].split('?', 1)[0]).rstrip('/')
+    name = PurePosixPath(target).name if target else ''
+    if not name or name in ('.', '..'):
+        return None
+
+    extension = name.rpartition('.')[2].lower() if '.' in name else ''
+    if extension in ASSET_EXTENSIONS:
+        return None
+
+    return page_key(name)
+
+
+class LinkGraph:
+    """
+    🕸️ Wiki-wide internal link graph with forward and back edges
+
+    Links resolve by page name, the way GitHub wikis do, so "Permissions",
+    "./Permissions.md" and "docs/Permissions#roles" all reach
+    docs/Permissions.md. Pages are added, re-linked and removed one at a
+    time. Backlinks, orphans and broken links are kept up to date as edges
+    change, so each query is a dictionary lookup instead of a crawl.
+    """
+
+    def __init__(self):
+        # Forward edges: page -> {target key: link as written}
+        self._links: Dict[str, Dict[str, str]] = {}
+
+        # Back edges: target key -> pages linking to it (missing targets included)
+        self._linkers: Dict[str, Set[str]] = {}
+
+        self._pages_by_key: Dict[str, Set[str]] = {}
+        self._orphans: Set[str] = set()
+        self._broken: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def __contains__(self, page: object) -> bool:
+        return page in self._links
+
+    @property
+    def pages(self) -> List[str]:
+        return list(self._links)
+
+    def update_page(self, page: str, targets: Iterable[str]) -> Set[str]:
+        """
+        🔁 Add a page or replace its outgoing links (only the edges that differ are touched)
+
+        Args:
+            page: Wiki-relative page path
+            targets: Internal link URLs found on the page
+
+        Returns:
+            Pages whose backlinks changed
+        """
+        own_key = page_key(page)
+        changed = set()
+
+        if page not in self._links:
+            self._links[page] = {}
+            self._pages_by_key.setdefault(own_key, set()).add(page)
+            self._broken.discard(own_key)
+            if own_key in self._linkers:
+                changed.add(page)
+            elif own_key not in ROOT_PAGE_KEYS:
+                self._orphans.add(page)
+
+        new_links = {}
+        for target in targets:
+            key = link_key(target)
+            if key is not None and key != own_key:
+                new_links.setdefault(key, target)
+
+        old_links = self._links[page]
+        for key in old_links.keys() - new_links.keys():
+            changed |= self._unlink(page, key)
+        for key in new_links.keys() - old_links.keys():
+            changed |= self._link(page, key)
+
+        self._links[page] = new_links
+        return changed
+
+    def remove_page(self, page: str) -> Set[str]:
+        """
+        ➖ Drop a page and its outgoing links; links to it become broken
+
+        Returns:
+            Pages whose backlinks changed
+        """
+        links = self._links.pop(page, None)
+        if links is None:
+            return set()
+
+        changed = set()
+        for key in links:
+            changed |= self._unlink(page, key)
+
+        own_key = page_key(page)
+        same_name = self._pages_by_key[own_key]
+        same_name.discard(page)
+        if not same_name:
+            del self._pages_by_key[own_key]
+            if own_key in self._linkers:
+                self._broken.add(own_key)
+
+        self._orphans.discard(page)
+        changed.discard(page)
+        return changed
+
+    def backlinks(self, page: str) -> List[str]:
+        """
+        ⬅️ Pages that link to this page ("Referenced by")
+        """
+        return sorted(self._linkers.get(page_key(page), ()))
+
+    def links_from(self, page: str) -> List[str]:
+        """
+        ➡️ Existing pages this page links to
+        """
+        return sorted(linked for key in self._links.get(page, {}) for linked in self._pages_by_key.get(key, ()))
+
+    def is_orphan(self, page: str) -> bool:
+        return page in self._orphans
+
+    def orphans(self) -> List[str]:
+        """
+        🏝️ Pages nothing else links to (Home and the sidebar/footer excepted)
+        """
+        return sorted(self._orphans)
+
+    def broken_links(self) -> Dict[str, List[str]]:
+        """
+        💔 page -> internal links on it that lead to no page
+        """
+        report = {}
+        for key in self._broken:
+            for page in self._linkers[key]:
+                report.setdefault(page, []).append(self._links[page][key])
+        return {page: sorted(targets) for page, targets in sorted(report.items())}
+
+    # Helper methods for LinkGraph
+
+    def _link(self, page: str, key: str) -> Set[str]:
+        linkers = self._linkers.setdefault(key, set())
+        linkers.add(page)
+
+        targets = self._pages_by_key.get(key)
+        if targets is None:
+            self._broken.add(key)
+            return set()
+        if len(linkers) == 1:
+            self._orphans.difference_update(targets)
+        return set(targets)
+
+    def _unlink(self, page: str, key: str) -> Set[str]:
+        linkers = self._linkers[key]
+        linkers.discard(page)
+
+        targets = self._pages_by_key.get(key, set())
+        if not linkers:
+            del self._linkers[key]
+            self._broken.discard(key)
+            if key not in ROOT_PAGE_KEYS:
+                self._orphans.update(targets)
+        return set(targets)
@@ -0,0 +1,149 @@
+"""
+ParseCache - Remember Every Parsed Wiki Page Across Restarts
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Bump whenever the shape of parsed card dicts changes so stale entries are dropped
+CARD_FORMAT_VERSION = 7
+
+DEFAULT_CACHE_DIR = os.environ.get("WIKI_CACHE_DIR", ".wiki_cache")
+
+
+def content_hasher():
+    """
+    🧮 Incremental hasher matching content_digest (feed it with update())
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+def content_digest(data: bytes) -> str:
+    """
+    🔑 Content hash used to recognise unchanged pages
+    """
+    hasher = content_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class ParseCache:
+    """
+    💾 On-disk cache of parsed cards keyed by path, mtime, size and content hash
+
+    Entries live in a small SQLite database so they survive process restarts
+    and Streamlit reruns, and can be shipped with a container image or
+    mounted volume to start from a warm cache.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "parse_cache.sqlite3"
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        🔍 Return the cached entry for a page (mtime_ns, size, digest, card) or None
+        """
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT mtime_ns, size, digest, card FROM parsed_pages WHERE path = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            card = pickle.loads(row[3])
+        except Exception:
+            return None
+
+        return {"mtime_ns": row[0], "size": row[1], "digest": row[2], "card": card}
+
+    def put(self, key: str, mtime_ns: int, size: int, digest: str, card: Dict) -> None:
+        """
+        💾 Store a parsed card along with the file state it was parsed from
+        """
+        blob = pickle.dumps(card, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO parsed_pages (path, mtime_ns, size, digest, card) VALUES (?, ?, ?, ?, ?)",
+                    (key, mtime_ns, size, digest, blob)
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            # A read-only or full disk should never break parsing - we just lose the cache entry
+            pass
+
+    def discard(self, key: str) -> None:
+        """
+        🗑️ Forget a page (e.g. after it was deleted from the wiki)
+        """
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM parsed_pages WHERE path = ?", (key,))
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self) -> None:
+        """
+        🧹 Drop every cached entry
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM parsed_pages")
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM parsed_pages").fetchone()[0]
+
+    def __getstate__(self) -> Dict:
+        # Connections and locks stay with the process that opened them
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # Helper methods for ParseCache
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        🔌 Open (and if needed create) the cache database on first use
+        """
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CARD_FORMAT_VERSION:
+                conn.execute("DROP TABLE IF EXISTS parsed_pages")
+                conn.execute(f"PRAGMA user_version = {CARD_FORMAT_VERSION}")
+
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_pages ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest TEXT, card BLOB)"
+            )
+            conn.commit()
+            self._conn = conn
+
+        return self._conn
@@ -0,0 +1,204 @@
+"""
+PermissionsMatrix - Role x Permission Tables as Bitsets You Can Query
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+# pandas is optional - only table_to_dataframe needs it
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Cell values that grant or deny a permission
+GRANTED_MARKS = frozenset(['✅', '✔', '✔️', '✓', '☑️', 'yes', 'y', 'x', 'true', 'allowed'])
+DENIED_MARKS = frozenset(['➖', '❌', '✖', '✗', '-', '—', 'no', 'n', 'false', 'denied', ''])
+
+# Share of body cells that must be marks for a table to count as a matrix
+MATRIX_MARK_RATIO = 0.8
+
+NAME_SPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_name(name: str) -> str:
+    """
+    🔤 Case- and spacing-insensitive form of a role or permission name
+    """
+    return NAME_SPACE_PATTERN.sub(' ', name.replace('**', '').replace('`', '')).strip().lower()
+
+
+def is_permissions_table(table: Dict) -> bool:
+    """
+    🔍 True if a columnar table looks like a role x permission matrix
+    """
+    columns = table["columns"]
+    if len(columns) < 2 or not columns[0]:
+        return False
+
+    cells = [normalize_name(cell) for column in columns[1:] for cell in column]
+    marks = sum(1 for cell in cells if cell in GRANTED_MARKS or cell in DENIED_MARKS)
+    granted = sum(1 for cell in cells if cell in GRANTED_MARKS)
+    return granted > 0 and marks >= MATRIX_MARK_RATIO * len(cells)
+
+
+def table_to_dataframe(table: Dict):
+    """
+    🐼 A columnar table as a pandas DataFrame (requires pandas)
+    """
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas is required for table_to_dataframe")
+    return pd.DataFrame(dict(zip(table["header"], table["columns"])))
+
+
+class PermissionsMatrix:
+    """
+    🔐 One role x permission table packed into bitsets
+
+    Every permission row is an int with one bit per role, and every role
+    column an int with one bit per permission. A question such as "who can
+    invite members" or "what can a Manager do" is then a dict lookup plus
+    a few bit operations. Names match case- and spacing-insensitively.
+    """
+
+    def __init__(self, table: Dict, source: str = ""):
+        self.source = source
+        self.roles: List[str] = list(table["header"][1:])
+        self.permissions: List[str] = list(table["columns"][0])
+
+        self.permission_masks: List[int] = [0] * len(self.permissions)
+        self.role_masks: List[int] = [0] * len(self.roles)
+        for role_bit, column in enumerate(table["columns"][1:]):
+            for permission_bit, cell in enumerate(column):
+                if normalize_name(cell) in GRANTED_MARKS:
+                    self.permission_masks[permission_bit] |= 1 << role_bit
+                    self.role_masks[role_bit] |= 1 << permission_bit
+
+        self._role_index = {normalize_name(role): bit for bit, role in enumerate(self.roles)}
+        self._permission_index = {normalize_name(name): bit for bit, name in enumerate(self.permissions)}
+
+    def __repr__(self) -> str:
+        return f"PermissionsMatrix({self.source!r}, {len(self.roles)} roles, {len(self.permissions)} permissions)"
+
+    def can(self, role: str, permission: str) -> bool:
+        """
+        ✅ Does the role hold the (exactly named) permission?
+        """
+        role_bit = self._role_index.get(normalize_name(role))
+        permission_bit = self._permission_index.get(normalize_name(permission))
+        if role_bit is None or permission_bit is None:
+            return False
+        return bool(self.permission_masks[permission_bit] >> role_bit & 1)
+
+    def roles_with(self, permission: str) -> List[str]:
+        """
+        👥 Roles granted a permission
+
+        An exact name wins; otherwise a partial name ("invite") covers every
+        permission that mentions it.
+        """
+        mask = 0
+        for permission_bit in self.match_permissions(permission):
+            mask |= self.permission_masks[permission_bit]
+        return self._decode(mask, self.roles)
+
+    def permissions_of(self, role: str) -> List[str]:
+        """
+        📋 Permissions a role holds, in table order
+        """
+        role_bit = self._role_index.get(normalize_name(role))
+        return self._decode(self.role_masks[role_bit], self.permissions) if role_bit is not None else []
+
+    def roles_with_all(self, permissions: Iterable[str]) -> List[str]:
+        """
+        🤝 Roles granted every one of the (exactly named) permissions
+        """
+        mask = (1 << len(self.roles)) - 1
+        for permission in permissions:
+            permission_bit = self._permission_index.get(normalize_name(permission))
+            mask &= self.permission_masks[permission_bit] if permission_bit is not None else 0
+        return self._decode(mask, self.roles)
+
+    def match_permissions(self, query: str) -> List[int]:
+        """
+        🔎 Row numbers of the permissions a (possibly partial) name refers to
+        """
+        query = normalize_name(query)
+        exact = self._permission_index.get(query)
+        if exact is not None:
+            return [exact]
+        return [bit for name, bit in self._permission_index.items() if query and query in name]
+
+    def has_role(self, role: str) -> bool:
+        return normalize_name(role) in self._role_index
+
+    # Helper methods for PermissionsMatrix
+
+    def _decode(self, mask: int, names: List[str]) -> List[str]:
+        found = []
+        while mask:
+            low_bit = mask & -mask
+            found.append(names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return found
+
+
+class PermissionsIndex:
+    """
+    🗂️ Every permissions matrix in the wiki, kept per page version
+
+    Pages are added or replaced from their parsed tables as they change,
+    so questions never re-parse markdown. Queries combine every matrix
+    unless one page is named.
+    """
+
+    def __init__(self):
+        self._matrices: Dict[str, List[PermissionsMatrix]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(matrices) for matrices in self._matrices.values())
+
+    @property
+    def pages(self) -> List[str]:
+        return list(self._matrices)
+
+    def update_page(self, page: str, tables: List[Dict]) -> int:
+        """
+        🔁 Replace a page's matrices from its parsed tables; returns how many it has
+        """
+        matrices = [PermissionsMatrix(table, page) for table in tables if is_permissions_table(table)]
+        if matrices:
+            self._matrices[page] = matrices
+        else:
+            self._matrices.pop(page, None)
+        return len(matrices)
+
+    def remove_page(self, page: str) -> bool:
+        return self._matrices.pop(page, None) is not None
+
+    def matrices(self, page: Optional[str] = None) -> List[PermissionsMatrix]:
+        if page is not None:
+            return list(self._matrices.get(page, []))
+        return [matrix for matrices in self._matrices.values() for matrix in matrices]
+
+    def roles_with(self, permission: str, page: Optional[str] = None) -> List[str]:
+        """
+        👥 Which roles have permission X (across the wiki or one page)
+        """
+        roles = {}
+        for matrix in self.matrices(page):
+            roles.update(dict.fromkeys(matrix.roles_with(permission)))
+        return list(roles)
+
+    def permissions_of(self, role: str, page: Optional[str] = None) -> List[str]:
+        """
+        📋 What can this role do (across the wiki or one page)
+        """
+        permissions = {}
+        for matrix in self.matrices(page):
+            permissions.update(dict.fromkeys(matrix.permissions_of(role)))
+        return list(permissions)
+
+    def can(self, role: str, permission: str, page: Optional[str] = None) -> bool:
+        return any(matrix.can(role, permission) for matrix in self.matrices(page))
@@ -0,0 +1,342 @@
+"""
+SearchIndex - BM25 Full-Text Search Over the Wiki
+"""
+
+import heapq
+import json
+import math
+import operator
+import os
+import re
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .tokenizer import TERM_PATTERN, MarkdownTokenizer
+
+INDEX_MAGIC = b"WSIX"
+INDEX_FORMAT_VERSION = 1
+
+# Fast zlib level - postings are rewritten on every sync that changes pages
+INDEX_COMPRESSION_LEVEL = 1
+
+# Standard Okapi BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+
+class SearchIndex:
+    """
+    🔎 Positional inverted index with BM25 ranking
+
+    Pages are indexed from the tokenizer's terms (term -> page -> positions)
+    and updated one file at a time as syncs report changes. On disk the
+    postings are delta-encoded uint32 runs, zlib-compressed. Loading only
+    reads the term table; a term's postings are decoded the first time a
+    query or update touches it, and untouched runs are copied straight
+    through on the next save. Queries are ranked with BM25; "quoted
+    phrases" must appear verbatim.
+    """
+
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = Path(index_path) if index_path else None
+        self._reset()
+
+        if self.index_path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def pages(self) -> List[str]:
+        return list(self._doc_by_page)
+
+    def index_file(self, page: str, card_id: str, file_path: Path, search_doc: Optional[Dict] = None) -> bool:
+        """
+        📥 (Re)index one page unless it is unchanged since last time
+
+        search_doc is the parser's {"size", "mtime_ns", "terms"} for the page
+        (WikiParser.take_search_doc), so the page is not read or tokenized
+        again. Without it (a parse cache hit while the index lost the page,
+        or a streamed page) the file is read and tokenized here.
+
+        Returns:
+            True when the page was (re)indexed
+        """
+        if search_doc is not None:
+            size, mtime_ns = search_doc["size"], search_doc["mtime_ns"]
+        else:
+            stat = os.stat(file_path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+
+        doc = self._doc_by_page.get(page)
+        if doc is not None:
+            _, indexed_card_id, _, indexed_size, indexed_mtime_ns = self._docs[doc]
+            if (indexed_size, indexed_mtime_ns, indexed_card_id) == (size, mtime_ns, card_id):
+                return False
+
+        if search_doc is not None:
+            terms = search_doc["terms"].split()
+        else:
+            tokens = MarkdownTokenizer(collect_terms=True)
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    tokens.feed(line)
+            tokens.close()
+            terms = tokens.terms
+
+        self.add_page(page, card_id, terms, size, mtime_ns)
+        return True
+
+    def add_page(self, page: str, card_id: str, terms: List[str], size: int = 0, mtime_ns: int = 0) -> None:
+        """
+        ➕ Index a page from its term list, replacing any earlier version
+        """
+        self.remove_page(page)
+
+        doc = self._next_doc
+        self._next_doc += 1
+
+        positions: Dict[str, array] = {}
+        for position, term in enumerate(terms):
+            term_positions = positions.get(term)
+            if term_positions is None:
+                term_positions = positions[term] = array('I')
+            term_positions.append(position)
+
+        doc_terms = array('I')
+        for term, term_positions in positions.items():
+            self._postings_for(term, create=True)[doc] = term_positions
+            doc_terms.append(self._term_ids[term])
+
+        self._docs[doc] = [page, card_id, len(terms), size, mtime_ns]
+        self._doc_by_page[page] = doc
+        self._doc_terms[doc] = doc_terms
+        self._total_length += len(terms)
+        self._dirty = True
+
+    def remove_page(self, page: str) -> bool:
+        """
+        ➖ Drop a page from the index; True if it was there
+        """
+        doc = self._doc_by_page.pop(page, None)
+        if doc is None:
+            return False
+
+        for term_id in self._doc_terms.pop(doc):
+            self._postings_for(self._terms[term_id]).pop(doc, None)
+
+        self._total_length -= self._docs.pop(doc)[2]
+        self._dirty = True
+        return True
+
+    def search(self, query: str, k: int = 10) -> List[str]:
+        """
+        🎯 Card ids of the k best matches for a query, best first
+        """
+        return [self._docs[doc][1] for doc, _ in self._top_docs(query, k)]
+
+    def search_pages(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        📄 (page, BM25 score) for the k best matches, best first
+        """
+        return [(self._docs[doc][0], score) for doc, score in self._top_docs(query, k)]
+
+    def save(self, force: bool = False) -> None:
+        """
+        💾 Write the index to index_path (atomically) if anything changed
+        """
+        if self.index_path is None or not (self._dirty or force):
+            return
+
+        # Section 1 - per term: for each doc (ascending) -> doc gap, tf, position gaps
+        blob = array('I')
+        term_table = []
+        for term_id, term in enumerate(self._terms):
+            start = len(blob)
+            packed = self._packed.get(term_id)
+            if packed is not None:
+                # Never decoded since the last load, so the stored run is still exact
+                blob.extend(self._blob[packed[0]:packed[0] + packed[1]])
+            else:
+                previous_doc = 0
+                postings = self._postings.get(term_id, {})
+                for doc in sorted(postings):
+                    term_positions = postings[doc]
+                    blob.append(doc - previous_doc)
+                    blob.append(len(term_positions))
+                    blob.append(term_positions[0])
+                    blob.extend(map(operator.sub, term_positions[1:], term_positions[:-1]))
+                    previous_doc = doc
+            term_table.append([term, start, len(blob) - start])
+
+        # Section 2 - per doc: the term ids it holds (to undo it on removal)
+        docs = []
+        for doc, fields in self._docs.items():
+            docs.append([doc] + fields + [len(blob), len(self._doc_terms[doc])])
+            blob.extend(self._doc_terms[doc])
+
+        if sys.byteorder != 'little':
+            blob.byteswap()
+
+        header = {"version": INDEX_FORMAT_VERSION, "docs": docs, "terms": term_table}
+        header_bytes = zlib.compress(json.dumps(header, separators=(',', ':')).encode('utf-8'))
+        payload = (INDEX_MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes
+                   + zlib.compress(blob.tobytes(), INDEX_COMPRESSION_LEVEL))
+
+        # Every session may save the same shared index, so each writer gets its own temp file
+        temp_path = self.index_path.with_name(
+            f"{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return  # Search keeps working from memory; we retry on the next save
+
+        if sys.byteorder != 'little':
+            blob.byteswap()
+        self._blob = blob
+        self._packed = {term_id: (start, count) for term_id, (_, start, count) in enumerate(term_table)
+                        if term_id not in self._postings}
+        self._dirty = False
+
+    def load(self) -> bool:
+        """
+        📂 Replace the in-memory index with the saved one (False if none/unreadable)
+        """
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+            if data[:4] != INDEX_MAGIC:
+                return False
+            header_length = struct.unpack('<I', data[4:8])[0]
+            header = json.loads(zlib.decompress(data[8:8 + header_length]))
+            if header.get("version") != INDEX_FORMAT_VERSION:
+                return False
+            blob = array('I')
+            blob.frombytes(zlib.decompress(data[8 + header_length:]))
+        except (OSError, ValueError, KeyError, zlib.error, struct.error):
+            return False
+
+        if sys.byteorder != 'little':
+            blob.byteswap()
+
+        self._reset()
+        self._blob = blob
+        for term_id, (term, start, count) in enumerate(header["terms"]):
+            self._terms.append(term)
+            self._term_ids[term] = term_id
+            self._packed[term_id] = (start, count)
+
+        for doc, page, card_id, length, size, mtime_ns, start, count in header["docs"]:
+            self._docs[doc] = [page, card_id, length, size, mtime_ns]
+            self._doc_by_page[page] = doc
+            self._doc_terms[doc] = blob[start:start + count]
+            self._total_length += length
+
+        self._next_doc = max(self._docs, default=-1) + 1
+        return True
+
+    # Helper methods for SearchIndex
+
+    def _reset(self) -> None:
+        # doc number -> [page, card_id, length, size, mtime_ns]
+        self._docs: Dict[int, List] = {}
+        self._doc_by_page: Dict[str, int] = {}
+        self._doc_terms: Dict[int, array] = {}
+
+        # Append-only term table; postings are keyed by term id
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._postings: Dict[int, Dict[int, array]] = {}
+
+        # Term id -> (offset, length) of its still-encoded run in _blob
+        self._blob = array('I')
+        self._packed: Dict[int, Tuple[int, int]] = {}
+
+        self._total_length = 0
+        self._next_doc = 0
+        self._dirty = False
+
+    def _postings_for(self, term: str, create: bool = False) -> Dict[int, array]:
+        """
+        📬 A term's postings (doc -> positions), decoding them on first use
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            if not create:
+                return {}
+            term_id = self._term_ids[term] = len(self._terms)
+            self._terms.append(term)
+
+        postings = self._postings.get(term_id)
+        if postings is not None:
+            return postings
+
+        postings = self._postings[term_id] = {}
+        packed = self._packed.pop(term_id, None)
+        if packed is not None:
+            blob = self._blob
+            offset, end = packed[0], packed[0] + packed[1]
+            doc = 0
+            while offset < end:
+                doc += blob[offset]
+                tf = blob[offset + 1]
+                postings[doc] = array('I', accumulate(blob[offset + 2:offset + 2 + tf]))
+                offset += 2 + tf
+        return postings
+
+    def _top_docs(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """
+        🏆 BM25-score every page holding a query term, keep the k best
+        """
+        query = query.lower()
+        phrases = [TERM_PATTERN.findall(phrase) for phrase in PHRASE_PATTERN.findall(query)]
+        terms = list(dict.fromkeys(TERM_PATTERN.findall(query)))
+        if not terms or not self._docs:
+            return []
+
+        doc_count = len(self._docs)
+        average_length = self._total_length / doc_count or 1
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self._postings_for(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, term_positions in postings.items():
+                tf = len(term_positions)
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._docs[doc][2] / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        for phrase in phrases:
+            if len(phrase) > 1:
+                scores = {doc: score for doc, score in scores.items() if self._has_phrase(doc, phrase)}
+
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], self._docs[item[0]][0]))
+
+    def _has_phrase(self, doc: int, phrase: List[str]) -> bool:
+        """
+        🧵 True if the terms appear back to back in the page
+        """
+        try:
+            followers = [set(self._postings_for(term)[doc]) for term in phrase[1:]]
+            starts = self._postings_for(phrase[0])[doc]
+        except KeyError:
+            return False
+        return any(all(start + i + 1 in positions for i, positions in enumerate(followers)) for start in starts)
@@ -0,0 +1,77 @@
+"""
+SectionTree - A Page's Heading Outline, Each Section Addressable by Anchor
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional
+
+# GitHub-style anchors: lowercase, punctuation dropped, spaces become hyphens
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\- ]')
+LINK_TEXT_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+CLOSING_HASHES_PATTERN = re.compile(r'\s+#+$')
+
+
+def slugify(title: str) -> str:
+    """
+    🔗 Anchor slug for a heading ("1. Invite new Members" -> "1-invite-new-members")
+    """
+    text = LINK_TEXT_PATTERN.sub(r'\1', title.strip().lower())
+    return SLUG_STRIP_PATTERN.sub('', text).replace(' ', '-')
+
+
+def build_section_tree(headings: List[Dict], page_end: int) -> List[Dict]:
+    """
+    🌳 Nest the tokenizer's headings into a section tree
+
+    Each node is {"level", "title", "anchor", "start", "end", "children"}.
+    A section runs from its heading line up to the next heading of the same
+    or a higher level, so its byte range [start, end) includes its
+    subsections. Repeated anchors get -1, -2, ... like on GitHub.
+    """
+    roots = []
+    stack = []
+    anchors = {}
+
+    for heading in headings:
+        title = CLOSING_HASHES_PATTERN.sub('', heading["text"])
+        anchor = slugify(title)
+        repeats = anchors.get(anchor, 0)
+        anchors[anchor] = repeats + 1
+        if repeats:
+            anchor = f"{anchor}-{repeats}"
+
+        node = {"level": heading["level"], "title": title, "anchor": anchor,
+                "start": heading["offset"], "end": page_end, "children": []}
+
+        while stack and stack[-1]["level"] >= node["level"]:
+            stack.pop()["end"] = node["start"]
+        (stack[-1]["children"] if stack else roots).append(node)
+        stack.append(node)
+
+    return roots
+
+
+def iter_sections(tree: List[Dict]) -> Iterator[Dict]:
+    """
+    🚶 Every section in page order (depth first)
+    """
+    for node in tree:
+        yield node
+        yield from iter_sections(node["children"])
+
+
+def find_section(tree: List[Dict], key: str) -> Optional[Dict]:
+    """
+    🎯 Look a section up by anchor ("#permissions" works too) or by title
+    """
+    key = key.strip().lstrip('#')
+    slug = slugify(key)
+    by_title = None
+
+    for node in iter_sections(tree):
+        if node["anchor"] == key:
+            return node
+        if by_title is None and (node["title"].lower() == key.lower() or node["anchor"] == slug):
+            by_title = node
+
+    return by_title
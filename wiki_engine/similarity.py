@@ -0,0 +1,214 @@
+"""
+Similarity - MinHash Page Signatures and an LSH Index for Near-Duplicates
+"""
+
+import zlib
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Optional, Set
+
+# NumPy is optional - it only speeds up the per-bucket minimum on big batches
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# One-permutation MinHash: each shingle hash lands in one of SIGNATURE_SIZE buckets
+SIGNATURE_SIZE = 64
+BUCKET_BITS = 6
+VALUE_MASK = (1 << (32 - BUCKET_BITS)) - 1
+EMPTY_BUCKET = 0xFFFFFFFF
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# 8 bands x 8 rows: pages at Jaccard ~0.77 and up usually share a band
+LSH_BANDS = 8
+LSH_ROWS = SIGNATURE_SIZE // LSH_BANDS
+
+DUPLICATE_THRESHOLD = 0.8
+
+# Shingle hashes are reduced this many at a time, keeping temporaries small
+HASH_CHUNK_SIZE = 4096
+
+# Knuth's multiplicative constant spreads crc32's low-entropy bits across the word
+HASH_MIX = 0x9E3779B1
+
+
+class MinHasher:
+    """
+    🧬 Incremental MinHash over word shingles, fed in batches of words
+
+    Uses one-permutation hashing: a single stable hash (crc32, mixed)
+    picks each shingle's bucket and value, and every bucket keeps its
+    minimum. Empty buckets on short pages are filled by rotation, so any
+    two signatures can always be compared. Hashes do not depend on the
+    process, so signatures computed in worker processes and cached on
+    disk can still be compared.
+    """
+
+    def __init__(self):
+        self._minimums = [EMPTY_BUCKET] * SIGNATURE_SIZE
+        self._tail: List[str] = []
+        self._shingles = 0
+
+    def update(self, words: List[str]) -> None:
+        """
+        📥 Add the next words of the page (shingles run across batches)
+        """
+        # Shingles straddling the previous batch, then the ones inside this one (islice avoids list copies)
+        head = self._tail + words[:SHINGLE_SIZE - 1]
+        straddling = [' '.join(head[start:start + SHINGLE_SIZE]) for start in range(len(head) - SHINGLE_SIZE + 1)]
+        inner = map(' '.join, zip(*(islice(words, offset, None) for offset in range(SHINGLE_SIZE))))
+        count = len(straddling) + max(0, len(words) - SHINGLE_SIZE + 1)
+        self._tail = (self._tail + words[-(SHINGLE_SIZE - 1):])[-(SHINGLE_SIZE - 1):]
+        if not count:
+            return
+        hashes = map(zlib.crc32, map(str.encode, chain(straddling, inner)))
+
+        minimums = self._minimums
+        if NUMPY_AVAILABLE:
+            for start in range(0, count, HASH_CHUNK_SIZE):
+                size = min(HASH_CHUNK_SIZE, count - start)
+                mixed = np.fromiter(hashes, dtype=np.uint32, count=size) * np.uint32(HASH_MIX)
+                batch = np.full(SIGNATURE_SIZE, EMPTY_BUCKET, dtype=np.uint32)
+                np.minimum.at(batch, mixed >> np.uint32(32 - BUCKET_BITS), mixed & np.uint32(VALUE_MASK))
+                minimums = [min(pair) for pair in zip(minimums, batch.tolist())]
+            self._minimums = minimums
+        else:
+            for crc in hashes:
+                mixed = (crc * HASH_MIX) & 0xFFFFFFFF
+                bucket = mixed >> (32 - BUCKET_BITS)
+                value = mixed & VALUE_MASK
+                if value < minimums[bucket]:
+                    minimums[bucket] = value
+
+        self._shingles += count
+
+    def signature(self) -> Optional[bytes]:
+        """
+        🔏 SIGNATURE_SIZE x uint32 as bytes (None when the page had no shingles)
+        """
+        if not self._shingles:
+            return None
+
+        minimums = self._minimums
+        filled = list(minimums)
+        for bucket, value in enumerate(minimums):
+            if value != EMPTY_BUCKET:
+                continue
+            # Borrow the next non-empty bucket to the right, marked with the distance
+            for distance in range(1, SIGNATURE_SIZE):
+                borrowed = minimums[(bucket + distance) % SIGNATURE_SIZE]
+                if borrowed != EMPTY_BUCKET:
+                    filled[bucket] = (borrowed + distance * (VALUE_MASK + 1)) & 0xFFFFFFFF
+                    break
+
+        return b''.join(value.to_bytes(4, 'little') for value in filled)
+
+
+def estimate_similarity(first: bytes, second: bytes) -> float:
+    """
+    ≈ Estimated Jaccard similarity of two signatures (share of equal buckets)
+    """
+    width = 4
+    equal = sum(first[i:i + width] == second[i:i + width] for i in range(0, len(first), width))
+    return equal / SIGNATURE_SIZE
+
+
+class SimilarityIndex:
+    """
+    🗃️ LSH index over page signatures for sub-linear near-duplicate lookups
+
+    A signature is cut into LSH_BANDS bands. Pages sharing any band are
+    candidates, and candidates are then checked against the full
+    signature. Only pages with a colliding band are ever compared.
+    """
+
+    def __init__(self, threshold: float = DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self._signatures: Dict[str, bytes] = {}
+        self._buckets: Dict[bytes, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, page: object) -> bool:
+        return page in self._signatures
+
+    @property
+    def pages(self) -> List[str]:
+        return list(self._signatures)
+
+    def add_page(self, page: str, signature: Optional[bytes]) -> None:
+        """
+        ➕ Index (or re-index) a page; a None signature just removes it
+        """
+        self.remove_page(page)
+        if not signature:
+            return
+        self._signatures[page] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(page)
+
+    def remove_page(self, page: str) -> bool:
+        signature = self._signatures.pop(page, None)
+        if signature is None:
+            return False
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets[band_key]
+            bucket.discard(page)
+            if not bucket:
+                del self._buckets[band_key]
+        return True
+
+    def near_duplicates(self, page: str, threshold: Optional[float] = None) -> List[str]:
+        """
+        👯 Pages whose estimated similarity to this one reaches the threshold
+        """
+        signature = self._signatures.get(page)
+        if signature is None:
+            return []
+        threshold = self.threshold if threshold is None else threshold
+
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates |= self._buckets[band_key]
+        candidates.discard(page)
+        return sorted(other for other in candidates
+                      if estimate_similarity(signature, self._signatures[other]) >= threshold)
+
+    def clusters(self, pages: Optional[Iterable[str]] = None, threshold: Optional[float] = None) -> List[List[str]]:
+        """
+        🧺 Groups of near-duplicate pages (connected components, 2+ pages each)
+
+        Args:
+            pages: Restrict clustering to these pages (and keep their order)
+        """
+        order = list(pages) if pages is not None else sorted(self._signatures)
+        allowed = {page: position for position, page in enumerate(order) if page in self._signatures}
+        parent = {page: page for page in allowed}
+
+        def root(page: str) -> str:
+            while parent[page] != page:
+                parent[page] = parent[parent[page]]
+                page = parent[page]
+            return page
+
+        for page in allowed:
+            for other in self.near_duplicates(page, threshold):
+                if other in allowed:
+                    first, second = root(page), root(other)
+                    if first != second:
+                        parent[max(first, second, key=allowed.get)] = min(first, second, key=allowed.get)
+
+        groups: Dict[str, List[str]] = {}
+        for page in allowed:
+            groups.setdefault(root(page), []).append(page)
+        return [group for group in groups.values() if len(group) > 1]
+
+    # Helper methods for SimilarityIndex
+
+    def _band_keys(self, signature: bytes) -> List[bytes]:
+        width = LSH_ROWS * 4
+        return [bytes([band]) + signature[band * width:(band + 1) * width] for band in range(LSH_BANDS)]
@@ -0,0 +1,322 @@
+"""
+MarkdownTokenizer - One Pass Over a Page, Every Signal the Parser Needs
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .keyword_matcher import WIKI_KEYWORDS
+from .similarity import MinHasher
+
+# Line-level patterns (applied to one line at a time, never the whole page)
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+BULLET_PATTERN = re.compile(r'^\s*[-*+]\s+(.+)$')
+NUMBERED_PATTERN = re.compile(r'^\s*\d+\.\s+(.+)$')
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+TERM_PATTERN = re.compile(r'\w+')
+TABLE_DELIMITER_PATTERN = re.compile(r'^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$')
+TABLE_CELL_SPLIT_PATTERN = re.compile(r'(?<!\\)\|')
+
+# Markdown formatting stripped from summary text
+SUMMARY_CLEANUP = [
+    (re.compile(r'#{1,6}\s+'), ''),                    # Headers
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),           # Bold
+    (re.compile(r'\*([^*]+)\*'), r'\1'),               # Italic
+    (re.compile(r'`([^`]+)`'), r'\1'),                 # Inline code
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),     # Links, keep text
+    (re.compile(r'\|.*\|'), ''),                       # Table rows
+]
+
+# Summaries only look at the first few sentences, so stop collecting early
+SUMMARY_SENTENCE_LIMIT = 10
+SUMMARY_MIN_SENTENCE_LENGTH = 20
+
+# Sentences longer than this are never summary candidates, so an unterminated
+# sentence is only buffered up to here (the fallback summary is shorter still)
+SUMMARY_MAX_SENTENCE_LENGTH = 200
+
+# Non-heading lines kept for the collapsed card preview
+PREVIEW_LINE_LIMIT = 3
+
+# Lines are keyword-scanned in batches of about this many characters
+KEYWORD_BATCH_SIZE = 64 * 1024
+
+
+class MarkdownTokenizer:
+    """
+    🧩 Walks a markdown page once and records everything the parser asks about
+
+    Feed it lines with ``feed`` (or a whole page with ``tokenize``) and read
+    headings, list items, links, tables (as columns), table/code counters,
+    word statistics and summary sentences straight off the instance. Word
+    and keyword counts are gathered in batches, so they are only complete
+    after close().
+    Feed lines with their original endings (\r\n included) and each
+    heading's "offset" is its byte position in the file.
+    """
+
+    def __init__(self, collect_terms: bool = False, start_offset: int = 0, signature: bool = False):
+        self.headings: List[Dict] = []
+        self.bullets: List[str] = []
+        self.numbered: List[str] = []
+        self.links: List[Tuple[str, str]] = []
+        self.sentences: List[str] = []
+        self.preview_lines: List[str] = []
+        self.tables: List[Dict] = []
+        self.keywords_seen = set()
+
+        # Lowercased word terms in page order (search indexing only)
+        self.collect_terms = collect_terms
+        self.terms: List[str] = []
+
+        # MinHash of the page's word shingles (near-duplicate detection only)
+        self._minhash = MinHasher() if signature else None
+
+        self.word_count = 0
+        self.line_count = 1
+        self.character_count = 0
+        self.byte_count = start_offset  # File offset: UTF-8 bytes fed, line endings as given
+        self.technical_terms = 0
+        self.action_words = 0
+        self.bullet_points = 0
+        self.fence_markers = 0
+        self.table_lines = 0
+        self.table_rows = 0
+        self.has_tables = False
+        self.has_pipe = False
+        self.has_lists = False
+
+        self._keyword_batch: List[str] = []
+        self._keyword_batch_size = 0
+        self._in_code = False
+        self._table_header: Optional[List[str]] = None
+        self._table: Optional[Dict] = None
+        self._lines_fed = 0
+        self._line_offset = 0
+        self._pending_sentence = ""
+        self._pending_truncated = False
+        self._summary_done = False
+        self._closed = False
+
+    @classmethod
+    def tokenize(cls, content: str, collect_terms: bool = False, start_offset: int = 0,
+                 signature: bool = False) -> "MarkdownTokenizer":
+        """
+        ⚡ Tokenize a complete page held in memory (start_offset: where content begins in the file)
+        """
+        tokenizer = cls(collect_terms, start_offset, signature)
+        for line in content.splitlines(keepends=True):
+            tokenizer.feed(line)
+        return tokenizer.close()
+
+    def feed(self, line: str) -> None:
+        """
+        📥 Consume one line (with or without its trailing newline)
+        """
+        self._lines_fed += 1
+        self._line_offset = self.byte_count
+        length = len(line)
+        self.byte_count += length if line.isascii() else len(line.encode('utf-8'))
+        if line.endswith('\n'):
+            self.line_count += 1
+            line = line[:-1]
+            if line.endswith('\r'):
+                line = line[:-1]
+                length -= 1  # \r\n counts as one character, as in a text-mode read
+        elif line.endswith('\r'):
+            self.line_count += 1  # Old Mac line ending
+            line = line[:-1]
+        self.character_count += length
+
+        stripped = line.strip()
+        if stripped and len(self.preview_lines) < PREVIEW_LINE_LIMIT and not stripped.startswith('#'):
+            self.preview_lines.append(stripped)
+
+        # Word and keyword statistics once a batch of lines has built up
+        self._keyword_batch.append(line)
+        self._keyword_batch_size += len(line)
+        if self._keyword_batch_size >= KEYWORD_BATCH_SIZE:
+            self._scan_keywords()
+
+        # Tables
+        if '|' in line:
+            self.has_pipe = True
+            self.table_lines += 1
+            if stripped.startswith('|'):
+                self.table_rows += 1
+            if line.count('|') >= 2:
+                self.has_tables = True
+
+        # Code fences (counted like the original ```...``` pairing)
+        if '```' in line:
+            self.fence_markers += line.count('```')
+
+        if stripped.startswith(('-', '*', '+')):
+            self.has_lists = True
+
+        # Links
+        if '](' in line:
+            self.links.extend(LINK_PATTERN.findall(line))
+
+        # Structure - headings and list items outside fenced code only
+        if stripped.startswith('```'):
+            self._in_code = not self._in_code
+            self._table_header = self._table = None
+        elif not self._in_code:
+            self._feed_structure(line)
+
+        if not self._summary_done:
+            self._feed_summary(line)
+
+    def close(self) -> "MarkdownTokenizer":
+        """
+        ✅ Flush any partial sentence; returns self for chaining
+        """
+        if not self._closed:
+            self._closed = True
+            self._scan_keywords()
+            if not self._summary_done:
+                self._add_sentence(self._pending_sentence)
+            self._pending_sentence = ""
+            self._pending_truncated = False
+        return self
+
+    @property
+    def code_blocks(self) -> int:
+        return self.fence_markers // 2
+
+    @property
+    def has_code(self) -> bool:
+        return self.fence_markers > 0
+
+    @property
+    def signature(self) -> Optional[bytes]:
+        """
+        🔏 MinHash signature of the page (tokenize with signature=True; after close())
+        """
+        return self._minhash.signature() if self._minhash is not None else None
+    
+    @property
+    def title_heading(self) -> Optional[str]:
+        """
+        🏷️ First level 1-3 heading, the page's natural title
+        """
+        for heading in self.headings:
+            if heading["level"] <= 3:
+                return heading["text"]
+        return None
+
+    # Internal helpers
+
+    def _scan_keywords(self) -> None:
+        """
+        🔎 Count words and run one matcher pass over the batched lines
+        """
+        if not self._keyword_batch:
+            return
+        text = '\n'.join(self._keyword_batch).lower()
+        self._keyword_batch = []
+        self._keyword_batch_size = 0
+
+        words = text.split()
+        self.word_count += len(words)
+        if self.collect_terms:
+            self.terms.extend(TERM_PATTERN.findall(text))
+        if self._minhash is not None:
+            self._minhash.update(words)
+        hits = WIKI_KEYWORDS.scan(text, words)
+        self.technical_terms += sum(hits["technical"].values())
+        self.action_words += sum(hits["action"].values())
+        self.keywords_seen.update(hits["type"])
+
+    def _feed_structure(self, line: str) -> None:
+        if '|' in line:
+            self._feed_table(line.strip())
+        elif self._table_header is not None or self._table is not None:
+            self._table_header = self._table = None
+        
+        first = line.lstrip()[:1]
+        if first == '#':
+            match = HEADING_PATTERN.match(line)
+            if match:
+                self.headings.append({
+                    "level": len(match.group(1)),
+                    "text": match.group(2).strip(),
+                    "line": self._lines_fed,
+                    "offset": self._line_offset
+                })
+        elif first in ('-', '*', '+'):
+            match = BULLET_PATTERN.match(line)
+            if match:
+                self.bullet_points += 1
+                self.bullets.append(match.group(1).strip())
+        elif first.isdigit():
+            match = NUMBERED_PATTERN.match(line)
+            if match:
+                self.numbered.append(match.group(1).strip())
+
+    def _feed_table(self, line: str) -> None:
+        """
+        📋 Collect pipe tables column by column (header row, delimiter row, body rows)
+        """
+        if self._table is not None:
+            cells = self._split_cells(line)
+            for position, column in enumerate(self._table["columns"]):
+                column.append(cells[position] if position < len(cells) else "")
+        elif self._table_header is not None and TABLE_DELIMITER_PATTERN.match(line):
+            self._table = {"header": self._table_header,
+                           "columns": [[] for _ in self._table_header],
+                           "line": self._lines_fed - 1}
+            self.tables.append(self._table)
+        else:
+            self._table_header = self._split_cells(line)
+
+    def _split_cells(self, line: str) -> List[str]:
+        if line.startswith('|'):
+            line = line[1:]
+        if line.endswith('|') and not line.endswith('\\|'):
+            line = line[:-1]
+        return [cell.strip().replace('**', '').replace('\\|', '|')
+                for cell in TABLE_CELL_SPLIT_PATTERN.split(line)]
+
+    def _feed_summary(self, line: str) -> None:
+        for pattern, replacement in SUMMARY_CLEANUP:
+            line = pattern.sub(replacement, line)
+
+        # Only the new line is split; the pending fragment never holds a terminator
+        parts = SENTENCE_SPLIT_PATTERN.split(line + '\n')
+        if not self._pending_truncated:
+            parts[0] = self._pending_sentence + parts[0]
+        elif len(parts) == 1:
+            return  # Still inside an over-long sentence; its prefix is already kept
+        else:
+            parts[0] = self._pending_sentence
+
+        self._pending_sentence = parts.pop()
+        self._pending_truncated = False
+        for part in parts:
+            self._add_sentence(part)
+            if self._summary_done:
+                return
+        self._cap_pending()
+
+    def _cap_pending(self) -> None:
+        text = self._pending_sentence.strip()
+        if len(text) <= SUMMARY_MAX_SENTENCE_LENGTH:
+            return
+        # Keep a real prefix that still strips to more than the limit
+        rest = text[SUMMARY_MAX_SENTENCE_LENGTH:]
+        cut = SUMMARY_MAX_SENTENCE_LENGTH + len(rest) - len(rest.lstrip()) + 1
+        self._pending_sentence = text[:cut]
+        self._pending_truncated = True
+
+    def _add_sentence(self, text: str) -> None:
+        sentence = text.strip()
+        if not sentence:
+            return
+        if len(self.sentences) < SUMMARY_SENTENCE_LIMIT or len(sentence) > SUMMARY_MIN_SENTENCE_LENGTH:
+            self.sentences.append(sentence)
+        if len(self.sentences) >= SUMMARY_SENTENCE_LIMIT and any(
+                len(s) > SUMMARY_MIN_SENTENCE_LENGTH for s in self.sentences):
+            self._summary_done = True
@@ -2,12 +2,34 @@
 WikiParser - Transform Git Wiki Markdown into Social Feed Gold
 """
 
+import difflib
 import os
-import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from multiprocessing import get_context
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .content_ref import ContentRef
+from .file_index import WikiFileIndex
+from .front_matter import front_matter_datetime, read_front_matter, split_front_matter
+from .git_objects import BlobRef, GitObjectReader
+from .keyword_matcher import WIKI_KEYWORDS
+from .parse_cache import DEFAULT_CACHE_DIR, ParseCache, content_digest, content_hasher
+from .section_tree import build_section_tree, find_section
+from .tokenizer import TERM_PATTERN, MarkdownTokenizer
+
+# Below this many pages to parse, a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 32
+
+# Pages at least this big are parsed line by line instead of read whole
+STREAM_THRESHOLD = 1024 * 1024
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Cards parsed from git blobs, memoised per (page, blob id) across snapshots
+BLOB_CARD_CACHE_ENTRIES = 4096
+
 class WikiParser:
     """
     🔍 The brain that transforms boring markdown into engaging social cards
@@ -15,9 +37,29 @@ class WikiParser:
     Monday Madness Level: EXPERT! 🚀
     """
     
-    def __init__(self, wiki_directory: str = "clients-hub-wiki"):
+    def __init__(self, wiki_directory: str = "clients-hub-wiki", cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 stream_threshold: Optional[int] = STREAM_THRESHOLD, body_limit: Optional[int] = None):
         self.wiki_dir = Path(wiki_directory)
         self.last_parsed = {}
+        self.cache = ParseCache(cache_dir) if cache_dir else None
+        self.file_index = WikiFileIndex(self.wiki_dir)
+        
+        # Streaming mode: pages of stream_threshold bytes or more (None = never) are
+        # tokenized straight from a buffered reader; body_limit caps how many bytes
+        # of a page its card's ContentRef will ever load (None = whole page)
+        self.stream_threshold = stream_threshold
+        self.body_limit = body_limit
+        
+        # md_file -> ((mtime_ns, size), front matter) for header-only listings
+        self._front_matter = {}
+        
+        # (md_file, blob id) -> card for pages read from the git object store
+        self._blob_cards = OrderedDict()
+        
+        # With collect_search_docs on (the feed's search index turns it on), each
+        # fresh parse also keeps its search terms here until take_search_doc
+        self.collect_search_docs = False
+        self._search_docs = {}
         
     def parse_markdown_to_card(self, md_file: str) -> Dict:
         """
@@ -27,125 +69,276 @@ class WikiParser:
             md_file: Path to markdown file
             
         Returns:
-            Dict containing card data (title, summary, content, metadata)
+            Dict containing card data (title, summary, content_ref, metadata)
         """
         file_path = self.wiki_dir / md_file
         
         if not file_path.exists():
-            return {
-                "title": "File Not Found",
-                "summary": "Wiki file could not be located",
-                "content": "",
-                "metadata": {"error": "file_not_found"},
-                "status": "error"
-            }
+            return self._file_not_found_card()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract title from first heading or filename
-            title = self._extract_title(content, md_file)
+            cached = self.cache.get(self._cache_key(md_file)) if self.cache is not None else None
             
-            # Generate engaging summary
-            summary = self.generate_summary(content)
+            # Cheap check first: unchanged stat fields mean an unchanged page
+            stat = file_path.stat()
+            if self._is_fresh(cached, stat):
+                return cached["card"]
             
-            # Extract metadata
-            metadata = self.extract_metadata(content)
+            card, stat, digest = self._read_and_parse(md_file, cached["digest"] if cached else None)
+            return self._remember(md_file, cached, card, stat, digest)
             
-            # Calculate metrics
-            metrics = self.calculate_content_metrics(content)
+        except Exception as e:
+            return self._parse_error_card(md_file, e)
+    
+    def parse_all(self, md_files: Optional[List[str]] = None, workers: Optional[int] = None,
+                  chunk_size: int = 16) -> List[Dict]:
+        """
+        🏭 Parse many pages at once, spreading the work over a process pool
+        
+        Cache hits are served in-process; only pages that actually need
+        parsing are shipped to workers in chunks. A file that fails to parse
+        yields an error card instead of aborting the batch.
+        
+        Args:
+            md_files: Wiki-relative page paths (defaults to every wiki page)
+            workers: Worker processes (defaults to the CPUs available to us)
+            chunk_size: Pages per task sent to a worker
             
-            # Extract features
-            features = self.extract_features_from_content(content)
+        Returns:
+            List of card dicts in the same order as md_files
+        """
+        if md_files is None:
+            md_files = self.list_wiki_pages()
+        
+        if workers is None:
+            workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        
+        results = [None] * len(md_files)
+        jobs = []
+        
+        for index, md_file in enumerate(md_files):
+            file_path = self.wiki_dir / md_file
+            cached = self.cache.get(self._cache_key(md_file)) if self.cache is not None else None
+            try:
+                fresh = self._is_fresh(cached, file_path.stat())
+            except OSError:
+                fresh = False
             
-            return {
-                "id": f"wiki_{md_file.replace('.md', '').replace('-', '_')}",
-                "title": title,
-                "summary": summary,
-                "content": content,
-                "metadata": {
-                    **metadata,
-                    "file_name": md_file,
-                    "file_path": str(file_path),
-                    "features": features,
-                    "metrics": metrics
-                },
-                "type": self._determine_card_type(title, content),
-                "timestamp": datetime.fromtimestamp(file_path.stat().st_mtime),
-                "status": "success",
-                "monday_madness_level": "MAXIMUM! 🚀"
-            }
+            if fresh:
+                results[index] = cached["card"]
+            else:
+                jobs.append((index, md_file, cached))
+        
+        # Small batches are not worth the cost of starting worker processes
+        if workers <= 1 or len(jobs) < PARALLEL_MIN_PAGES:
+            for index, md_file, _ in jobs:
+                results[index] = self.parse_markdown_to_card(md_file)
+            return results
+        
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            futures = [
+                pool.submit(_parse_chunk, str(self.wiki_dir), self.stream_threshold, self.body_limit,
+                            self.collect_search_docs,
+                            [(md_file, cached["digest"] if cached else None) for _, md_file, cached in chunk])
+                for chunk in chunks
+            ]
             
-        except Exception as e:
-            return {
-                "title": "Parse Error",
-                "summary": f"Error parsing {md_file}",
-                "content": "",
-                "metadata": {"error": str(e)},
-                "status": "error"
-            }
+            for chunk, future in zip(chunks, futures):
+                try:
+                    parsed = future.result()
+                except Exception:
+                    # A crashed worker only costs us its chunk - parse it here instead
+                    parsed = None
+                
+                for position, (index, md_file, cached) in enumerate(chunk):
+                    if parsed is None:
+                        results[index] = self.parse_markdown_to_card(md_file)
+                        continue
+                    
+                    card, stat, digest = parsed[position]
+                    if stat is None:
+                        results[index] = card
+                    else:
+                        results[index] = self._remember(md_file, cached, card, stat, digest)
+        
+        return results
+    
+    def parse_page_at(self, md_file: str, commit: str, objects: GitObjectReader) -> Dict:
+        """
+        🕰️ Parse a page as it was at a commit, read from the git object store
+        
+        The blob comes over the reader's long-lived cat-file pipe: no
+        checkout, no working-tree read and no process per page. Its card's
+        content_ref is a BlobRef, so opening it reads the same blob.
+        
+        Returns:
+            Card dict (a file-not-found error card if the page did not exist then)
+        """
+        blob = objects.blob_id(commit, md_file)
+        if blob is None:
+            return self._file_not_found_card()
+        return self._parse_blob(md_file, blob, objects, objects.commit_time(commit))
+    
+    def parse_snapshot(self, commit: str, objects: GitObjectReader) -> Dict[str, Dict]:
+        """
+        📸 Cards for every page as of a commit - a point-in-time view of the wiki
+        
+        Pages are listed by walking the commit's trees over the same pipe.
+        Cards are memoised per blob, so pages unchanged between two
+        snapshots are only parsed once.
+        """
+        modified = objects.commit_time(commit)
+        pages = objects.list_files(commit, suffix=".md")
+        return {
+            md_file: self._parse_blob(md_file, blob, objects, modified)
+            for md_file, blob in sorted(pages.items())
+            if not any(part.startswith('.') for part in md_file.split('/'))  # Hidden like the file index
+        }
+    
+    def get_all_wiki_files(self) -> List[Path]:
+        """
+        📂 Get all markdown files from the wiki directory (nested folders included)
+        """
+        return [self.wiki_dir / md_file for md_file in self.list_wiki_pages()]
+    
+    def list_wiki_pages(self) -> List[str]:
+        """
+        📁 Wiki-relative paths of every page, refreshed cheaply from the file index
+        """
+        self.file_index.refresh()
+        return sorted(self.file_index.pages)
+    
+    def invalidate(self, md_file: str) -> None:
+        """
+        🧹 Drop any cached parse for a page (e.g. after it was deleted)
+        """
+        self._search_docs.pop(md_file, None)
+        if self.cache is not None:
+            self.cache.discard(self._cache_key(md_file))
+    
+    def take_search_doc(self, md_file: str) -> Optional[Dict]:
+        """
+        🔎 Search terms from the page's latest parse, handed over once (see collect_search_docs)
+        
+        Returns:
+            {"size", "mtime_ns", "terms"} for SearchIndex.index_file, or None
+            when the page was served from the cache or streamed
+        """
+        return self._search_docs.pop(md_file, None)
+    
+    def get_section(self, md_file: str, anchor: str) -> Optional[str]:
+        """
+        📑 Text of one section of a page, found by anchor or heading title
+        
+        The section's byte range comes from the (cached) section tree, so
+        only that slice of the file is read - the rest of the page is
+        neither loaded nor re-parsed unless it changed on disk.
+        
+        Returns:
+            The heading line and everything under it (subsections included),
+            or None if the page has no such section
+        """
+        card = self.parse_markdown_to_card(md_file)
+        section = find_section(card.get("metadata", {}).get("sections", []), anchor)
+        if section is None:
+            return None
+        return ContentRef(card["metadata"]["file_path"], section["start"], section["end"]).read()
+    
+    def read_front_matter(self, md_file: str) -> Dict:
+        """
+        🧾 A page's front matter, reading only its header block (memoised per file version)
+        """
+        file_path = self.wiki_dir / md_file
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return {}
+        
+        version = (stat.st_mtime_ns, stat.st_size)
+        known = self._front_matter.get(md_file)
+        if known is None or known[0] != version:
+            known = self._front_matter[md_file] = (version, read_front_matter(file_path)[0])
+        return known[1]
+    
+    def list_front_matter(self, sort_by: Optional[str] = None, reverse: bool = False) -> List[Tuple[str, Dict]]:
+        """
+        📇 (page, front matter) for every page, optionally sorted by one key
+        
+        Only header blocks are read, so the wiki can be listed and ordered
+        without loading any page body. Pages missing the key sort last.
+        """
+        listing = [(md_file, self.read_front_matter(md_file)) for md_file in self.list_wiki_pages()]
+        if sort_by is not None:
+            present = [entry for entry in listing if entry[1].get(sort_by) is not None]
+            missing = [entry for entry in listing if entry[1].get(sort_by) is None]
+            present.sort(key=lambda entry: (str(type(entry[1][sort_by])), entry[1][sort_by]), reverse=reverse)
+            listing = present + missing
+        return listing
+    
+    def get_tables(self, md_file: str) -> List[Dict]:
+        """
+        📋 A page's tables as {"header", "columns", "line"} dicts (cached per page version)
+        """
+        card = self.parse_markdown_to_card(md_file)
+        return card.get("metadata", {}).get("tables", [])
+    
+    def tokenize(self, content: str) -> MarkdownTokenizer:
+        """
+        🧩 Run the single-pass tokenizer over a page
+        """
+        return MarkdownTokenizer.tokenize(content)
     
-    def extract_metadata(self, content: str) -> Dict:
+    def extract_metadata(self, content: str, tokens: Optional[MarkdownTokenizer] = None) -> Dict:
         """
         📊 Extract juicy metadata from markdown content
         """
+        tokens = tokens or self.tokenize(content)
         metadata = {}
         
         # Extract headings for navigation
-        headings = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-        metadata["headings"] = headings
+        metadata["headings"] = [heading["text"] for heading in tokens.headings]
         
-        # Extract tables (for permissions matrix, etc.)
-        table_matches = re.findall(r'\|.*\|', content)
-        metadata["has_tables"] = len(table_matches) > 0
-        metadata["table_count"] = len([line for line in content.split('\n') if '|' in line and line.strip().startswith('|')])
+        # Extract tables (for permissions matrix, etc.) - header plus one list per column
+        metadata["has_tables"] = tokens.has_tables
+        metadata["table_count"] = tokens.table_rows
+        metadata["tables"] = tokens.tables
         
         # Extract code blocks
-        code_blocks = re.findall(r'```[\s\S]*?```', content)
-        metadata["code_blocks"] = len(code_blocks)
+        metadata["code_blocks"] = tokens.code_blocks
         
         # Extract links
-        links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
-        metadata["external_links"] = [{"text": text, "url": url} for text, url in links if url.startswith('http')]
-        metadata["internal_links"] = [{"text": text, "url": url} for text, url in links if not url.startswith('http')]
+        metadata["external_links"] = [{"text": text, "url": url} for text, url in tokens.links if url.startswith('http')]
+        metadata["internal_links"] = [{"text": text, "url": url} for text, url in tokens.links if not url.startswith('http')]
         
         # Detect content type based on keywords
-        content_lower = content.lower()
-        if "permission" in content_lower and "|" in content:
+        seen = tokens.keywords_seen
+        if "permission" in seen and tokens.has_pipe:
             metadata["content_type"] = "permissions_matrix"
-        elif "account" in content_lower and "management" in content_lower:
+        elif "account" in seen and "management" in seen:
             metadata["content_type"] = "account_management"
-        elif "user" in content_lower and ("registration" in content_lower or "profile" in content_lower):
+        elif "user" in seen and ("registration" in seen or "profile" in seen):
             metadata["content_type"] = "user_system"
         else:
             metadata["content_type"] = "general_documentation"
             
         return metadata
     
-    def generate_summary(self, full_content: str, max_length: int = 150) -> str:
+    def generate_summary(self, full_content: str, max_length: int = 150,
+                         tokens: Optional[MarkdownTokenizer] = None) -> str:
         """
         📝 Create punchy summaries that make people want to expand
         """
-        # Remove markdown formatting for clean summary
-        clean_content = re.sub(r'#{1,6}\s+', '', full_content)  # Remove headers
-        clean_content = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_content)  # Remove bold
-        clean_content = re.sub(r'\*([^*]+)\*', r'\1', clean_content)  # Remove italic
-        clean_content = re.sub(r'`([^`]+)`', r'\1', clean_content)  # Remove code
-        clean_content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', clean_content)  # Remove links, keep text
-        clean_content = re.sub(r'\|.*\|', '', clean_content)  # Remove table rows
-        
-        # Split into sentences and find the most engaging ones
-        sentences = [s.strip() for s in re.split(r'[.!?]+', clean_content) if s.strip()]
+        # Sentences come from the tokenizer with markdown formatting already removed
+        tokens = tokens or self.tokenize(full_content)
+        sentences = tokens.sentences
         
         # Prioritize sentences with action words and technical terms
-        engaging_words = ['account', 'user', 'permission', 'invite', 'management', 'system', 'feature', 'implement', 'create']
-        
         scored_sentences = []
-        for sentence in sentences[:10]:  # Only check first 10 sentences
-            if len(sentence) > 20 and len(sentence) < 200:  # Good length
-                score = sum(1 for word in engaging_words if word.lower() in sentence.lower())
-                scored_sentences.append((score, sentence))
+        for sentence in self.summary_candidates(full_content, tokens):
+            score = len(WIKI_KEYWORDS.find(sentence.lower(), "engaging"))
+            scored_sentences.append((score, sentence))
         
         # Sort by score and length preference
         scored_sentences.sort(key=lambda x: (x[0], -abs(len(x[1]) - 100)), reverse=True)
@@ -162,43 +355,83 @@ class WikiParser:
             
         return summary
     
+    def summary_candidates(self, content: str, tokens: Optional[MarkdownTokenizer] = None) -> List[str]:
+        """
+        🗒️ Sentences worth considering as a summary: the first 10, if a good length
+        """
+        sentences = (tokens or self.tokenize(content)).sentences
+        return [sentence for sentence in sentences[:10] if 20 < len(sentence) < 200]
+    
     def detect_changes(self, old_content: str, new_content: str) -> List[str]:
         """
         🔄 Detect what changed in wiki content for activity feed
+        
+        Returns:
+            One line per changed section, e.g. "Permissions section edited (+3/-1 lines)"
         """
-        # TODO: Diff analysis
-        return []
+        return [self._describe_change(change) for change in self.diff_sections(old_content, new_content)]
     
-    def get_all_wiki_files(self) -> List[Path]:
+    def diff_sections(self, old_content: str, new_content: str) -> List[Dict]:
         """
-        📂 Get all markdown files from wiki directory
+        🧬 Section-level diff between two versions of a page
+        
+        Sections are delimited by headings and hashed first, so unchanged
+        sections cost one digest comparison; only edited sections get a
+        line diff. A renamed heading shows up as removed + added.
+        
+        Returns:
+            List of {"section", "change" (added/removed/edited),
+            "lines_added", "lines_removed"} dicts in page order (a removed
+            section sits where it was, before the next surviving section)
         """
-        if not self.wiki_dir.exists():
-            return []
+        old_sections = self._split_sections(old_content)
+        new_sections = self._split_sections(new_content)
+        old_keys = list(old_sections)
+        old_positions = {key: position for position, key in enumerate(old_keys)}
+        changes = []
+        next_old = 0  # Old sections before this one have been placed
+        
+        def place_removed(up_to: int) -> None:
+            for key in old_keys[next_old:up_to]:
+                if key not in new_sections:
+                    title, lines, _ = old_sections[key]
+                    changes.append({"section": title, "change": "removed",
+                                    "lines_added": 0, "lines_removed": len(lines)})
         
-        return list(self.wiki_dir.glob("*.md"))
+        for key, (title, lines, digest) in new_sections.items():
+            position = old_positions.get(key)
+            if position is not None and position >= next_old:
+                place_removed(position)
+                next_old = position + 1
+            
+            previous = old_sections.get(key)
+            if previous is None:
+                changes.append({"section": title, "change": "added",
+                                "lines_added": len(lines), "lines_removed": 0})
+            elif previous[2] != digest:
+                added, removed = self._count_line_changes(previous[1], lines)
+                changes.append({"section": title, "change": "edited",
+                                "lines_added": added, "lines_removed": removed})
+        
+        place_removed(len(old_keys))
+        return changes
     
-    def extract_features_from_content(self, content: str) -> List[str]:
+    def extract_features_from_content(self, content: str,
+                                      tokens: Optional[MarkdownTokenizer] = None) -> List[str]:
         """
         ⭐ Extract feature bullets and lists from markdown
         """
+        tokens = tokens or self.tokenize(content)
         features = []
         
-        # Extract bullet points
-        bullet_pattern = r'^[\s]*[-*+]\s+(.+)$'
-        bullets = re.findall(bullet_pattern, content, re.MULTILINE)
-        features.extend([bullet.strip() for bullet in bullets if len(bullet.strip()) > 5])
-        
-        # Extract numbered lists
-        numbered_pattern = r'^[\s]*\d+\.\s+(.+)$'
-        numbered = re.findall(numbered_pattern, content, re.MULTILINE)
-        features.extend([item.strip() for item in numbered if len(item.strip()) > 5])
+        # Bullet points, then numbered lists
+        features.extend([bullet for bullet in tokens.bullets if len(bullet) > 5])
+        features.extend([item for item in tokens.numbered if len(item) > 5])
         
         # Extract features from headings (likely features if they're action-oriented)
-        headings = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-        for heading in headings:
-            if any(word in heading.lower() for word in ['invite', 'remove', 'change', 'edit', 'manage', 'create']):
-                features.append(heading.strip())
+        for heading in tokens.headings:
+            if WIKI_KEYWORDS.find(heading["text"].lower(), "heading_verbs"):
+                features.append(heading["text"])
         
         # Remove duplicates while preserving order
         seen = set()
@@ -210,32 +443,33 @@ class WikiParser:
         
         return unique_features[:10]  # Limit to top 10 features
     
-    def calculate_content_metrics(self, content: str) -> Dict:
+    def calculate_content_metrics(self, content: str, tokens: Optional[MarkdownTokenizer] = None,
+                                  features: Optional[List[str]] = None) -> Dict:
         """
         📈 Calculate engagement metrics for content
         """
-        words = content.split()
-        lines = content.split('\n')
+        tokens = tokens or self.tokenize(content)
+        if features is None:
+            features = self.extract_features_from_content(content, tokens)
+        word_count = tokens.word_count
         
         # Calculate complexity based on various factors
         complexity_factors = {
-            "technical_terms": sum(1 for word in words if word.lower() in 
-                                 ['api', 'authentication', 'permission', 'validation', 'migration', 'database']),
-            "code_blocks": len(re.findall(r'```[\s\S]*?```', content)),
-            "bullet_points": len(re.findall(r'^[\s]*[-*+]\s+', content, re.MULTILINE)),
-            "headings": len(re.findall(r'^#{1,6}\s+', content, re.MULTILINE)),
-            "tables": len([line for line in lines if '|' in line and line.strip()])
+            "technical_terms": tokens.technical_terms,
+            "code_blocks": tokens.code_blocks,
+            "bullet_points": tokens.bullet_points,
+            "headings": len(tokens.headings),
+            "tables": tokens.table_lines
         }
         
         complexity_score = min(100, sum(complexity_factors.values()) * 5)
         
         # Calculate engagement potential
         engagement_indicators = {
-            "action_words": sum(1 for word in words if word.lower() in 
-                              ['create', 'build', 'implement', 'manage', 'invite', 'configure']),
-            "has_examples": '```' in content,
-            "has_lists": any(line.strip().startswith(('-', '*', '+')) for line in lines),
-            "good_length": 100 < len(words) < 1000
+            "action_words": tokens.action_words,
+            "has_examples": tokens.has_code,
+            "has_lists": tokens.has_lists,
+            "good_length": 100 < word_count < 1000
         }
         
         engagement_score = sum(engagement_indicators.values()) * 25
@@ -251,16 +485,16 @@ class WikiParser:
             engagement_level = "Building up... 📈"
         
         return {
-            "word_count": len(words),
-            "line_count": len(lines),
-            "character_count": len(content),
+            "word_count": word_count,
+            "line_count": tokens.line_count,
+            "character_count": tokens.character_count,
             "complexity_score": complexity_score,
             "engagement_score": engagement_score,
-            "feature_count": len(self.extract_features_from_content(content)),
+            "feature_count": len(features),
             "table_count": complexity_factors["tables"],
             "code_blocks": complexity_factors["code_blocks"],
             "headings": complexity_factors["headings"],
-            "estimated_read_time": max(1, len(words) // 200),  # Assume 200 words per minute
+            "estimated_read_time": max(1, word_count // 200),  # Assume 200 words per minute
             "engagement_potential": engagement_level,
             "complexity_factors": complexity_factors,
             "monday_madness_approved": engagement_score > 50
@@ -268,44 +502,376 @@ class WikiParser:
     
     # Helper methods for WikiParser
     
-    def _extract_title(self, content: str, filename: str) -> str:
+    def _extract_title(self, content: str, filename: str,
+                       tokens: Optional[MarkdownTokenizer] = None) -> str:
         """
         🏷️ Extract title from content or generate from filename
         """
         # Try to find first heading
-        heading_match = re.search(r'^#{1,3}\s+(.+)$', content, re.MULTILINE)
-        if heading_match:
-            return heading_match.group(1).strip()
+        heading = (tokens or self.tokenize(content)).title_heading
+        if heading:
+            return heading
         
         # Fallback to filename without extension, formatted nicely
         title = filename.replace('.md', '').replace('-', ' ').replace('_', ' ')
         return ' '.join(word.capitalize() for word in title.split())
     
-    def _determine_card_type(self, title: str, content: str) -> str:
+    def _build_card(self, md_file: str, file_path: Path, tokens: MarkdownTokenizer,
+                    mtime: float, body_end: Optional[int] = None,
+                    front_matter: Optional[Dict] = None, body_start: int = 0,
+                    content_ref: Optional[BlobRef] = None) -> Dict:
+        """
+        🏗️ Assemble the card dict from a page's token stream
+        
+        Everything below reads from tokens, so the page text itself is not
+        needed (and never held when streaming). Front matter values
+        (title, summary, type, date) override what the heuristics infer.
+        """
+        content = ""
+        front_matter = front_matter or {}
+        
+        # Extract title from front matter, first heading or filename
+        title = str(front_matter.get("title") or self._extract_title(content, md_file, tokens))
+        
+        # Generate engaging summary (unless the page states its own)
+        explicit_summary = front_matter.get("summary") or front_matter.get("description")
+        if explicit_summary:
+            summary = str(explicit_summary)
+            summary = summary if len(summary) <= 150 else summary[:147] + "..."
+        else:
+            summary = self.generate_summary(content, tokens=tokens)
+        
+        # Extract metadata
+        metadata = self.extract_metadata(content, tokens)
+        
+        # Extract features
+        features = self.extract_features_from_content(content, tokens)
+        
+        # Calculate metrics
+        metrics = self.calculate_content_metrics(content, tokens, features)
+        
+        return {
+            "id": f"wiki_{md_file.replace('.md', '').replace('-', '_')}",
+            "title": title,
+            "summary": summary,
+            "summary_candidates": ([str(explicit_summary)] if explicit_summary
+                                   else self.summary_candidates(content, tokens)),
+            "content_ref": content_ref or ContentRef(str(file_path), body_start, body_end),
+            "preview_lines": tokens.preview_lines,
+            "metadata": {
+                **metadata,
+                "sections": build_section_tree(tokens.headings, tokens.byte_count),
+                "front_matter": front_matter,
+                "signature": tokens.signature,
+                "file_name": md_file,
+                "file_path": str(file_path),
+                "features": features,
+                "metrics": metrics
+            },
+            "type": self._card_type(front_matter) or self._determine_card_type(title, content, tokens),
+            "timestamp": front_matter_datetime(front_matter) or datetime.fromtimestamp(mtime),
+            "status": "success",
+            "monday_madness_level": "MAXIMUM! 🚀"
+        }
+    
+    def _split_sections(self, content: str) -> Dict[Tuple[str, int], Tuple[str, List[str], str]]:
+        """
+        ✂️ Cut a page at its headings: (title, occurrence) -> (title, lines, digest)
+        
+        Text before the first heading becomes an "Introduction" section;
+        headings inside fenced code do not start a section.
+        """
+        lines = content.splitlines()
+        headings = self.tokenize(content).headings
+        
+        bounds = [(heading["text"], heading["line"] - 1) for heading in headings]
+        if not bounds or bounds[0][1] > 0:
+            bounds.insert(0, ("Introduction", 0))
+        
+        sections = {}
+        occurrences = {}
+        for position, (title, start) in enumerate(bounds):
+            end = bounds[position + 1][1] if position + 1 < len(bounds) else len(lines)
+            section_lines = lines[start:end]
+            if title == "Introduction" and start == 0 and not any(line.strip() for line in section_lines):
+                continue  # Only blank lines ahead of the first heading
+            
+            # Repeated headings ("Example", "Notes") are told apart by occurrence
+            occurrence = occurrences.get(title.lower(), 0)
+            occurrences[title.lower()] = occurrence + 1
+            
+            digest = content_digest('\n'.join(section_lines).encode('utf-8'))
+            sections[(title.lower(), occurrence)] = (title, section_lines, digest)
+        
+        return sections
+    
+    def _count_line_changes(self, old_lines: List[str], new_lines: List[str]) -> Tuple[int, int]:
+        """
+        ➕➖ Lines added and removed between two versions of one section
+        """
+        # Trim the common head and tail so the diff only sees the edited middle
+        prefix = 0
+        limit = min(len(old_lines), len(new_lines))
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old_lines[len(old_lines) - 1 - suffix] == new_lines[len(new_lines) - 1 - suffix]):
+            suffix += 1
+        
+        old_middle = old_lines[prefix:len(old_lines) - suffix]
+        new_middle = new_lines[prefix:len(new_lines) - suffix]
+        if not old_middle or not new_middle:
+            return len(new_middle), len(old_middle)
+        
+        added = removed = 0
+        matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if tag != 'equal':
+                removed += old_end - old_start
+                added += new_end - new_start
+        return added, removed
+    
+    def _describe_change(self, change: Dict) -> str:
+        """
+        🗞️ Activity feed wording for one section change
+        """
+        if change["change"] == "edited":
+            return f"{change['section']} section edited (+{change['lines_added']}/-{change['lines_removed']} lines)"
+        lines = change["lines_added"] or change["lines_removed"]
+        return f"{change['section']} section {change['change']} ({lines} line{'s' if lines != 1 else ''})"
+    
+    def _cache_key(self, md_file: str) -> str:
+        """
+        🔑 Parse cache key: the page path, plus the read settings when they differ from the defaults
+        """
+        key = str(self.wiki_dir / md_file)
+        if self.body_limit is not None or self.stream_threshold != STREAM_THRESHOLD:
+            # A capped parser must never be handed an uncapped ContentRef, or vice versa
+            key += f"?body_limit={self.body_limit}&stream_threshold={self.stream_threshold}"
+        return key
+    
+    def _is_fresh(self, cached: Optional[Dict], stat: os.stat_result) -> bool:
+        """
+        ⏱️ True when a cache entry matches the file's current mtime and size
+        """
+        return bool(cached) and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size
+    
+    def _read_and_parse(self, md_file: str, known_digest: Optional[str] = None) -> Tuple[Optional[Dict], os.stat_result, str]:
+        """
+        📖 Read and hash a page, parsing it unless the hash equals known_digest
+        
+        Returns:
+            (card or None when the content is unchanged, stat, content digest)
+        """
+        file_path = self.wiki_dir / md_file
+        stat = file_path.stat()
+        if self.stream_threshold is not None and stat.st_size >= self.stream_threshold:
+            return self._stream_and_parse(md_file, file_path, stat, known_digest)
+        
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        digest = content_digest(data)
+        
+        if digest == known_digest:
+            return None, stat, digest
+        
+        body_end = None
+        if self.body_limit is not None and len(data) > self.body_limit:
+            # Cut at the last full line inside the limit
+            body_end = data.rfind(b'\n', 0, self.body_limit) + 1
+        
+        # Only the body is tokenized; the tokenizer copes with \r\n itself and keeps byte offsets exact
+        front_matter, body_start = split_front_matter(data)
+        tokens = MarkdownTokenizer.tokenize(data[body_start:].decode('utf-8'), collect_terms=self.collect_search_docs,
+                                            start_offset=body_start, signature=True)
+        card = self._build_card(md_file, file_path, tokens, stat.st_mtime, body_end, front_matter, body_start)
+        if self.collect_search_docs:
+            # Rides along with the card out of worker processes; _remember moves it aside
+            card["search_doc"] = self._search_doc(stat, data[:body_start], tokens)
+        return card, stat, digest
+    
+    def _stream_and_parse(self, md_file: str, file_path: Path, stat: os.stat_result,
+                          known_digest: Optional[str] = None) -> Tuple[Optional[Dict], os.stat_result, str]:
+        """
+        🌊 Streaming twin of _read_and_parse for very large pages
+        
+        Hashes and tokenizes the page one line at a time from a buffered
+        reader, so memory stays bounded by the longest line rather than the
+        page size. Produces exactly the card the in-memory path would.
+        """
+        if known_digest is not None:
+            # Hash-only pass first: an unchanged page never gets tokenized
+            hasher = content_hasher()
+            with open(file_path, 'rb', buffering=STREAM_BUFFER_SIZE) as f:
+                for block in iter(lambda: f.read(STREAM_BUFFER_SIZE), b''):
+                    hasher.update(block)
+            if hasher.hexdigest() == known_digest:
+                return None, stat, known_digest
+        
+        front_matter, body_start = read_front_matter(file_path)
+        hasher = content_hasher()
+        tokens = MarkdownTokenizer(start_offset=body_start, signature=True)
+        offset = 0
+        body_end = 0  # End of the last full line inside body_limit
+        
+        with open(file_path, 'rb', buffering=STREAM_BUFFER_SIZE) as f:
+            for raw_line in f:
+                hasher.update(raw_line)
+                offset += len(raw_line)
+                if self.body_limit is not None and offset <= self.body_limit:
+                    body_end = offset
+                if offset <= body_start:
+                    continue  # Front matter - hashed, not tokenized
+                
+                # Binary lines end at \n, so a \r\n pair never straddles two of them
+                for piece in raw_line.decode('utf-8').splitlines(keepends=True):
+                    tokens.feed(piece)
+        
+        tokens.close()
+        if self.body_limit is None or offset <= self.body_limit:
+            body_end = None
+        
+        # No search_doc: a term list would grow with the page, so the search index reads it itself
+        card = self._build_card(md_file, file_path, tokens, stat.st_mtime, body_end, front_matter, body_start)
+        return card, stat, hasher.hexdigest()
+    
+    def _search_doc(self, stat: os.stat_result, front_matter: bytes, tokens: MarkdownTokenizer) -> Dict:
+        """
+        🔎 The page's search terms from this parse, for SearchIndex.index_file
+        
+        Terms are packed into one space-separated string (terms never contain
+        spaces): a whole batch of parsed pages then costs about its text size,
+        not one object per word. The stat is the one the terms were read at.
+        """
+        terms = TERM_PATTERN.findall(front_matter.decode('utf-8', errors='replace').lower())
+        terms.extend(tokens.terms)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "terms": ' '.join(terms)}
+    
+    def _remember(self, md_file: str, cached: Optional[Dict], card: Optional[Dict],
+                  stat: os.stat_result, digest: str) -> Dict:
+        """
+        💾 Store a freshly parsed (or re-validated) card in the parse cache
+        """
+        search_doc = card.pop("search_doc", None) if card is not None else None
+        if search_doc is not None:
+            self._search_docs[md_file] = search_doc
+        
+        if card is None:
+            # Same content with a new mtime (fresh clone, touch) - only the timestamp moves
+            card = cached["card"]
+            front_matter = card.get("metadata", {}).get("front_matter", {})
+            card["timestamp"] = front_matter_datetime(front_matter) or datetime.fromtimestamp(stat.st_mtime)
+        
+        if self.cache is not None:
+            self.cache.put(self._cache_key(md_file), stat.st_mtime_ns, stat.st_size, digest, card)
+        
+        return card
+    
+    def _parse_blob(self, md_file: str, blob: str, objects: GitObjectReader,
+                    modified: Optional[datetime]) -> Dict:
+        """
+        🧬 Card for a page stored in a git blob (memoised per page and blob id)
+        
+        Without a date in its front matter the card is stamped with the
+        commit's time.
+        """
+        key = (md_file, blob)
+        card = self._blob_cards.get(key)
+        if card is None:
+            try:
+                data = objects.read_object(blob)[1]
+                front_matter, body_start = split_front_matter(data)
+                tokens = MarkdownTokenizer.tokenize(data[body_start:].decode('utf-8'), start_offset=body_start,
+                                                    signature=True)
+                card = self._build_card(md_file, self.wiki_dir / md_file, tokens, 0, None, front_matter,
+                                        body_start, BlobRef(objects, blob, body_start))
+            except Exception as e:
+                return self._parse_error_card(md_file, e)
+            
+            self._blob_cards[key] = card
+            if len(self._blob_cards) > BLOB_CARD_CACHE_ENTRIES:
+                self._blob_cards.popitem(last=False)
+        else:
+            self._blob_cards.move_to_end(key)
+        
+        # The same blob can appear in many snapshots - only the stamp differs
+        front_matter = card["metadata"]["front_matter"]
+        return {**card, "timestamp": front_matter_datetime(front_matter) or modified or datetime.now()}
+    
+    def _file_not_found_card(self) -> Dict:
+        """
+        🔍 Card returned when a page does not exist
+        """
+        return {
+            "title": "File Not Found",
+            "summary": "Wiki file could not be located",
+            "content": "",
+            "metadata": {"error": "file_not_found"},
+            "status": "error"
+        }
+    
+    def _parse_error_card(self, md_file: str, error: Exception) -> Dict:
+        """
+        ❌ Card returned when a page cannot be parsed
+        """
+        return {
+            "title": "Parse Error",
+            "summary": f"Error parsing {md_file}",
+            "content": "",
+            "metadata": {"error": str(error)},
+            "status": "error"
+        }
+    
+    def _card_type(self, front_matter: Dict) -> Optional[str]:
+        """
+        🏷️ Card type stated in front matter ("Permissions Matrix" -> "permissions_matrix")
+        """
+        card_type = front_matter.get("type")
+        if not isinstance(card_type, str) or not card_type.strip():
+            return None
+        return card_type.strip().lower().replace(' ', '_').replace('-', '_')
+    
+    def _determine_card_type(self, title: str, content: str,
+                             tokens: Optional[MarkdownTokenizer] = None) -> str:
         """
         🎯 Determine the type of card based on content analysis
         """
+        tokens = tokens or self.tokenize(content)
         title_lower = title.lower()
-        content_lower = content.lower()
+        title_keywords = WIKI_KEYWORDS.find(title_lower, "type")
         
-        if "permission" in title_lower and "|" in content:
+        if "permission" in title_keywords and tokens.has_pipe:
             return "permissions_matrix"
-        elif "account" in title_lower and "management" in title_lower:
+        elif "account" in title_keywords and "management" in title_keywords:
             return "account_management"
-        elif "user" in title_lower:
+        elif "user" in title_keywords:
             return "user_system"
         elif title_lower == "home":
             return "welcome"
-        elif "api" in content_lower or "endpoint" in content_lower:
+        elif "api" in tokens.keywords_seen or "endpoint" in tokens.keywords_seen:
             return "api_documentation"
         else:
             return "general_documentation"
+
+
+def _parse_chunk(wiki_directory: str, stream_threshold: Optional[int], body_limit: Optional[int],
+                 collect_search_docs: bool, jobs: List[Tuple[str, Optional[str]]]) -> List[Tuple]:
+    """
+    👷 Worker-process entry point for WikiParser.parse_all
+
+    Each job is (md_file, known_digest). Results are (card, stat, digest);
+    a failed page comes back as (error card, None, None) so one bad file
+    never takes the rest of the chunk down with it.
+    """
+    parser = WikiParser(wiki_directory, cache_dir=None, stream_threshold=stream_threshold, body_limit=body_limit)
+    parser.collect_search_docs = collect_search_docs
+    results = []
     
-    def get_all_wiki_files(self):
-        """
-        📁 Get all markdown files in the wiki directory
-        """
-        if not self.wiki_dir.exists():
-            return []
-        
-        return list(self.wiki_dir.glob("*.md")) 
\ No newline at end of file
+    for md_file, known_digest in jobs:
+        try:
+            results.append(parser._read_and_parse(md_file, known_digest))
+        except Exception as e:
+            results.append((parser._parse_error_card(md_file, e), None, None))
+    
+    return results